@@ -0,0 +1,139 @@
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.control.action_parser import Action, IncrementalActionParser, parse_actions, to_commands
+
+# (thought text, expected typed actions). Doubles as the parser's regression corpus:
+# the script exits non-zero if any entry stops matching.
+CORPUS = [
+    ("ACTION: Walk forward.", [Action("move", "forward")]),
+    ("ACTION: walk forward for 3 seconds", [Action("move", "forward", duration=3.0)]),
+    ("ACTION: Turn left 90 degrees, then jump.", [Action("turn", "left", degrees=90.0), Action("jump")]),
+    ("ACTION: turn right", [Action("turn", "right")]),
+    ("ACTION: Look up 20°.", [Action("look", "up", degrees=20.0)]),
+    ("ACTION: turn around", [Action("turn", "around")]),
+    ("ACTION: Select hotbar slot 3.", [Action("hotbar", slot=3)]),
+    ("ACTION: switch to slot two", [Action("hotbar", slot=2)]),
+    ("ACTION: Open the inventory.", [Action("inventory")]),
+    ("ACTION: crouch for 2 seconds", [Action("crouch", duration=2.0)]),
+    ("ACTION: sprint forward 10 blocks", [Action("sprint", "forward", duration=10 / 4.3)]),
+    ("ACTION: Mine the stone block.", [Action("attack")]),
+    ("ACTION: place the block", [Action("interact")]),
+    ("ACTION: wait 1.5 seconds", [Action("wait", duration=1.5)]),
+    ("ACTION: Stop.", [Action("stop")]),
+    ("ACTION: go back", [Action("move", "back")]),
+    ("ACTION: strafe left", [Action("move", "left")]),
+    # Moving away from a hazard is backwards, never towards it
+    ("ACTION: retreat from the lava", [Action("move", "back")]),
+    ("ACTION: walk away from the edge", [Action("move", "back")]),
+    ("ACTION: run away from the creeper!", [Action("move", "back")]),
+    ("ACTION: turn away from the cliff", [Action("turn", "around")]),
+    # Every sentence of the ACTION line counts
+    ("ACTION: Jump! Then walk forward.", [Action("jump"), Action("move", "forward")]),
+    ("ACTION: Turn left. Walk forward 2 blocks.\nThat should get me to the tree.",
+     [Action("turn", "left"), Action("move", "forward", duration=2 * (1 / 4.3))]),
+    # The action on its own line after the marker
+    ("I see a tree. ACTION:\nWalk forward.", [Action("move", "forward")]),
+    ("**ACTION:**\n- Turn left 90 degrees", [Action("turn", "left", degrees=90.0)]),
+    # Hotbar and equip phrasings
+    ("ACTION: press 5 on the hotbar", [Action("hotbar", slot=5)]),
+    ("ACTION: 4 on the hotbar", [Action("hotbar", slot=4)]),
+    ("ACTION: equip the sword", [Action("hotbar", slot=1)]),
+    ("ACTION: switch to the pickaxe, then mine the stone.", [Action("hotbar", slot=2), Action("attack")]),
+    # "press"/"hold" only select the hotbar with a slot; keys and mouse buttons are actions
+    ("ACTION: hold W for 2 seconds", [Action("move", "forward", duration=2.0)]),
+    ("press W for 3 seconds to move forward", [Action("move", "forward", duration=3.0)]),
+    ("ACTION: hold down space", [Action("jump")]),
+    ("hold left click on the tree for 2 seconds", [Action("attack", duration=2.0)]),
+    ("ACTION: hold right click to eat", [Action("interact")]),
+    ("ACTION: left-click the zombie", [Action("attack")]),
+    ("ACTION: hold the sword", [Action("hotbar", slot=1)]),
+    ("ACTION: press 3", [Action("hotbar", slot=3)]),
+    # Substring traps the old `in` scans fell for
+    ("ACTION: Check the leftover items because they may help.", []),
+    ("ACTION: Hitherto unknown terrain, observe it.", []),
+    ("ACTION: Examine the user interface.", []),
+    # Negation
+    ("ACTION: Don't walk into the lava, jump instead.", [Action("jump")]),
+    ("ACTION: avoid walking forward; turn right 45 degrees.", [Action("turn", "right", degrees=45.0)]),
+    # Idioms
+    ("ACTION: Attack the zombie right now!", [Action("attack")]),
+    # Reasoning before the marker is ignored
+    ("There is a cliff so I should not walk. I could jump or turn left.\nACTION: Turn right.",
+     [Action("turn", "right")]),
+    # No marker: whole text parsed
+    ("I will walk forward and then jump.", [Action("move", "forward"), Action("jump")]),
+    ("Turning left to face the tree.", [Action("turn", "left")]),
+]
+
+def legacy_parse(text):
+    """The previous substring heuristics, kept here for the throughput comparison."""
+    text = text.lower()
+    out = []
+    if "walk" in text or "forward" in text or "approach" in text:
+        out += [("key_down", "w"), ("wait", 2.0), ("key_up", "w")]
+    if "jump" in text:
+        out.append(("press", "space"))
+    if "stop" in text or "wait" in text:
+        out.append(("key_up", "w"))
+    if "left" in text:
+        out.append(("mouse_move", (-200, 0)))
+    if "right" in text:
+        out.append(("mouse_move", (200, 0)))
+    if "break" in text or "attack" in text or "hit" in text:
+        out.append(("attack", None))
+    if "place" in text or "use" in text:
+        out.append(("interact", None))
+    return out
+
+def check_corpus():
+    failures = 0
+    for text, expected in CORPUS:
+        got = parse_actions(text)
+        if got != expected:
+            failures += 1
+            print(f"FAIL: {text!r}\n  expected {expected}\n  got      {got}")
+
+        # Streaming must agree with the one-shot parse
+        inc = IncrementalActionParser()
+        streamed = []
+        for i in range(0, len(text), 4):
+            streamed += inc.feed(text[i:i + 4])
+            if inc.done:
+                break  # SpinalCord.think_streaming stops generation here
+        streamed += inc.finish()
+        if streamed != expected:
+            failures += 1
+            print(f"FAIL (streaming): {text!r}\n  expected {expected}\n  got      {streamed}")
+    print(f"Corpus: {len(CORPUS) - failures}/{len(CORPUS)} passed")
+    return failures
+
+def throughput(fn, texts, seconds=1.0):
+    n = 0
+    chars = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for t in texts:
+            fn(t)
+            chars += len(t)
+        n += len(texts)
+    elapsed = time.perf_counter() - start
+    return n / elapsed, chars / elapsed / 1e6
+
+def main():
+    print("--- Action Parser Benchmark ---")
+    failures = check_corpus()
+
+    # Realistic thoughts are ~100 tokens of reasoning plus an ACTION line
+    texts = [("I see trees and a river. The path ahead is clear of mobs. " * 6) + t for t, _ in CORPUS]
+    for label, fn in [("legacy substring scans", legacy_parse),
+                      ("compiled grammar", lambda t: to_commands(parse_actions(t)))]:
+        per_sec, mb_per_sec = throughput(fn, texts)
+        print(f"{label:<24} {per_sec:10.0f} thoughts/s | {mb_per_sec:6.2f} MB/s")
+
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
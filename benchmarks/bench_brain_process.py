@@ -0,0 +1,67 @@
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from src.brain.backends import StubBackend
+from src.brain.brain_process import BrainProcess
+from src.brain.slow_brain import VisionBrain
+from src.control.fake_input import FakeInput
+from src.control.motor_scheduler import MotorScheduler
+
+FRAME_SHAPE = (360, 640, 3)
+
+def stub():
+    # spin=True: the simulated prefill/decode holds the GIL, like tokenization and preprocessing
+    return StubBackend(latency=0.05, tokens_per_second=200, spin=True)
+
+def motor_timing(brain, seconds=3.0, rate=60.0):
+    """60 Hz motor ticks while `brain` (or nothing) thinks back to back in another thread."""
+    body = FakeInput(smooth_mouse=False)
+    motor = MotorScheduler(body).start()
+    ticks = []
+    stop = threading.Event()
+    thoughts = [0]
+
+    def think():
+        frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+        while not stop.is_set():
+            for _ in brain.think_stream(frame, "Recent Actions: none"):
+                pass
+            thoughts[0] += 1
+
+    thinker = threading.Thread(target=think, daemon=True)
+    if brain is not None:
+        thinker.start()
+    task = motor.every(1.0 / rate, lambda: ticks.append(time.monotonic()))
+    time.sleep(seconds)
+    motor.cancel_event(task)
+    stop.set()
+    if brain is not None:
+        thinker.join()
+    stats = motor.stats()
+    motor.stop()
+    body.stop()
+    intervals = np.diff(ticks) * 1000.0
+    return stats, intervals, thoughts[0] / seconds
+
+def main():
+    print("--- Motor timing while the brain thinks (60 Hz ticks, GIL-holding stub brain) ---")
+    process = BrainProcess(FRAME_SHAPE, backend=stub())
+    runs = {
+        "no brain": None,
+        "in-thread": VisionBrain(backend=stub()),
+        "process": process,
+    }
+    for name, brain in runs.items():
+        stats, intervals, rate = motor_timing(brain)
+        print(f"{name:>9}: jitter p50 {stats['jitter_ms_p50']:6.3f} ms | p95 {stats['jitter_ms_p95']:6.3f} ms | "
+              f"max {stats['jitter_ms_max']:6.2f} ms | tick std {intervals.std():5.2f} ms | {rate:4.1f} thoughts/s")
+    print(f"Brain process: {process.stats()}")
+    process.close()
+
+if __name__ == "__main__":
+    main()
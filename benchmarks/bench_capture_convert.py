@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import cv2
+import numpy as np
+
+from src.vision.capture import ScreenCapture
+
+SOURCES = {"1080p": (1920, 1080), "4K": (3840, 2160)}
+TARGET = (640, 360)
+
+def make_grab(width, height, row_pad=64):
+    """Fake BGRA grab with padded rows, laid out like a Quartz CGImage buffer."""
+    bytes_per_row = width * 4 + row_pad
+    raw = np.random.default_rng(0).integers(0, 255, size=height * bytes_per_row, dtype=np.uint8)
+    bgra = np.ndarray((height, width, 4), dtype=np.uint8, buffer=raw, strides=(bytes_per_row, 4, 1))
+    return raw, bgra
+
+def legacy_convert(bgra, target_size):
+    """The previous chain: copy, slice alpha, resize, make contiguous."""
+    img = np.array(bgra)
+    img_bgr = img[:, :, :3]
+    img_bgr = cv2.resize(img_bgr, target_size, interpolation=cv2.INTER_AREA)
+    return np.ascontiguousarray(img_bgr)
+
+def count_new_blocks(fn, frames):
+    """Live allocation blocks added by `frames` calls of fn (results held)."""
+    keep = [None] * frames  # Hold results so returned arrays count as allocations
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    for i in range(frames):
+        keep[i] = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    new_blocks = sum(max(0, s.count_diff) for s in after.compare_to(before, "filename"))
+    return new_blocks, peak - base
+
+def measure(fn, frames=30):
+    fn()  # Warm up (first call allocates the reusable buffers)
+
+    # Allocations: tracemalloc sees numpy buffers, including arrays returned by cv2.
+    # Subtract the harness' own bookkeeping measured with a no-op.
+    new_blocks, peak = count_new_blocks(fn, frames)
+    noop_blocks, noop_peak = count_new_blocks(lambda: None, frames)
+    new_blocks = max(0, new_blocks - noop_blocks)
+    peak = max(0, peak - noop_peak)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "fps": frames / elapsed,
+        "allocs_per_frame": new_blocks / frames,
+        "peak_mb_per_frame": peak / frames / 1e6,
+    }
+
+def main():
+    print(f"--- Capture Conversion Benchmark (BGRA -> BGR {TARGET[0]}x{TARGET[1]}) ---")
+    cap = ScreenCapture(reuse_buffers=True)
+    out = np.empty((TARGET[1], TARGET[0], 3), dtype=np.uint8)
+
+    for name, (w, h) in SOURCES.items():
+        _, bgra = make_grab(w, h)
+        runs = {
+            "legacy": lambda: legacy_convert(bgra, TARGET),
+            "convert_bgra": lambda: cap.convert_bgra(bgra, TARGET),
+            "convert_bgra(out=)": lambda: cap.convert_bgra(bgra, TARGET, out=out),
+        }
+        for label, fn in runs.items():
+            r = measure(fn)
+            print(f"{name:>5} {label:<20} {r['fps']:8.1f} FPS | "
+                  f"{r['allocs_per_frame']:5.2f} allocs/frame | {r['peak_mb_per_frame']:7.3f} MB peak/frame")
+
+if __name__ == "__main__":
+    main()
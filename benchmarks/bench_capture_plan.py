@@ -0,0 +1,37 @@
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from benchmarks.bench_capture_convert import SOURCES, TARGET, make_grab
+from src.vision.capture import ScreenCapture
+from src.vision.capture_plan import CapturePlan
+
+def ms_per_call(fn, frames=60):
+    fn()  # Warm up (allocates the reusable buffers)
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) / frames * 1000.0
+
+def main():
+    print(f"--- Capture Plan Benchmark (BGRA grab -> {TARGET[0]}x{TARGET[1]} scene + HUD crops) ---")
+    cap = ScreenCapture(reuse_buffers=True)
+    plan = CapturePlan()
+    out = np.empty((TARGET[1], TARGET[0], 3), dtype=np.uint8)
+    regions = {}
+    for name, (w, h) in SOURCES.items():
+        _, bgra = make_grab(w, h)
+        scene = ms_per_call(lambda: cap.convert_bgra(bgra, TARGET, out=out))
+        planned = ms_per_call(lambda: cap.convert_bgra(bgra, TARGET, out=out, plan=plan, regions=regions))
+        # Without a plan, sharp HUD pixels meant converting the whole grab at native size and cropping that
+        full = ms_per_call(lambda: (cap.convert_bgra(bgra, TARGET, out=out), plan.crop(cap.convert_bgra(bgra, None), {})))
+        crop_px = sum(c.shape[0] * c.shape[1] for c in regions.values())
+        print(f"{name:>6}: scene {scene:6.2f} ms | scene + HUD crops {planned:6.2f} ms | "
+              f"scene + native convert + crop {full:6.2f} ms | crops {crop_px / (w * h):.1%} of the frame's pixels")
+        print(f"        {', '.join(f'{k} {v.shape[1]}x{v.shape[0]}' for k, v in regions.items())}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.brain.memory_stream import EpisodicMemory
+
+class LegacyMemory:
+    """The previous list + pop(0) implementation, for comparison."""
+    def __init__(self, max_context=5, capacity=20):
+        self.history = []
+        self.max_context = max_context
+        self.capacity = capacity
+
+    def add_episode(self, action, result=""):
+        self.history.append({"timestamp": datetime.now().strftime("%H:%M:%S"), "action": action, "result": result})
+        if len(self.history) > self.capacity:
+            self.history.pop(0)
+
+    def get_recent_context(self):
+        recent = self.history[-self.max_context:]
+        if not recent:
+            return "No recent history."
+        context_str = "Recent Actions:\n"
+        for item in recent:
+            context_str += f"- [{item['timestamp']}] Action: {item['action']} -> Result: {item['result']}\n"
+        return context_str
+
+def run(memory, actions=50000, reads_per_action=4):
+    """Adds `actions` episodes; reads the context `reads_per_action` times each (think + act paths)."""
+    start = time.perf_counter()
+    for i in range(actions):
+        memory.add_episode(f"Action {i % 7}", "ok")
+        for _ in range(reads_per_action):
+            memory.get_recent_context()
+    return (time.perf_counter() - start) / actions * 1e6
+
+def main():
+    print("--- Episodic Memory Benchmark (us per action incl. context reads) ---")
+    for capacity in (20, 1000, 10000):
+        legacy = run(LegacyMemory(capacity=capacity))
+        ring = run(EpisodicMemory(capacity=capacity))
+        print(f"capacity {capacity:>5}: legacy {legacy:7.2f} us | ring buffer {ring:6.2f} us | {legacy / ring:5.1f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "episodes.jsonl")
+        memory = EpisodicMemory(capacity=1000, log_path=path)
+        logged = run(memory)
+        memory.close()
+        count = sum(1 for _ in EpisodicMemory.read_log(path))
+        print(f"with disk log : {logged:6.2f} us per action ({count} episodes logged)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from src.vision.convert import frame_to_pil
+
+def make_frames(n=32, size=(640, 360), seed=0):
+    """Synthetic BGR frames at the capture resolution handed to the brain."""
+    rng = np.random.default_rng(seed)
+    w, h = size
+    frames = []
+    for _ in range(n):
+        img = np.empty((h, w, 3), dtype=np.uint8)
+        img[: h // 2] = [235, 206, 135]  # Sky
+        img[h // 2:] = [34, 139, 34]     # Ground
+        # Noise so PNG can't trivially compress the frame
+        img += rng.integers(0, 16, size=img.shape, dtype=np.uint8)
+        frames.append(img)
+    return frames
+
+def via_file(frame, path):
+    """Old path: cv2.imwrite to disk, then decode again like mlx_vlm.utils.load_image."""
+    cv2.imwrite(path, frame)
+    img = Image.open(path).convert("RGB")
+    img.load()
+    return img
+
+def via_memory(frame):
+    """New path: convert the captured array directly."""
+    return frame_to_pil(frame)
+
+def bench(fn, frames, repeats=5):
+    times = []
+    for _ in range(repeats):
+        for frame in frames:
+            start = time.perf_counter()
+            fn(frame)
+            times.append(time.perf_counter() - start)
+    times = np.array(times) * 1000.0
+    return float(np.median(times)), float(np.percentile(times, 95))
+
+def main():
+    frames = make_frames()
+    print(f"--- Frame Handoff Benchmark ({frames[0].shape[1]}x{frames[0].shape[0]}, {len(frames)} frames) ---")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "vision_temp.png")
+        file_med, file_p95 = bench(lambda f: via_file(f, path), frames)
+
+    mem_med, mem_p95 = bench(via_memory, frames)
+
+    print(f"File (imwrite + load): median {file_med:7.3f} ms | p95 {file_p95:7.3f} ms")
+    print(f"In-memory (cvtColor):  median {mem_med:7.3f} ms | p95 {mem_p95:7.3f} ms")
+    print(f"Speedup: {file_med / max(mem_med, 1e-9):.1f}x")
+
+if __name__ == "__main__":
+    main()
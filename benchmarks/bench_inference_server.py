@@ -0,0 +1,51 @@
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from src.brain.backends import StubBackend
+from src.brain.inference_server import InferenceServer
+from src.brain.slow_brain import VisionBrain
+
+def run_agents(server, agents=8, thoughts_per_agent=5):
+    """Each agent thread submits thoughts back to back, like N SpinalCords."""
+    frame = np.zeros((360, 640, 3), dtype=np.uint8)
+    client_times = []
+    lock = threading.Lock()
+
+    def agent(idx):
+        client = server.client()
+        for t in range(thoughts_per_agent):
+            start = time.monotonic()
+            client.see_and_think(frame, f"Agent {idx} thought {t}")
+            with lock:
+                client_times.append(time.monotonic() - start)
+
+    threads = [threading.Thread(target=agent, args=(i,)) for i in range(agents)]
+    start = time.monotonic()
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    elapsed = time.monotonic() - start
+    return agents * thoughts_per_agent / elapsed, client_times
+
+def main():
+    agents = 8
+    print(f"--- Inference Server Benchmark ({agents} agents, stub backend: 0.2s prefill, 200 tok/s) ---")
+    for max_batch in (1, 4, 8):
+        brain = VisionBrain(backend=StubBackend(latency=0.2, tokens_per_second=200))
+        server = InferenceServer(brain, max_batch=max_batch, max_wait=0.02).start()
+        rate, times = run_agents(server, agents=agents)
+        server.stop()
+        s = server.stats()
+        print(f"max_batch={max_batch}: {rate:5.2f} thoughts/s | avg batch {s['avg_batch']:.1f} | "
+              f"queue p50 {s['queue_ms_p50']:6.0f} ms p95 {s['queue_ms_p95']:6.0f} ms | "
+              f"inference p50 {s['inference_ms_p50']:5.0f} ms | "
+              f"end-to-end p95 {np.percentile(times, 95) * 1000:6.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.brain.long_term_memory import LongTermMemory, keywords
+
+WORDS = ("tree lava wall cave zombie water sand stone iron coal pig sheep creeper night bed door "
+         "hill river village chest furnace torch skeleton spider cliff grass").split()
+VERBS = ["walk", "turn", "attack", "jump", "mine", "place"]
+
+def fill(memory, episodes, rng):
+    for _ in range(episodes):
+        memory.add(f"{rng.choice(VERBS)} {rng.choice(WORDS)}", " ".join(rng.sample(WORDS, 4)), rng.getrandbits(64))
+
+def linear_query(memory, text, dhash, k=3):
+    """Scores every stored episode: what an unindexed history would cost."""
+    terms = set(keywords(text))
+    scored = []
+    for entry in memory.entries.values():
+        score = len(terms.intersection(entry.terms))
+        if entry.dhash is not None and (entry.dhash ^ dhash).bit_count() <= memory.max_hamming:
+            score += memory.frame_weight
+        scored.append((score, entry.id))
+    return sorted(scored, reverse=True)[:k]
+
+def main(queries=500):
+    print("--- Long-Term Memory Benchmark (top-3 query latency) ---")
+    for episodes in (1000, 10000, 50000):
+        rng = random.Random(0)
+        memory = LongTermMemory(capacity=episodes)
+        fill(memory, episodes, rng)
+        probes = [(f"a {rng.choice(WORDS)} near the {rng.choice(WORDS)}", rng.getrandbits(64)) for _ in range(queries)]
+
+        start = time.perf_counter()
+        for text, dhash in probes:
+            memory.query(text, dhash, k=3)
+        indexed = (time.perf_counter() - start) / queries * 1000
+
+        start = time.perf_counter()
+        for text, dhash in probes[:50]:
+            linear_query(memory, text, dhash)
+        linear = (time.perf_counter() - start) / 50 * 1000
+
+        print(f"{episodes:>6} episodes: indexed {indexed:6.3f} ms | linear scan {linear:7.2f} ms | "
+              f"avg candidates {memory.stats()['avg_candidates']:.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import cv2
+import numpy as np
+
+from src.vision.motion import MotionEstimator
+
+W, H = 640, 360
+FRAMES = 30  # One second of capture per scripted action
+
+def world(seed=0):
+    """Blocky textured landscape, wider and taller than the view so it can pan."""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(40, 220, size=(H * 2 // 16, W * 3 // 16, 3), dtype=np.uint8)
+    return cv2.resize(blocks, (W * 3, H * 2), interpolation=cv2.INTER_NEAREST)
+
+def view(img, x, y, zoom=1.0, noise=None):
+    """W x H window at (x, y), magnified `zoom` times about its centre (walking forward)."""
+    w, h = int(W / zoom), int(H / zoom)
+    cx, cy = x + W // 2, y + H // 2
+    crop = img[cy - h // 2:cy - h // 2 + h, cx - w // 2:cx - w // 2 + w]
+    frame = cv2.resize(crop, (W, H), interpolation=cv2.INTER_LINEAR)
+    if noise is not None:
+        cv2.add(frame, noise.integers(0, 6, size=frame.shape, dtype=np.uint8), dst=frame)
+    return frame
+
+def scenarios():
+    """name -> (intent, per-frame view params, expected outcome prefix)."""
+    x0, y0 = W, H // 2
+    return {
+        "turn right": (("turn",), [(x0 + 10 * i, y0, 1.0) for i in range(FRAMES)], "turned right"),
+        "turn left": (("turn",), [(x0 - 10 * i, y0, 1.0) for i in range(FRAMES)], "turned left"),
+        "look down": (("turn",), [(x0, y0 + 4 * i, 1.0) for i in range(FRAMES)], "looked down"),
+        "turn blocked": (("turn",), [(x0, y0, 1.0)] * FRAMES, "turn had no effect"),
+        "walk": (("move",), [(x0, y0, 1.0 + 0.02 * i) for i in range(FRAMES)], "moved"),
+        "walk into wall": (("move",), [(x0, y0, 1.0)] * FRAMES, "stuck"),
+        "idle": ((), [(x0, y0, 1.0)] * FRAMES, "no change"),
+    }
+
+def classification():
+    print(f"--- Outcomes of scripted 1 s actions ({W}x{H}, pixel noise on every frame) ---")
+    img = world()
+    noise = np.random.default_rng(1)
+    wrong = 0
+    for name, (intent, path, expected) in scenarios().items():
+        estimator = MotionEstimator()
+        t = 0.0
+        for x, y, zoom in path:
+            estimator.update(view(img, x, y, zoom, noise), t=t)
+            t += 1.0 / FRAMES
+        summary = estimator.summary(0.0)
+        outcome = estimator.outcome(0.0, intent=intent)
+        ok = outcome.startswith(expected)
+        wrong += not ok
+        print(f"{name:>15}: pan {summary['pan_x']:+.2f} x {summary['pan_y']:+.2f} views | "
+              f"change {summary['change']:5.2f} -> {outcome!r}{'' if ok else f'  (expected {expected!r})'}")
+    print(f"Misclassified: {wrong}")
+
+def timing(repeats=500):
+    img = world()
+    frames = [view(img, W + 10 * i, H // 2) for i in range(8)]
+    estimator = MotionEstimator()
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        estimator.update(frames[i % len(frames)])
+        times.append((time.perf_counter() - start) * 1000.0)
+    start = time.perf_counter()
+    for _ in range(100):
+        estimator.outcome(0.0, intent=("move",))
+    outcome_ms = (time.perf_counter() - start) / 100 * 1000.0
+    print(f"\nupdate(): p50 {np.percentile(times, 50):.3f} ms | p95 {np.percentile(times, 95):.3f} ms per frame "
+          f"| outcome() over {len(estimator.samples)} samples: {outcome_ms:.3f} ms")
+
+def main():
+    classification()
+    timing()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import os
+import queue
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from src.control.action_parser import parse_actions, to_commands
+from src.control.motor_scheduler import MotorScheduler
+
+PLAN = "ACTION: Walk forward for 0.5 seconds, then turn left 45 degrees, then jump."
+
+class RecordingBody:
+    """InputManager stand-in that timestamps every call (no real input)."""
+    def __init__(self):
+        self.events = []
+
+    def _record(self, *event):
+        self.events.append((time.monotonic(),) + event)
+
+    def key_down(self, key):
+        self._record("key_down", key)
+
+    def key_up(self, key):
+        self._record("key_up", key)
+
+    def press_key(self, key, duration=0.1):
+        self.key_down(key)
+        time.sleep(duration)
+        self.key_up(key)
+
+    def move_mouse(self, dx, dy):
+        self._record("mouse_move", dx, dy)
+
+    def turn(self, yaw, pitch=0.0):
+        self._record("turn", yaw, pitch)
+
+    def attack(self):
+        self._record("attack")
+
+    def interact(self):
+        self._record("interact")
+
+    def is_active(self):
+        return True
+
+def legacy_act_loop(body, commands):
+    """The previous polling act loop, including its sleep-then-chunked-sleep wait."""
+    actions = queue.Queue()
+    for cmd in commands:
+        actions.put(cmd)
+    while True:
+        try:
+            cmd, val = actions.get(timeout=0.1)
+        except queue.Empty:
+            return
+        if cmd == "key_down":
+            body.key_down(val)
+        elif cmd == "key_up":
+            body.key_up(val)
+        elif cmd == "press":
+            body.press_key(val, duration=0.1)
+        elif cmd == "wait":
+            time.sleep(val)
+            elapsed = 0
+            while elapsed < val:
+                time.sleep(0.1)
+                elapsed += 0.1
+        elif cmd == "mouse_move":
+            body.move_mouse(val[0], val[1])
+        elif cmd == "turn":
+            body.turn(val[0], val[1])
+
+def run_scheduler(body, commands):
+    motor = MotorScheduler(body).start()
+    motor.submit(commands)
+    while motor.busy():
+        time.sleep(0.01)
+    motor.stop()
+    return motor
+
+def plan_seconds(body, start):
+    return body.events[-1][0] - start
+
+def pacing(rate=60.0, seconds=2.0):
+    """Tick interval error of a sleep-paced loop vs MotorScheduler.every."""
+    interval = 1.0 / rate
+    ticks = []
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        start = time.monotonic()
+        ticks.append(start)
+        time.sleep(max(0, interval - (time.monotonic() - start)))
+    legacy = np.diff(ticks)
+
+    ticks = []
+    motor = MotorScheduler(RecordingBody()).start()
+    motor.every(interval, lambda: ticks.append(time.monotonic()))
+    time.sleep(seconds)
+    motor.stop()
+    return legacy, np.diff(ticks), motor.stats()
+
+def main():
+    commands = to_commands(parse_actions(PLAN))
+    print(f"--- Motor Scheduler Benchmark ---\nPlan: {commands}")
+
+    body = RecordingBody()
+    start = time.monotonic()
+    legacy_act_loop(body, commands)
+    print(f"Legacy act loop : plan took {plan_seconds(body, start):.3f}s")
+
+    body = RecordingBody()
+    start = time.monotonic()
+    motor = run_scheduler(body, commands)
+    stats = motor.stats()
+    print(f"MotorScheduler  : plan took {plan_seconds(body, start):.3f}s | "
+          f"jitter p50 {stats['jitter_ms_p50']:.3f} ms p95 {stats['jitter_ms_p95']:.3f} ms")
+
+    legacy, scheduled, stats = pacing()
+    print(f"60 Hz pacing: sleep loop {len(legacy) + 1} ticks, mean {legacy.mean() * 1000:.3f} ms, "
+          f"std {legacy.std() * 1000:.3f} ms | scheduler {len(scheduled) + 1} ticks, "
+          f"mean {scheduled.mean() * 1000:.3f} ms, std {scheduled.std() * 1000:.3f} ms, overruns {stats['overruns']}")
+
+if __name__ == "__main__":
+    main()
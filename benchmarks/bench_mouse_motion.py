@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.control.mouse_motion import MouseMotion
+
+class CountingMouse:
+    """Stands in for pynput's mouse: counts raw move events and their sizes."""
+    def __init__(self):
+        self.events = []
+
+    def move(self, dx, dy):
+        self.events.append((dx, dy))
+
+def burst(move, moves=200, dx=7, dy=-3):
+    """A burst of small back-to-back moves (e.g. a tracking reflex), then one large turn."""
+    for _ in range(moves):
+        move(dx, dy)
+    move(800, 0)
+
+def summarize(name, events, seconds):
+    total = (sum(e[0] for e in events), sum(e[1] for e in events))
+    largest = max((max(abs(x), abs(y)) for x, y in events), default=0)
+    print(f"{name:<18}: {len(events):4d} OS events | total {total} | largest step {largest:4d} px | {seconds * 1000:6.1f} ms")
+
+def main():
+    print("--- Mouse Motion Benchmark (200 small moves + one 800 px turn) ---")
+    mouse = CountingMouse()
+    start = time.monotonic()
+    burst(mouse.move)
+    summarize("direct mouse.move", mouse.events, time.monotonic() - start)
+
+    for easing in ("linear", "ease_in_out"):
+        mouse = CountingMouse()
+        motion = MouseMotion(mouse.move, rate=120.0, easing=easing).start()
+        start = time.monotonic()
+        burst(motion.add)
+        while not motion.idle():
+            time.sleep(0.005)
+        elapsed = time.monotonic() - start
+        motion.stop()
+        summarize(f"MouseMotion {easing}", mouse.events, elapsed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.headless import run_headless
+
+SECONDS = 10.0
+
+def run(latency, speculate, max_plan_age=5.0, pace_target="balanced", preempt_after=1.0):
+    """Pipeline stats and body idle time for one headless run."""
+    cord, body_idle = run_headless(SECONDS, latency, speculate=speculate, max_plan_age=max_plan_age,
+                                   pace_target=pace_target, preempt_after=preempt_after)
+    report = cord.pipeline_stats()
+    report["body_idle"] = body_idle
+    return report
+
+def main():
+    print(f"--- Plan pipeline: {SECONDS:.0f} s headless runs, stub brain (no thought cache) ---")
+    for latency in (0.3, 1.0):
+        print(f"\nInference latency {latency:.1f} s:")
+        for name, kwargs in (("replace on thought", dict(speculate=False)),
+                             ("speculative, no preempt", dict(speculate=True, preempt_after=None)),
+                             ("speculative", dict(speculate=True)),
+                             ("speculative, latency", dict(speculate=True, pace_target="latency")),
+                             ("speculative, age<=1.2s", dict(speculate=True, max_plan_age=1.2))):
+            r = run(latency, **kwargs)
+            print(f"{name:>24}: brain busy {r['brain_utilisation']:4.0%} | body idle {r['body_idle']:4.0%} | "
+                  f"plans {r['plans']:3d}, dropped {r['drop_rate']:4.0%} "
+                  f"({r['dropped_stale']} stale, {r['dropped_superseded']} superseded), {r['preempted']} preempted | "
+                  f"frame age at plan start p50 {r['plan_age_ms_p50']:.0f} ms")
+
+if __name__ == "__main__":
+    main()
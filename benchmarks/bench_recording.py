@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from src.utils.recording import Recorder, Recording
+from src.vision.capture_plan import CapturePlan
+from src.vision.frame_ring import CaptureThread
+from src.vision.sources import CaptureSource, RecordingSource, SyntheticSource
+
+def record(path, frames, compress, fps):
+    """Feeds frames at `fps` like the capture thread would. Returns the Recorder (closed)."""
+    recorder = Recorder(path, frames[0].shape, compress=compress)
+    interval = 1.0 / fps
+    next_t = time.monotonic()
+    for i, frame in enumerate(frames):
+        recorder.add_frame(frame, next_t, i)
+        next_t += interval
+        delay = next_t - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    recorder.close()
+    return recorder
+
+def replay_fps(path):
+    """Frames per second RecordingSource serves in sweep mode (speed=0), incl. the copy into a slot."""
+    source = RecordingSource(path, speed=0)
+    source.open()
+    out = np.empty(source.frame_shape, dtype=np.uint8)
+    n = 0
+    start = time.perf_counter()
+    while source.grab(out):
+        n += 1
+    elapsed = time.perf_counter() - start
+    source.close()
+    return n / elapsed
+
+def view_fps(path):
+    """Frames per second of Recording.iter_frames (views only, no copy)."""
+    recording = Recording(path)
+    start = time.perf_counter()
+    n = sum(1 for _ in recording.iter_frames())
+    elapsed = time.perf_counter() - start
+    recording.close()
+    return n / elapsed
+
+class WindowSource(CaptureSource):
+    """A 1920x1080 'window' with 4 of 10 hearts drawn where GUI scale 4 puts them, stored at 640x360."""
+    def __init__(self, plan):
+        super().__init__((640, 360), plan)
+        self.window = np.full((1080, 1920, 3), 90, dtype=np.uint8)
+        x, y, _, _ = plan.rects(1920, 1080)["health"]
+        for i in range(4):
+            self.window[y + 4:y + 32, x + i * 32 + 4:x + i * 32 + 28] = (40, 30, 220)
+
+    def grab(self, out, regions=None):
+        return self._store(self.window, out, regions)
+
+def health_share(bar):
+    """Share of the health crop's columns holding red heart pixels (what LowHealthDetector reads)."""
+    b, g, r = bar[..., 0].astype(np.int16), bar[..., 1].astype(np.int16), bar[..., 2].astype(np.int16)
+    return float(((r > 150) & (g < 80) & (b < 80)).any(axis=0).mean()) if bar.size else 0.0
+
+def hud_crops(tmp):
+    """HUD crops replayed from a 1080p session stored at 640x360 match the live ones."""
+    path = os.path.join(tmp, "hud")
+    source = WindowSource(CapturePlan())
+    recorder = Recorder(path, source.frame_shape)
+    eyes = CaptureThread(source, fps=60, recorder=recorder).start()
+    eyes.wait_for_frame(0, timeout=2.0)
+    live = health_share(eyes.latest_regions()[2]["health"])
+    eyes.stop()
+    recorder.close()
+
+    replay = RecordingSource(path, speed=0, plan=CapturePlan())
+    replay.open()
+    out, regions = np.empty(replay.frame_shape, dtype=np.uint8), {}
+    replay.grab(out, regions)
+    replayed = health_share(regions["health"])
+    print(f"\nHUD crops: native {replay.native_size}, health bar {live:.0%} full live | "
+          f"{replayed:.0%} replayed from {replay.frame_shape[1]}x{replay.frame_shape[0]}")
+
+def main(n=300, fps=30):
+    print(f"--- Recording Benchmark ({n} synthetic 640x360 frames at {fps} fps) ---")
+    source = SyntheticSource()
+    source.open()
+    frames = []
+    for _ in range(n):
+        frame = np.empty(source.frame_shape, dtype=np.uint8)
+        source.grab(frame)
+        frames.append(frame)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for compress in (False, True):
+            name = "xor-zlib" if compress else "raw"
+            path = os.path.join(tmp, name)
+            stats = record(path, frames, compress, fps).stats()
+            print(f"{name:>8}: {stats['mb_written']:7.2f} MB (ratio {stats['ratio']:6.1f}x, dropped {stats['dropped']}) | "
+                  f"replay {replay_fps(path):7.0f} fps | views {view_fps(path):8.0f} fps")
+        hud_crops(tmp)
+
+if __name__ == "__main__":
+    main()
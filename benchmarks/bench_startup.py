@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+MODULES = [
+    "src.vision.capture",
+    "src.vision.sources",
+    "src.vision.scene_cache",
+    "src.brain.slow_brain",
+    "src.control.action_parser",
+    "src.control.spinal_cord",
+]
+HEAVY = ("mlx", "mlx_vlm", "cv2", "Quartz", "AppKit", "pynput", "torch", "transformers")
+
+def import_time(module):
+    """Imports `module` in a fresh interpreter. Returns (seconds, heavy modules loaded, error)."""
+    code = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "dt = time.perf_counter() - t\n"
+        f"heavy = [m for m in {HEAVY!r} if m in sys.modules and "
+        "not type(sys.modules[m]).__name__.startswith('_Lazy')]\n"
+        "print(dt, ','.join(heavy))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None, "", proc.stderr.strip().splitlines()[-1]
+    seconds, _, heavy = proc.stdout.strip().splitlines()[-1].partition(" ")
+    return float(seconds), heavy, None
+
+def time_to_first_action(backend="mlx", timeout=600):
+    """Boots a full SpinalCord on synthetic frames and waits for the first queued action."""
+    from src.control.spinal_cord import SpinalCord
+    from src.vision.sources import SyntheticSource
+
+    cord = SpinalCord(capture_source=SyntheticSource(), backend=backend)
+    cord.eyes.start()
+    threading.Thread(target=cord.think_loop, daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    while "first_action" not in cord.milestones and time.monotonic() < deadline:
+        time.sleep(0.05)
+    cord.running = False
+    cord.eyes.stop()
+    return cord.startup_report()
+
+def main():
+    print("--- Startup Benchmark ---")
+    print("Import time (fresh interpreter):")
+    for module in MODULES:
+        seconds, heavy, error = import_time(module)
+        if error:
+            print(f"  {module:<28} FAILED: {error}")
+        else:
+            print(f"  {module:<28} {seconds * 1000:8.1f} ms | eager heavy modules: {heavy or '-'}")
+
+    if "--run" in sys.argv:
+        backend = "stub" if "--stub" in sys.argv else "mlx"
+        print(f"\nTime to first action ({backend} backend, needs input access):")
+        time_to_first_action(backend)
+    else:
+        print("\n(pass --run [--stub] to also measure time-to-first-action)")
+
+if __name__ == "__main__":
+    main()
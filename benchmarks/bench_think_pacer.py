@@ -0,0 +1,33 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.headless import run_headless
+
+SECONDS = 8.0
+
+def run(latency, think_interval=None, pace_target="balanced"):
+    """Pacer stats and body idle time for one headless run."""
+    cord, body_idle = run_headless(SECONDS, latency, think_interval=think_interval, pace_target=pace_target)
+    stats = cord.pacer.stats()
+    return {
+        "thoughts_per_min": cord.thoughts / SECONDS * 60.0,
+        "body_idle": body_idle,
+        "duty": stats["duty"],
+        "interval_s": stats["interval_s_p50"],
+        "decisions": stats["decisions"],
+    }
+
+def main():
+    print(f"--- Think pacing: {SECONDS:.0f} s headless runs, stub brain (no thought cache) ---")
+    for latency in (0.3, 1.5):
+        print(f"\nInference latency {latency:.1f} s:")
+        configs = [("fixed 1.0 s", dict(think_interval=1.0))]
+        configs += [(f"adaptive {t}", dict(pace_target=t)) for t in ("latency", "balanced", "power")]
+        for name, kwargs in configs:
+            r = run(latency, **kwargs)
+            print(f"{name:>18}: {r['thoughts_per_min']:5.1f} thoughts/min | body idle {r['body_idle']:4.0%} | "
+                  f"brain duty {r['duty']:4.0%} | interval p50 {r['interval_s']:.2f} s | {r['decisions']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import contextlib
+import io
+import threading
+import time
+
+from src.brain.backends import StubBackend
+from src.control.fake_input import FakeInput
+from src.control.spinal_cord import SpinalCord
+from src.vision.sources import SyntheticSource
+
+def run_headless(seconds, latency, **cord_kwargs):
+    """
+    Runs a quiet SpinalCord on synthetic frames and a stub brain, sampling every 10 ms
+    whether the body had nothing queued.
+
+    Args:
+        seconds: How long to run after the brain is ready.
+        latency: Stub inference latency in seconds.
+        **cord_kwargs: Passed to SpinalCord (think_interval, pace_target, speculate, ...).
+
+    Returns:
+        (cord, body_idle): the stopped SpinalCord and the fraction of samples the body was idle.
+    """
+    body = FakeInput(smooth_mouse=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cord = SpinalCord(capture_source=SyntheticSource(), backend=StubBackend(latency=latency, tokens_per_second=0),
+                          input_manager=body, warm_up=False, reflexes=False, motion=False, **cord_kwargs)
+        cord.motor.verbose = False
+        cord.thought_cache.max_change = -1.0  # Never reuse thoughts: every cycle pays the latency
+        runner = threading.Thread(target=cord.start, daemon=True)
+        runner.start()
+        cord.brain_ready.result(timeout=30)
+        idle = samples = 0
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            idle += not cord.motor.busy()
+            samples += 1
+            time.sleep(0.01)
+        body.stop()
+        runner.join(timeout=10)
+        cord.think_thread.join(timeout=10)
+    return cord, idle / samples
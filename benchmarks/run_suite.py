@@ -0,0 +1,260 @@
+"""
+Headless benchmark suite for the hot paths: synthetic frames, the stub model and
+FakeInput, so it runs on a Linux box without a display, Minecraft or the VLM.
+
+    python benchmarks/run_suite.py                       # print results as JSON
+    python benchmarks/run_suite.py --out base.json       # also save them
+    python benchmarks/run_suite.py --compare base.json   # ratio vs a saved run
+    python benchmarks/run_suite.py --only parse,memory   # subset
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import sys
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from benchmarks.bench_action_parser import CORPUS
+
+def timed(fn, min_seconds=0.5, min_runs=5):
+    """Runs fn repeatedly for at least `min_seconds`. Returns per-call seconds (numpy array)."""
+    times = []
+    end = time.perf_counter() + min_seconds
+    while len(times) < min_runs or time.perf_counter() < end:
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return np.array(times)
+
+def summary_ms(times):
+    ms = times * 1000.0
+    return {"p50_ms": float(np.percentile(ms, 50)), "p95_ms": float(np.percentile(ms, 95)),
+            "per_s": float(len(times) / times.sum())}
+
+def bench_capture_convert():
+    """BGRA grab (strided, like Quartz rows) -> BGR 640x360 into a preallocated slot (+ HUD crops)."""
+    from src.vision.capture import ScreenCapture
+    from src.vision.capture_plan import CapturePlan
+
+    cap = ScreenCapture(reuse_buffers=True)
+    out = np.empty((360, 640, 3), dtype=np.uint8)
+    plan, regions = CapturePlan(), {}
+    results = {}
+    for name, (w, h) in {"1080p": (1920, 1080), "1440p": (2560, 1440)}.items():
+        padded = np.random.default_rng(0).integers(0, 255, (h, w * 4 + 64), dtype=np.uint8)
+        bgra = padded[:, :w * 4].reshape(h, w, 4)
+        results[name] = summary_ms(timed(lambda: cap.convert_bgra(bgra, (640, 360), out=out)))
+        results[name + "_hud"] = summary_ms(timed(
+            lambda: cap.convert_bgra(bgra, (640, 360), out=out, plan=plan, regions=regions)))
+    return results
+
+def bench_resize():
+    """Cost of the INTER_AREA downscale alone, 1080p -> 640x360, BGR."""
+    import cv2
+
+    frame = np.random.default_rng(0).integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+    dst = np.empty((360, 640, 3), dtype=np.uint8)
+    return {
+        "inter_area": summary_ms(timed(lambda: cv2.resize(frame, (640, 360), dst=dst, interpolation=cv2.INTER_AREA))),
+        "inter_linear": summary_ms(timed(lambda: cv2.resize(frame, (640, 360), dst=dst, interpolation=cv2.INTER_LINEAR))),
+    }
+
+def bench_parse():
+    """parse_actions + to_commands over the parser corpus (the work of parse_thought_to_actions)."""
+    from src.control.action_parser import IncrementalActionParser, parse_actions, to_commands
+
+    texts = [text for text, _ in CORPUS]
+
+    def parse_all():
+        for text in texts:
+            to_commands(parse_actions(text))
+
+    def stream_all():
+        for text in texts:
+            parser = IncrementalActionParser()
+            for i in range(0, len(text), 4):  # ~token-sized chunks
+                parser.feed(text[i:i + 4])
+            parser.finish()
+
+    batch = timed(parse_all)
+    streamed = timed(stream_all)
+    return {
+        "thoughts_per_s": float(len(texts) * len(batch) / batch.sum()),
+        "streamed_thoughts_per_s": float(len(texts) * len(streamed) / streamed.sum()),
+    }
+
+def bench_memory():
+    """EpisodicMemory insert and prompt render; LongTermMemory recall at 10k episodes."""
+    from src.brain.long_term_memory import LongTermMemory
+    from src.brain.memory_stream import EpisodicMemory
+
+    memory = EpisodicMemory(capacity=1000)
+    n = 20000
+    t = time.perf_counter()
+    for i in range(n):
+        memory.add_episode(f"Action {i % 7}", "ok")
+    insert_us = (time.perf_counter() - t) / n * 1e6
+
+    t = time.perf_counter()
+    for i in range(n):
+        memory.add_episode("Walk forward", "clear")
+        memory.get_recent_context()
+    insert_render_us = (time.perf_counter() - t) / n * 1e6
+
+    t = time.perf_counter()
+    for _ in range(n):
+        memory.get_recent_context()
+    cached_render_us = (time.perf_counter() - t) / n * 1e6
+
+    rng = np.random.default_rng(0)
+    words = "tree lava wall cave zombie water sand stone iron coal pig sheep creeper night bed door".split()
+    long_term = LongTermMemory(capacity=10000)
+    for i in range(10000):
+        long_term.add(f"walk {words[i % len(words)]}", " ".join(rng.choice(words, 3)), int(rng.integers(0, 2**63)))
+    recall = timed(lambda: long_term.query("a zombie near the lava", int(rng.integers(0, 2**63)), k=3))
+    return {
+        "insert_us": insert_us,
+        "insert_and_render_us": insert_render_us,
+        "cached_render_us": cached_render_us,
+        "long_term_recall_ms_p50": summary_ms(recall)["p50_ms"],
+    }
+
+def bench_act_timing():
+    """MotorScheduler deadline accuracy for a walk/turn/jump plan, and 60 Hz tick pacing."""
+    from src.control.fake_input import FakeInput
+    from src.control.motor_scheduler import MotorScheduler
+
+    body = FakeInput(smooth_mouse=False)
+    motor = MotorScheduler(body).start()
+    plan = [("key_down", "w"), ("wait", 0.25), ("key_up", "w"), ("turn", (-45.0, 0.0)), ("press", "space")]
+    start = time.monotonic()
+    for _ in range(4):
+        motor.submit(plan)
+    while motor.busy():
+        time.sleep(0.005)
+    plan_seconds = (body.events[-1][0] - start) / 4
+
+    ticks = []
+    task = motor.every(1 / 60, lambda: ticks.append(time.monotonic()))
+    time.sleep(1.0)
+    motor.cancel_event(task)
+    stats = motor.stats()
+    motor.stop()
+    body.stop()
+    intervals = np.diff(ticks) * 1000.0
+    return {
+        "plan_seconds": plan_seconds,  # Ideal: 0.35 (0.25 wait + 0.1 press)
+        "jitter_ms_p50": stats["jitter_ms_p50"],
+        "jitter_ms_p95": stats["jitter_ms_p95"],
+        "tick_interval_ms_mean": float(intervals.mean()),
+        "tick_interval_ms_std": float(intervals.std()),
+        "overruns": stats["overruns"],
+    }
+
+def bench_closed_loop(seconds=5.0):
+    """Full SpinalCord: synthetic capture -> stub brain -> parser -> scheduler -> FakeInput."""
+    from src.brain.backends import StubBackend
+    from src.control.fake_input import FakeInput
+    from src.control.spinal_cord import SpinalCord
+    from src.vision.sources import SyntheticSource
+
+    body = FakeInput()
+    backend = StubBackend(latency=0.02, tokens_per_second=0)
+    cord = SpinalCord(capture_source=SyntheticSource(), backend=backend, input_manager=body,
+                      think_interval=0.0, warm_up=False)
+    cord.thought_cache.max_change = -1.0  # Never reuse thoughts: measure the real cycle
+    runner = threading.Thread(target=cord.start, daemon=True)
+    runner.start()
+    cord.brain_ready.result(timeout=30)
+    first = cord.thoughts
+    start = time.monotonic()
+    time.sleep(seconds)
+    cycles = cord.thoughts - first
+    elapsed = time.monotonic() - start
+    body.stop()
+    runner.join(timeout=10)
+    cord.think_thread.join(timeout=10)  # Its last thought still prints
+    return {
+        "cycles_per_s": cycles / elapsed,
+        "input_events": body.count(),
+        "capture_fps": cord.eyes.stats()["fps"],
+    }
+
+BENCHMARKS = {
+    "capture_convert": bench_capture_convert,
+    "resize": bench_resize,
+    "parse": bench_parse,
+    "memory": bench_memory,
+    "act_timing": bench_act_timing,
+    "closed_loop": bench_closed_loop,
+}
+
+def flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+def compare(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = flatten(json.load(f)["results"])
+    print(f"\n--- vs {baseline_path} (ratio = current / baseline) ---", file=sys.stderr)
+    for name, value in flatten(current).items():
+        old = baseline.get(name)
+        if old:
+            print(f"{name:<45} {old:12.4f} -> {value:12.4f}  x{value / old:6.2f}", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help="Comma-separated subset of: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--out", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        try:
+            # Components log with print(); keep stdout clean for the JSON report
+            with contextlib.redirect_stdout(sys.stderr):
+                results[name] = BENCHMARKS[name]()
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+
+    try:
+        import cv2
+        cv2_version = cv2.__version__
+    except ImportError:
+        cv2_version = None
+    report = {
+        "meta": {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "cv2": cv2_version,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 from src.brain.slow_brain import VisionBrain
 import os
+import sys
 
 def create_dummy_image(filename="test_input.png"):
     # Create a simple image: Green ground, Blue sky, Gray "Wall"
@@ -30,9 +31,10 @@ def main():
     image_path = create_dummy_image()
     history = "[12:00:00] Action: Walk Forward -> Result: Stopped."
     
-    # 2. Init Brain
+    # 2. Init Brain ("python main_brain_test.py stub" runs without the model)
+    backend = sys.argv[1] if len(sys.argv) > 1 else "mlx"
     try:
-        brain = VisionBrain()
+        brain = VisionBrain(backend=backend)
         
         # 3. Inference
         print("\nThinking...")
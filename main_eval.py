@@ -0,0 +1,82 @@
+"""
+Offline evaluation of the brain over a dataset of recorded frames.
+
+    python main_eval.py DATASET                              # stub backend, all CPU cores
+    python main_eval.py DATASET --backend mlx --batch 4      # real model, batched
+    python main_eval.py DATASET --size 448x252 --prompt-file prompt.txt --out run.json
+    python main_eval.py DATASET --compare base.json          # accuracy/latency vs a saved run
+
+DATASET is a session recorded with `main_integration_test.py --record DIR`, or a
+directory with cases.jsonl (see src/brain/evaluation.py).
+"""
+import argparse
+import json
+import time
+
+from src.brain.evaluation import load_dataset, report, run_batched, run_parallel
+from src.brain.slow_brain import SYSTEM_PROMPT, VisionBrain
+
+def parse_size(text):
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+def compare(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["report"]
+    print(f"\n--- vs {baseline_path} ---")
+    rows = [(f"accuracy.{k}", baseline["accuracy"][k], current["accuracy"][k]) for k in current["accuracy"]]
+    rows += [(f"latency_ms.{k}", baseline["latency_ms"][k], current["latency_ms"][k]) for k in current["latency_ms"]]
+    rows += [(k, baseline[k], current[k]) for k in ("tokens_per_s", "cases_per_s")]
+    for name, old, new in rows:
+        print(f"{name:<20} {old:10.3f} -> {new:10.3f}  ({new - old:+.3f})")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dataset")
+    parser.add_argument("--backend", default="stub", choices=("stub", "mlx"))
+    parser.add_argument("--model", default="mlx-community/Llama-3.2-11B-Vision-Instruct-4bit")
+    parser.add_argument("--workers", type=int, default=None, help="Stub worker processes (default: CPU count)")
+    parser.add_argument("--batch", type=int, default=4, help="Batch size for the mlx backend")
+    parser.add_argument("--size", type=parse_size, default=None, help="Resize frames to WxH before inference")
+    parser.add_argument("--prompt-file", help="System prompt to evaluate instead of the default")
+    parser.add_argument("--max-tokens", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=None, help="Only the first N cases")
+    parser.add_argument("--stub-latency", type=float, default=0.05)
+    parser.add_argument("--stub-tps", type=float, default=0.0, help="Stub decode tokens/s (0 = instant)")
+    parser.add_argument("--out", help="Write the report and per-case results here (JSON)")
+    parser.add_argument("--compare", help="Report JSON from an earlier run")
+    args = parser.parse_args()
+
+    system_prompt = SYSTEM_PROMPT
+    if args.prompt_file:
+        with open(args.prompt_file, encoding="utf-8") as f:
+            system_prompt = f.read().strip()
+
+    cases = load_dataset(args.dataset, limit=args.limit)
+    print(f"Eval: {len(cases)} cases from {args.dataset} ({args.backend})")
+    if not cases:
+        return
+
+    start = time.perf_counter()
+    if args.backend == "stub":
+        stub = {"latency": args.stub_latency, "tokens_per_second": args.stub_tps}
+        results = run_parallel(cases, args.dataset, workers=args.workers, size=args.size,
+                               backend_kwargs=stub, system_prompt=system_prompt, max_tokens=args.max_tokens)
+    else:
+        brain = VisionBrain(args.model, backend="mlx", system_prompt=system_prompt)
+        brain.warm_up(args.size or (640, 360))
+        results = run_batched(brain, cases, args.dataset, batch_size=args.batch, size=args.size,
+                              max_tokens=args.max_tokens)
+    summary = report(results, time.perf_counter() - start)
+    print(json.dumps(summary, indent=2))
+
+    if args.out:
+        config = {k: v for k, v in vars(args).items() if k not in ("out", "compare")}
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "report": summary, "results": results}, f, indent=2)
+        print(f"Eval: wrote {args.out}")
+    if args.compare:
+        compare(summary, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
 from src.control.spinal_cord import SpinalCord
+import sys
 import time
 
 def main():
     print("--- SPARTAN VLA AGENT: FULL AUTONOMY TEST ---")
-    print("Initialization takes a few seconds (loading Brain)...")
+    print("The Brain loads in the background; input and capture are live immediately.")
     
-    cord = SpinalCord()
+    # `--trace out.json` records per-stage latency spans (open in chrome://tracing or Perfetto)
+    trace_path = sys.argv[sys.argv.index("--trace") + 1] if "--trace" in sys.argv[:-1] else None
+    # `--record DIR` saves frames, thoughts and inputs for offline replay (RecordingSource)
+    record_path = sys.argv[sys.argv.index("--record") + 1] if "--record" in sys.argv[:-1] else None
+    # `--brain-process` runs the VLM in a worker process so it can't stall input timing
+    cord = SpinalCord(trace_path=trace_path, record_path=record_path, brain_process="--brain-process" in sys.argv)
     
     print("\nREADY TO START.")
     print("1. Open Minecraft.")
@@ -1,6 +1,7 @@
 import cv2
 import time
-from src.vision.window_mgr import get_minecraft_window, activate_window
+from src.vision.window_mgr import activate_window
+from src.vision.window_tracker import WindowTracker
 from src.vision.capture import ScreenCapture
 import mss
 
@@ -19,9 +20,12 @@ def main():
     
     # Ignore common terminal/runner windows that might match the search query
     ignore_list = ["main_vision_test", "python", "Terminal", "iTerm", "VS Code"]
-    window_region = get_minecraft_window(target_window, ignore_titles=ignore_list)
+    # Cached lookup: cheap per-frame revalidation instead of a full window scan
+    tracker = WindowTracker(target_window, ignore_titles=ignore_list, ttl=0.5)
+    window_region = tracker.get()
     
     if not window_region:
+        tracker = None
         print(f"WARNING: Window '{target_window}' not found.")
         print("Falling back to Full Screen capture for performance test.")
         # mss monitor 1 is usually the main screen
@@ -41,6 +45,10 @@ def main():
     
     try:
         while True:
+            # Follow the window if it moved (no OS call within the TTL)
+            if tracker:
+                window_region = tracker.get() or window_region
+            
             # Capture frame
             if isinstance(window_region, dict) and 'window_id' in window_region:
                 frame = cap.capture_window_exclusive(window_region['window_id'])
@@ -49,6 +57,8 @@ def main():
             
             if frame is None:
                 # Window might be minimized or closed
+                if tracker:
+                    tracker.invalidate()
                 time.sleep(0.1)
                 continue
             
@@ -66,10 +76,6 @@ def main():
             # Exit on 'q'
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
-                
-            # Optional: re-check window position occasionally 
-            # if the user moves the window, we might want to update window_region
-            # keeping it simple for now to maximize FPS
             
     except KeyboardInterrupt:
         pass
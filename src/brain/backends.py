@@ -0,0 +1,256 @@
+import copy
+import random
+import re
+import time
+
+from PIL import Image
+
+from src.brain.prefix_cache import PrefixState
+
+class InferenceBackend:
+    """
+    What VisionBrain needs from a model: text generation from (prompt, RGB PIL image).
+    Implementations: MLXBackend (the real VLM) and StubBackend (CPU-only, scripted).
+    """
+    name = "base"
+    TOKEN_RE = re.compile(r"\S+\s*")
+
+    def cache_key(self):
+        """Identifies the model behind this backend, for invalidating prefix caches."""
+        return (self.name, id(self))
+
+    def prefill(self, prefix):
+        """
+        Prefills the static prompt prefix once. Returns a PrefixState to pass as
+        `prefix_state` to later calls, or None if this backend can't reuse prefixes.
+        """
+        return None
+
+    def generate(self, prompt, image, max_tokens=100, prefix_state=None):
+        """Returns the full generated text. `prompt` always includes the prefix."""
+        return "".join(self.stream(prompt, image, max_tokens, prefix_state=prefix_state))
+
+    def stream(self, prompt, image, max_tokens=100, prefix_state=None):
+        """Yields decoded text pieces as they are produced."""
+        raise NotImplementedError
+
+    def generate_batch(self, prompts, images, max_tokens=100, prefix_state=None):
+        """
+        Generates for several (prompt, image) pairs sharing one set of weights.
+        Default runs them back to back; backends with real batched decoding override it.
+        """
+        return [self.generate(p, i, max_tokens, prefix_state=prefix_state) for p, i in zip(prompts, images)]
+
+    def count_tokens(self, text):
+        """Tokens in generated text, for throughput stats. Approximated by words unless overridden."""
+        return len(self.TOKEN_RE.findall(text))
+
+    def load_image(self, path):
+        """Loads an image file as RGB PIL (the file-path fallback of see_and_think)."""
+        image = Image.open(path)
+        image.load()
+        return image.convert("RGB")
+
+class MLXBackend(InferenceBackend):
+    """mlx_vlm on Apple Silicon."""
+    name = "mlx"
+
+    def __init__(self, model_path="mlx-community/Llama-3.2-11B-Vision-Instruct-4bit"):
+        from mlx_vlm import load
+
+        print(f"Loading Slow Brain: {model_path}...")
+        self.model_path = model_path
+        self.model, self.processor = load(model_path)
+        print("Slow Brain Loaded.")
+
+    def cache_key(self):
+        return (self.name, self.model_path)
+
+    def prefill(self, prefix):
+        """
+        Runs the language model over the text-only prefix and keeps its KV cache.
+        Relies on mlx_vlm internals (prompt caches, generate_step(prompt_cache=...)),
+        so any failure just disables prefix reuse for this model.
+        """
+        try:
+            import mlx.core as mx
+            from mlx_vlm.models.cache import make_prompt_cache
+
+            ids = self._tokenizer().encode(prefix, add_special_tokens=False)
+            cache = make_prompt_cache(self.model.language_model)
+            self.model.language_model(mx.array([ids]), cache=cache)
+            mx.eval([c.state for c in cache])
+            return PrefixState(prefix, data=(cache, ids), tokens=len(ids))
+        except Exception as e:
+            print(f"Brain: Prefix KV cache unavailable with this model/mlx_vlm ({e}). Using full prefill.")
+            return None
+
+    def generate(self, prompt, image, max_tokens=100, prefix_state=None):
+        if prefix_state is not None:
+            return "".join(self.stream(prompt, image, max_tokens, prefix_state=prefix_state))
+
+        from mlx_vlm import generate
+
+        output = generate(self.model, self.processor, prompt, image, max_tokens=max_tokens, verbose=False)
+        # Newer mlx_vlm returns a GenerationResult, older versions a plain string
+        return getattr(output, "text", output)
+
+    def stream(self, prompt, image, max_tokens=100, prefix_state=None):
+        if prefix_state is not None:
+            yield from self._stream_from_prefix(prompt, image, max_tokens, prefix_state)
+            return
+
+        from mlx_vlm import stream_generate
+
+        for chunk in stream_generate(self.model, self.processor, prompt, image, max_tokens=max_tokens):
+            text = getattr(chunk, "text", chunk)
+            if text:
+                yield text
+
+    def count_tokens(self, text):
+        return len(self._tokenizer().encode(text, add_special_tokens=False))
+
+    def _tokenizer(self):
+        return getattr(self.processor, "tokenizer", self.processor)
+
+    def _stream_from_prefix(self, prompt, image, max_tokens, prefix_state):
+        """Decodes with a copy of the prefilled cache, feeding only the tokens after the prefix."""
+        from mlx_vlm.utils import generate_step, prepare_inputs
+
+        cache, prefix_ids = prefix_state.data
+        inputs = prepare_inputs(self.processor, [image], [prompt], self.model.config.image_token_index)
+        if isinstance(inputs, dict):
+            input_ids = inputs.pop("input_ids")
+            pixel_values = inputs.pop("pixel_values", None)
+            mask = inputs.pop("attention_mask", None)
+            extra = inputs
+        else:
+            input_ids, pixel_values, mask = inputs[:3]
+            extra = {}
+
+        n = len(prefix_ids)
+        if input_ids[0, :n].tolist() != list(prefix_ids):
+            raise ValueError("Prompt does not start with the cached prefix tokens")
+
+        # Per-token inputs (e.g. mllama's cross_attention_mask) must drop the prefix too
+        length = input_ids.shape[1]
+        extra = {
+            key: value[:, n:] if getattr(value, "ndim", 0) >= 2 and value.shape[1] == length else value
+            for key, value in extra.items()
+        }
+
+        tokenizer = self._tokenizer()
+        eos = getattr(tokenizer, "eos_token_id", None)
+        steps = generate_step(
+            input_ids[:, n:], self.model, pixel_values,
+            mask[:, n:] if mask is not None else None,
+            prompt_cache=copy.deepcopy(cache), **extra
+        )
+
+        tokens, emitted = [], ""
+        for (token, _), _ in zip(steps, range(max_tokens)):
+            token = token.item() if hasattr(token, "item") else int(token)
+            if token == eos:
+                break
+            tokens.append(token)
+            text = tokenizer.decode(tokens)
+            if len(text) > len(emitted) and not text.endswith("\ufffd"):  # Wait out partial UTF-8
+                yield text[len(emitted):]
+                emitted = text
+
+    def load_image(self, path):
+        from mlx_vlm.utils import load_image
+
+        return load_image(path)
+
+class StubBackend(InferenceBackend):
+    """
+    Deterministic stand-in for the VLM so the pipeline runs (and can be benchmarked)
+    on machines without the model. Simulates prefill latency and a decode token rate.
+    """
+    name = "stub"
+
+    DEFAULT_RESPONSES = [
+        "The path ahead looks clear. ACTION: Walk forward for 2 seconds.",
+        "There is a wall in front of me. ACTION: Turn left 90 degrees.",
+        "A block is directly ahead, I can climb it. ACTION: Jump, then walk forward.",
+        "I see a tree nearby. ACTION: Attack the tree.",
+        "Nothing interesting here. ACTION: Turn right 45 degrees.",
+    ]
+
+    def __init__(self, responses=None, latency=0.5, tokens_per_second=25.0, mode="cycle", seed=0,
+                 prefix_latency=0.0, spin=False):
+        """
+        Args:
+            responses (list): Scripted replies. Defaults to DEFAULT_RESPONSES.
+            latency (float): Seconds before the first token (simulated prefill).
+            prefix_latency (float): Extra prefill for the static prompt prefix, skipped
+                                    when a prefilled PrefixState is passed in.
+            tokens_per_second (float): Decode rate; 0 or None for instant output.
+            mode (str): 'cycle' through responses in order, or 'random' (seeded).
+            spin (bool): Burn CPU in Python for the simulated time instead of sleeping, i.e.
+                         hold the GIL like real tokenization / preprocessing does.
+        """
+        self.responses = list(responses or self.DEFAULT_RESPONSES)
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.mode = mode
+        self.prefix_latency = prefix_latency
+        self.spin = spin
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    def next_response(self):
+        if self.mode == "random":
+            response = self.rng.choice(self.responses)
+        else:
+            response = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        return response
+
+    def _wait(self, seconds):
+        if not self.spin:
+            time.sleep(seconds)
+            return
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+
+    def prefill(self, prefix):
+        if self.prefix_latency:
+            self._wait(self.prefix_latency)
+        return PrefixState(prefix, tokens=len(self.TOKEN_RE.findall(prefix)))
+
+    def _prefill_time(self, prefix_state):
+        return (self.latency or 0.0) + (0.0 if prefix_state is not None else (self.prefix_latency or 0.0))
+
+    def generate_batch(self, prompts, images, max_tokens=100, prefix_state=None):
+        # Models decode a batch in lockstep: one prefill latency, then the longest reply's tokens
+        responses = [self.next_response() for _ in prompts]
+        longest = max((len(self.TOKEN_RE.findall(r)) for r in responses), default=0)
+        decode = min(longest, max_tokens) / self.tokens_per_second if self.tokens_per_second else 0.0
+        self._wait(self._prefill_time(prefix_state) + decode)
+        return [self._truncate(r, max_tokens) for r in responses]
+
+    def _truncate(self, response, max_tokens):
+        return "".join(m.group() for m, _ in zip(self.TOKEN_RE.finditer(response), range(max_tokens)))
+
+    def stream(self, prompt, image, max_tokens=100, prefix_state=None):
+        response = self.next_response()
+        prefill = self._prefill_time(prefix_state)
+        if prefill:
+            self._wait(prefill)
+        delay = 1.0 / self.tokens_per_second if self.tokens_per_second else 0.0
+        for i, m in enumerate(self.TOKEN_RE.finditer(response)):
+            if i >= max_tokens:
+                break
+            if delay:
+                self._wait(delay)
+            yield m.group()
+
+def make_backend(kind="mlx", **kwargs):
+    """Builds an inference backend by name: 'mlx' or 'stub'."""
+    backends = {"mlx": MLXBackend, "stub": StubBackend}
+    if kind not in backends:
+        raise ValueError(f"Unknown inference backend '{kind}'. Options: {sorted(backends)}")
+    return backends[kind](**kwargs)
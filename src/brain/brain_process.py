@@ -0,0 +1,284 @@
+import itertools
+import multiprocessing
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.brain.slow_brain import SYSTEM_PROMPT, VisionBrain, traced_stream
+from src.utils.tracing import tracer
+
+def _worker_main(conn, shm_name, brain_kwargs, warm_size):
+    """
+    Brain worker process. Messages in: ("think", id, shape, image, history, max_tokens, stream),
+    ("warm_up", id, size), ("cancel", id), ("stop",). Messages out: ("ready", warm_seconds) or
+    ("failed", error) once, then ("piece", id, text)* and ("end", id, result, error) per request.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        brain = VisionBrain(**brain_kwargs)
+        seconds = brain.warm_up(warm_size) if warm_size else 0.0
+    except Exception as e:
+        conn.send(("failed", f"{type(e).__name__}: {e}"))
+        shm.close()
+        return
+    conn.send(("ready", seconds))
+
+    running = True
+    while running:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break  # Parent went away
+        kind = msg[0]
+        if kind == "stop":
+            break
+        if kind == "warm_up":
+            conn.send(("end", msg[1], brain.warm_up(msg[2]), None))
+        elif kind == "think":
+            _, rid, shape, image, history, max_tokens, stream = msg
+            if shape is not None:
+                # The parent copied the frame into shared memory and waits for "end" before reusing it
+                image = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            try:
+                if not stream:
+                    conn.send(("end", rid, brain.see_and_think(image, history), None))
+                    continue
+                pieces = brain.think_stream(image, history, max_tokens)
+                for piece in pieces:
+                    conn.send(("piece", rid, piece))
+                    if conn.poll():
+                        # Only a cancel (consumer stopped early) or stop can arrive mid-request
+                        running = conn.recv()[0] != "stop"
+                        break
+                pieces.close()
+                conn.send(("end", rid, None, None))
+            except Exception as e:
+                conn.send(("end", rid, None, f"{type(e).__name__}: {e}"))
+            finally:
+                image = None  # Drop the shared-memory view before the next request / close
+    shm.close()
+
+class BrainProcess:
+    """
+    Runs VisionBrain in a separate process so tokenization, detokenization and image
+    preprocessing don't compete for this process's GIL with the motor scheduler, the
+    act loop and the ESC listener. Same interface as VisionBrain for SpinalCord.
+
+    Frames are copied once into a shared-memory buffer instead of being pickled; the
+    pipe only carries small control messages and the generated text. If the worker
+    dies, the thought in flight returns an error string and the next one restarts it.
+    """
+    def __init__(self, frame_shape, model_path="mlx-community/Llama-3.2-11B-Vision-Instruct-4bit",
+                 backend=None, system_prompt=SYSTEM_PROMPT, prefix_cache=True, start_timeout=600.0):
+        """
+        Args:
+            frame_shape (tuple): (h, w, 3) of the largest frame to send through shared memory.
+                                 Other images (larger frames, paths, PIL) are pickled instead.
+            model_path (str): Model for the MLX backend.
+            backend: Backend name ('mlx', 'stub') or a picklable InferenceBackend (e.g. StubBackend);
+                     built inside the worker.
+            system_prompt (str): Static instructions sent with every thought.
+            prefix_cache (bool): Prefix KV reuse inside the worker.
+            start_timeout (float): Seconds to wait for the worker to load its model.
+        """
+        self.frame_shape = tuple(frame_shape)
+        self.brain_kwargs = {"model_path": model_path, "backend": backend,
+                             "system_prompt": system_prompt, "prefix_cache": prefix_cache}
+        self.start_timeout = start_timeout
+        self.context = multiprocessing.get_context("spawn")  # Never fork a process with pynput threads
+        self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(self.frame_shape)))
+        self.lock = threading.Lock()  # One request at a time; the worker is serial anyway
+        self.ids = itertools.count(1)
+        self.process = None
+        self.conn = None
+        self.unfinished = None  # Id of a cancelled stream whose "end" hasn't been read yet
+        self.warm_size = None
+
+        self.requests = 0
+        self.restarts = 0
+        self.errors = 0
+        self.pickled = 0
+        self.start()
+
+    def start(self):
+        """Starts the worker and waits until its brain is loaded (and warmed, after a restart)."""
+        parent, child = self.context.Pipe()
+        process = self.context.Process(target=_worker_main, name="BrainProcess", daemon=True,
+                                       args=(child, self.shm.name, self.brain_kwargs, self.warm_size))
+        process.start()
+        child.close()
+        if not parent.poll(self.start_timeout):
+            process.kill()
+            raise TimeoutError(f"Brain process did not start within {self.start_timeout:.0f}s")
+        try:
+            msg = parent.recv()
+        except EOFError:
+            raise RuntimeError(f"Brain process exited during startup (exit code {process.exitcode})")
+        if msg[0] == "failed":
+            process.join(1.0)
+            raise RuntimeError(f"Brain process failed to load: {msg[1]}")
+        self.process, self.conn = process, parent
+        self.unfinished = None
+        print(f"Brain: Worker process {process.pid} ready")
+        return self
+
+    def warm_up(self, frame_size=(640, 360)):
+        self.warm_size = tuple(frame_size)  # Restarted workers warm up before taking requests
+        with self.lock:
+            return self._call(("warm_up", next(self.ids), self.warm_size)) or 0.0
+
+    def see_and_think(self, image, history_context="", max_tokens=100):
+        with self.lock:
+            return self._think(image, history_context, max_tokens, stream=False)
+
+    def see_and_think_batch(self, images, history_contexts, max_tokens=100):
+        return [self.see_and_think(image, history, max_tokens) for image, history in zip(images, history_contexts)]
+
+    def think_stream(self, image, history_context="", max_tokens=100):
+        stream = self._stream(image, history_context, max_tokens)
+        yield from (traced_stream(stream) if tracer.enabled else stream)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "restarts": self.restarts,
+            "errors": self.errors,
+            "pickled_frames": self.pickled,
+            "pid": self.process.pid if self.process else None,
+        }
+
+    def close(self):
+        """Stops the worker and frees the shared memory."""
+        with self.lock:
+            if self.process is not None:
+                try:
+                    self.conn.send(("stop",))
+                except (BrokenPipeError, OSError):
+                    pass
+                self.process.join(2.0)
+                if self.process.is_alive():
+                    self.process.kill()
+                self.conn.close()
+                self.process = None
+            if self.shm is not None:
+                self.shm.close()
+                self.shm.unlink()
+                self.shm = None
+
+    def _stream(self, image, history, max_tokens):
+        with self.lock:
+            rid = self._send_think(image, history, max_tokens, stream=True)
+            if rid is None:
+                yield self._crashed()
+                return
+            finished = False
+            try:
+                while True:
+                    msg = self._recv()
+                    if msg is None:
+                        finished = True
+                        yield self._crashed()
+                        return
+                    if msg[0] == "piece":
+                        yield msg[2]
+                        continue
+                    finished = True
+                    if msg[3] is not None:
+                        self.errors += 1
+                        yield f"Error in brain process: {msg[3]}"
+                    return
+            finally:
+                if not finished:
+                    # Consumer stopped early: tell the worker, collect its "end" before the next request
+                    try:
+                        self.conn.send(("cancel", rid))
+                        self.unfinished = rid
+                    except (BrokenPipeError, OSError):
+                        self.process = None
+
+    def _think(self, image, history, max_tokens, stream):
+        rid = self._send_think(image, history, max_tokens, stream)
+        if rid is None:
+            return self._crashed()
+        msg = self._recv()
+        if msg is None:
+            return self._crashed()
+        if msg[3] is not None:
+            self.errors += 1
+            return f"Error in brain process: {msg[3]}"
+        return msg[2]
+
+    def _call(self, request):
+        if not self._ready():
+            return None
+        self.conn.send(request)
+        msg = self._recv()
+        return None if msg is None else msg[2]
+
+    def _send_think(self, image, history, max_tokens, stream):
+        """Ships one request (frame via shared memory when it fits). Returns its id, or None if the worker is gone."""
+        if not self._ready():
+            return None
+        rid = next(self.ids)
+        self.requests += 1
+        shape = None
+        if isinstance(image, np.ndarray) and image.dtype == np.uint8 and image.nbytes <= self.shm.size:
+            shape = image.shape
+            np.copyto(np.ndarray(shape, dtype=np.uint8, buffer=self.shm.buf), image)
+            image = None
+        elif isinstance(image, np.ndarray):
+            self.pickled += 1
+        try:
+            self.conn.send(("think", rid, shape, image, history, max_tokens, stream))
+        except (BrokenPipeError, OSError):
+            return None
+        return rid
+
+    def _ready(self):
+        """Makes sure a live worker is waiting for a request. False if it can't be (re)started."""
+        if self.shm is None:
+            return False  # Closed
+        if self.process is not None and self.unfinished is not None:
+            while True:  # Drain the rest of a cancelled stream
+                msg = self._recv()
+                if msg is None or (msg[0] == "end" and msg[1] == self.unfinished):
+                    break
+            self.unfinished = None
+        if self.process is None or not self.process.is_alive():
+            if self.process is not None:
+                self.process = None
+                self.restarts += 1
+            print(f"Brain: Restarting worker process (restart #{self.restarts})...")
+            try:
+                self.start()
+            except Exception as e:
+                print(f"Brain: Worker restart failed: {e}")
+                return False
+        return True
+
+    def _recv(self):
+        """Next message from the worker, or None if it died. Polls so a crash can't block forever."""
+        while True:
+            try:
+                if self.conn.poll(0.1):
+                    return self.conn.recv()
+            except (EOFError, OSError):
+                pass
+            else:
+                if self.process.is_alive():
+                    continue
+            self._reap()
+            return None
+
+    def _reap(self):
+        if self.process is not None:
+            self.process.join(0.5)
+            print(f"Brain: Worker process died (exit code {self.process.exitcode})")
+            self.conn.close()
+            self.process = None
+            self.restarts += 1
+
+    def _crashed(self):
+        self.errors += 1
+        return "Error in brain process: worker unavailable (restarting)"
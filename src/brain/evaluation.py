@@ -0,0 +1,200 @@
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from src.brain.backends import StubBackend
+from src.brain.slow_brain import SYSTEM_PROMPT, VisionBrain
+from src.control.action_parser import parse_actions, to_commands
+from src.utils.lazy import lazy_import
+from src.utils.recording import Recording
+
+cv2 = lazy_import("cv2")
+
+class EvalCase:
+    """
+    One evaluation input: a frame, the history the brain saw with it, and the
+    reference thought/action it should produce.
+    `image` is a file path, or None when the frame is `frame` in a recorded session.
+    """
+    __slots__ = ("id", "image", "frame", "history", "reference")
+
+    def __init__(self, id, image=None, frame=None, history="", reference=""):
+        self.id = id
+        self.image = image
+        self.frame = frame
+        self.history = history
+        self.reference = reference
+
+def load_dataset(path, limit=None):
+    """
+    Loads evaluation cases from a dataset directory, either:
+      - a Recorder session (meta.json): every recorded thought with its frame and history;
+        the reference is the thought recorded live, or the one in labels.jsonl
+        ({"thought": id, "reference": "..."}) when present.
+      - a cases.jsonl file: {"id", "image" (relative path), "history", "reference"} per line.
+    Returns:
+        list: EvalCase objects, in dataset order.
+    """
+    if os.path.exists(os.path.join(path, "meta.json")):
+        cases = _session_cases(path)
+    elif os.path.exists(os.path.join(path, "cases.jsonl")):
+        cases = _jsonl_cases(path)
+    else:
+        raise FileNotFoundError(f"{path} is neither a recorded session (meta.json) nor has cases.jsonl")
+    return cases[:limit] if limit else cases
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def _jsonl_cases(path):
+    cases = []
+    for i, row in enumerate(_read_jsonl(os.path.join(path, "cases.jsonl"))):
+        cases.append(EvalCase(row.get("id", i), image=os.path.join(path, row["image"]),
+                              history=row.get("history", ""), reference=row.get("reference", "")))
+    return cases
+
+def _session_cases(path):
+    labels_path = os.path.join(path, "labels.jsonl")
+    labels = {row["thought"]: row["reference"] for row in _read_jsonl(labels_path)} if os.path.exists(labels_path) else {}
+    recording = Recording(path)
+    cases = []
+    for event in recording.events("thought"):
+        # Cached thoughts have no history of their own and would only repeat an earlier case
+        if event.get("history") is None or event.get("frame") is None or not len(recording):
+            continue
+        cases.append(EvalCase(event["thought"], frame=recording.index_of_seq(event["frame"]),
+                              history=event["history"], reference=labels.get(event["thought"], event["text"])))
+    recording.close()
+    return cases
+
+class FrameLoader:
+    """Loads case frames as BGR arrays, optionally resized to the resolution under test."""
+    def __init__(self, dataset, size=None):
+        """
+        Args:
+            dataset (str): Dataset directory (session frames are read from its mmap).
+            size (tuple): (w, h) to resize every frame to, or None for the stored size.
+        """
+        self.dataset = dataset
+        self.size = tuple(size) if size else None
+        self.recording = None
+
+    def load(self, case):
+        if case.image is not None:
+            frame = cv2.imread(case.image, cv2.IMREAD_COLOR)
+            if frame is None:
+                raise FileNotFoundError(f"Could not read {case.image}")
+        else:
+            if self.recording is None:
+                self.recording = Recording(self.dataset)
+            frame = self.recording.frame(case.frame)
+        if self.size and (frame.shape[1], frame.shape[0]) != self.size:
+            frame = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        return frame
+
+def score(prediction, reference):
+    """
+    Compares the actions a prediction would execute with the reference's.
+    Returns:
+        dict: exact (same motor commands), kinds (same action types in order),
+              parsed (the prediction produced any action at all).
+    """
+    predicted = parse_actions(prediction)
+    expected = parse_actions(reference)
+    return {
+        "exact": to_commands(predicted) == to_commands(expected),
+        "kinds": [a.kind for a in predicted] == [a.kind for a in expected],
+        "parsed": bool(predicted),
+    }
+
+def _result(case, prediction, latency, tokens, error=None):
+    result = {"id": case.id, "prediction": prediction, "reference": case.reference,
+              "latency": latency, "tokens": tokens, "error": error}
+    result.update(score(prediction, case.reference) if error is None else
+                  {"exact": False, "kinds": False, "parsed": False})
+    return result
+
+def run_batched(brain, cases, dataset, batch_size=4, size=None, max_tokens=100):
+    """
+    Evaluates cases in one process through VisionBrain.see_and_think_batch (the real
+    model: one copy of the weights, prompt prefix shared). Whether a batch decodes
+    together is up to the backend's generate_batch; MLXBackend runs the cases one
+    after another. Every case in a batch is charged the batch's latency.
+    Returns:
+        list: Per-case result dicts, in case order.
+    """
+    loader = FrameLoader(dataset, size)
+    results = [None] * len(cases)
+    for first in range(0, len(cases), batch_size):
+        frames, slots = [], []
+        for i in range(first, min(first + batch_size, len(cases))):
+            try:
+                frames.append(loader.load(cases[i]))
+                slots.append(i)
+            except Exception as e:
+                results[i] = _result(cases[i], "", 0.0, 0, error=f"{type(e).__name__}: {e}")
+        if not slots:
+            continue
+        start = time.perf_counter()
+        outputs = brain.see_and_think_batch(frames, [cases[i].history for i in slots], max_tokens=max_tokens)
+        latency = time.perf_counter() - start
+        for i, text in zip(slots, outputs):
+            results[i] = _result(cases[i], text, latency, brain.backend.count_tokens(text))
+    return results
+
+# Per-process state for run_parallel workers
+_worker = None
+
+def _init_worker(dataset, size, backend_kwargs, system_prompt, max_tokens):
+    global _worker
+    brain = VisionBrain(backend=StubBackend(**backend_kwargs), system_prompt=system_prompt)
+    _worker = (brain, FrameLoader(dataset, size), max_tokens)
+
+def _eval_case(case):
+    brain, loader, max_tokens = _worker
+    try:
+        frame = loader.load(case)
+    except Exception as e:
+        return _result(case, "", 0.0, 0, error=f"{type(e).__name__}: {e}")
+    start = time.perf_counter()
+    text = brain.see_and_think(frame, case.history, max_tokens)
+    return _result(case, text, time.perf_counter() - start, brain.backend.count_tokens(text))
+
+def run_parallel(cases, dataset, workers=None, size=None, backend_kwargs=None, system_prompt=SYSTEM_PROMPT,
+                 max_tokens=100):
+    """
+    Evaluates cases over a pool of worker processes, each with its own StubBackend brain
+    (the stub is cheap to build per process; the real model is batched with run_batched).
+    Returns:
+        list: Per-case result dicts, in case order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, len(cases) // (workers * 4))
+    init_args = (dataset, size, backend_kwargs or {}, system_prompt, max_tokens)
+    with multiprocessing.Pool(workers, _init_worker, init_args) as pool:
+        return pool.map(_eval_case, cases, chunksize=chunk)
+
+def report(results, wall_seconds):
+    """
+    Aggregates per-case results.
+    Returns:
+        dict: accuracy (exact / kinds / parsed rates), tokens_per_s (throughput over
+              the run), cases_per_s and latency p50/p95/p99 in ms.
+    """
+    done = [r for r in results if r["error"] is None]
+    n = len(done)
+    latency_ms = np.array([r["latency"] for r in done]) * 1000.0 if n else np.zeros(1)
+    tokens = sum(r["tokens"] for r in done)
+    return {
+        "cases": len(results),
+        "errors": len(results) - n,
+        "accuracy": {key: (sum(r[key] for r in done) / n if n else 0.0) for key in ("exact", "kinds", "parsed")},
+        "tokens_per_s": tokens / wall_seconds if wall_seconds else 0.0,
+        "cases_per_s": n / wall_seconds if wall_seconds else 0.0,
+        "latency_ms": {f"p{q}": float(np.percentile(latency_ms, q)) for q in (50, 95, 99)},
+        "wall_s": wall_seconds,
+    }
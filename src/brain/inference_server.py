@@ -0,0 +1,178 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+class InferenceRequest:
+    """One agent's (frame, history) submission plus its timing."""
+    __slots__ = ("frame", "history", "future", "submitted_at", "started_at", "finished_at", "batch_size")
+
+    def __init__(self, frame, history):
+        self.frame = frame
+        self.history = history
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.batch_size = 0
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    @property
+    def queue_time(self):
+        return (self.started_at or time.monotonic()) - self.submitted_at
+
+    @property
+    def inference_time(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+class InferenceServer:
+    """
+    In-process inference service: many agents, one VisionBrain (one copy of the weights).
+    Requests are micro-batched: the worker takes the first waiting request, then
+    collects more for up to `max_wait` seconds or until `max_batch`, and runs them
+    through VisionBrain.see_and_think_batch in one call.
+    """
+    def __init__(self, brain, max_batch=4, max_wait=0.05, max_tokens=100):
+        self.brain = brain
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_tokens = max_tokens
+
+        self.requests = queue.Queue()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()  # submit() vs stop(): nothing may be queued after the final drain
+        self.thread = None
+
+        # Recent per-request timings (seconds) and batch sizes
+        self.queue_times = deque(maxlen=1000)
+        self.inference_times = deque(maxlen=1000)
+        self.batch_sizes = deque(maxlen=1000)
+        self.served = 0
+        self.errors = 0
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="InferenceServer", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        with self.lock:
+            self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+        # Fail whatever is still queued so callers don't hang
+        while True:
+            try:
+                req = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            req.future.set_exception(RuntimeError("InferenceServer stopped"))
+
+    def submit(self, frame, history=""):
+        """
+        Queues a thought request. Returns an InferenceRequest (call .result()); once the
+        server is stopped its result() raises RuntimeError instead of waiting forever.
+        """
+        req = InferenceRequest(frame, history)
+        with self.lock:
+            if self.stop_event.is_set():
+                req.future.set_exception(RuntimeError("InferenceServer stopped"))
+            else:
+                self.requests.put(req)
+        return req
+
+    def client(self):
+        """A VisionBrain-compatible handle for one agent (e.g. SpinalCord(brain=server.client()))."""
+        return BrainClient(self)
+
+    def stats(self):
+        def pct(values, q):
+            return float(np.percentile(values, q)) * 1000.0 if values else 0.0
+        return {
+            "served": self.served,
+            "errors": self.errors,
+            "pending": self.requests.qsize(),
+            "avg_batch": float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            "queue_ms_p50": pct(self.queue_times, 50),
+            "queue_ms_p95": pct(self.queue_times, 95),
+            "inference_ms_p50": pct(self.inference_times, 50),
+            "inference_ms_p95": pct(self.inference_times, 95),
+        }
+
+    def _collect_batch(self):
+        try:
+            first = self.requests.get(timeout=0.1)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            started = time.monotonic()
+            for req in batch:
+                req.started_at = started
+                req.batch_size = len(batch)
+            try:
+                outputs = self.brain.see_and_think_batch(
+                    [r.frame for r in batch], [r.history for r in batch], max_tokens=self.max_tokens
+                )
+                error = None
+            except Exception as e:
+                outputs, error = [None] * len(batch), e
+                self.errors += len(batch)
+                print(f"InferenceServer Error: {e}")
+
+            finished = time.monotonic()
+            self.batch_sizes.append(len(batch))
+            for req, text in zip(batch, outputs):
+                req.finished_at = finished
+                self.queue_times.append(req.queue_time)
+                self.inference_times.append(req.inference_time)
+                if error is not None:
+                    req.future.set_exception(error)
+                else:
+                    req.future.set_result(text)
+                    self.served += 1
+
+class BrainClient:
+    """
+    Stands in for VisionBrain inside one agent, forwarding thoughts to a shared
+    InferenceServer. Streaming isn't batched, so think_stream yields the whole thought.
+    """
+    def __init__(self, server):
+        self.server = server
+        self.last_request = None
+
+    def warm_up(self, frame_size=(640, 360)):
+        return 0.0  # The shared brain is warmed once by whoever owns it
+
+    def see_and_think(self, image, history_context=""):
+        self.last_request = self.server.submit(image, history_context)
+        return self.last_request.result()
+
+    def think_stream(self, image, history_context="", max_tokens=100):
+        yield self.see_and_think(image, history_context)
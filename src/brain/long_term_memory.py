@@ -0,0 +1,204 @@
+import heapq
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+
+WORD_RE = re.compile(r"[a-z]+")
+STOPWORDS = frozenset(
+    "a an the i me my it is are was be to of and or in on at for with this that there here "
+    "then so now next do should can will just see looks look seems some".split()
+)
+HASH_BANDS = 4  # 64-bit dHash split into 4 x 16-bit bands for multi-index lookup
+BAND_BITS = 64 // HASH_BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+def keywords(text):
+    """Lowercased content words of `text`, deduplicated, in order."""
+    return list(dict.fromkeys(w for w in WORD_RE.findall(text.lower()) if len(w) > 2 and w not in STOPWORDS))
+
+class MemoryEntry:
+    __slots__ = ("id", "t", "action", "result", "terms", "dhash", "recalls")
+
+    def __init__(self, entry_id, t, action, result, terms, dhash):
+        self.id = entry_id
+        self.t = t
+        self.action = action
+        self.result = result
+        self.terms = terms
+        self.dhash = dhash
+        self.recalls = 0
+
+class LongTermMemory:
+    """
+    Bounded store of past episodes with relevance retrieval.
+
+    Two indexes keep queries sublinear in the number of stored episodes:
+    - an inverted index: keyword -> ids of episodes whose action/result contain it
+    - a multi-index hash of the frame dHash: (band, 16-bit value) -> ids. Any two
+      hashes within HASH_BANDS - 1 bits share a band exactly, so near-identical
+      scenes are always candidates.
+    Only candidates from these postings are scored (IDF-weighted keyword overlap plus
+    frame similarity), and at most `max_postings` of the newest ids per key, so query
+    cost is bounded however common a keyword is. Eviction is least-recently-recalled
+    once `capacity` is reached.
+    """
+    def __init__(self, capacity=5000, max_postings=256, frame_weight=2.0, max_hamming=12):
+        """
+        Args:
+            capacity (int): Maximum episodes kept.
+            max_postings (int): Newest ids scanned per keyword / hash band in a query.
+            frame_weight (float): Score of an identical frame, relative to one rare keyword.
+            max_hamming (int): Frames further apart than this add nothing to the score.
+        """
+        self.capacity = capacity
+        self.max_postings = max_postings
+        self.frame_weight = frame_weight
+        self.max_hamming = max_hamming
+
+        self.entries = OrderedDict()  # id -> MemoryEntry, least recently recalled first
+        # Postings are dicts used as insertion-ordered sets (id -> None), oldest first
+        self.term_index = {}  # keyword -> ids
+        self.hash_index = {}  # (band, value) -> ids
+        self.next_id = 0
+        self.lock = threading.Lock()
+
+        self.queries = 0
+        self.candidates_scored = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, action, result="", signature=None):
+        """
+        Stores an episode.
+        Args:
+            action (str): What was done.
+            result (str): What was seen / happened.
+            signature: FrameSignature (or its int dHash) of the scene, optional.
+        Returns:
+            MemoryEntry
+        """
+        dhash = getattr(signature, "dhash", signature)
+        with self.lock:
+            entry = MemoryEntry(self.next_id, time.monotonic(), action, result,
+                                keywords(f"{action} {result}"), dhash)
+            self.next_id += 1
+            self.entries[entry.id] = entry
+            for term in entry.terms:
+                self.term_index.setdefault(term, {})[entry.id] = None
+            if dhash is not None:
+                for key in self._bands(dhash):
+                    self.hash_index.setdefault(key, {})[entry.id] = None
+
+            while len(self.entries) > self.capacity:
+                self._evict()
+            return entry
+
+    def set_result(self, entry, result):
+        """Replaces a stored episode's result and re-indexes its keywords (no-op once evicted)."""
+        with self.lock:
+            if self.entries.get(entry.id) is not entry:
+                return
+            terms = keywords(f"{entry.action} {result}")
+            for term in set(entry.terms).difference(terms):
+                ids = self.term_index[term]
+                del ids[entry.id]
+                if not ids:
+                    del self.term_index[term]
+            for term in terms:
+                self.term_index.setdefault(term, {})[entry.id] = None
+            entry.result = result
+            entry.terms = terms
+
+    def query(self, text="", signature=None, k=3, before=None):
+        """
+        Returns the top-k most relevant stored episodes for the current situation.
+        Args:
+            text (str): Description of the situation (e.g. the latest thought).
+            signature: FrameSignature (or int dHash) of the current frame, optional.
+            k (int): Episodes to return, best first.
+            before (float): Only episodes stored before this monotonic time (e.g. to
+                            skip ones already shown as recent history).
+        """
+        dhash = getattr(signature, "dhash", signature)
+        terms = keywords(text)
+        with self.lock:
+            self.queries += 1
+            total = len(self.entries)
+            if not total:
+                return []
+
+            scores = {}
+            for term in terms:
+                ids = self.term_index.get(term)
+                if not ids:
+                    continue
+                idf = math.log(1.0 + total / len(ids))
+                for entry_id in islice(reversed(ids), self.max_postings):
+                    scores[entry_id] = scores.get(entry_id, 0.0) + idf
+
+            if dhash is not None:
+                seen = set()
+                for key in self._bands(dhash):
+                    for entry_id in islice(reversed(self.hash_index.get(key, {})), self.max_postings):
+                        if entry_id in seen:
+                            continue
+                        seen.add(entry_id)
+                        distance = (self.entries[entry_id].dhash ^ dhash).bit_count()
+                        if distance <= self.max_hamming:
+                            similarity = 1.0 - distance / (self.max_hamming + 1)
+                            scores[entry_id] = scores.get(entry_id, 0.0) + self.frame_weight * similarity
+
+            if before is not None:
+                scores = {i: v for i, v in scores.items() if self.entries[i].t < before}
+            self.candidates_scored += len(scores)
+            # Ties go to the newer episode (higher id)
+            best = heapq.nlargest(k, scores.items(), key=lambda kv: (kv[1], kv[0]))
+            results = []
+            for entry_id, _ in best:
+                entry = self.entries[entry_id]
+                entry.recalls += 1
+                self.entries.move_to_end(entry_id)
+                results.append(entry)
+            return results
+
+    def recall_context(self, text="", signature=None, k=3, before=None):
+        """Prompt-ready block of the top-k relevant episodes, or "" if none match."""
+        entries = self.query(text, signature, k, before)
+        if not entries:
+            return ""
+        now = time.monotonic()
+        lines = [f"- [{now - e.t:.0f}s ago] Action: {e.action} -> Result: {e.result}" for e in entries]
+        return "Relevant Past:\n" + "\n".join(lines) + "\n"
+
+    def stats(self):
+        return {
+            "episodes": len(self.entries),
+            "keywords": len(self.term_index),
+            "queries": self.queries,
+            "avg_candidates": self.candidates_scored / self.queries if self.queries else 0.0,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def _bands(dhash):
+        return [(band, (dhash >> (band * BAND_BITS)) & BAND_MASK) for band in range(HASH_BANDS)]
+
+    def _evict(self):
+        entry_id, entry = self.entries.popitem(last=False)
+        self.evictions += 1
+        for term in entry.terms:
+            ids = self.term_index[term]
+            del ids[entry_id]
+            if not ids:
+                del self.term_index[term]
+        if entry.dhash is not None:
+            for key in self._bands(entry.dhash):
+                ids = self.hash_index[key]
+                del ids[entry_id]
+                if not ids:
+                    del self.hash_index[key]
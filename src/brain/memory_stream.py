@@ -1,43 +1,161 @@
-from datetime import datetime
 import json
+import time
+
+class Episode:
+    """
+    One logged event. `t` is time.monotonic(); `line` is its rendered prompt line, filled
+    lazily; `entry` is its MemoryEntry in the long-term store, if any.
+    """
+    __slots__ = ("seq", "t", "action", "result", "line", "entry")
+
+    def __init__(self, seq, t, action, result):
+        self.seq = seq
+        self.t = t
+        self.action = action
+        self.result = result
+        self.line = None
+        self.entry = None
+
+    def to_dict(self):
+        return {"seq": self.seq, "t": self.t, "action": self.action, "result": self.result}
 
 class EpisodicMemory:
-    def __init__(self, max_context=5):
-        self.history = []
-        self.max_context = max_context
-        
-    def add_episode(self, action, result=""):
+    def __init__(self, max_context=5, capacity=20, log_path=None, flush_every=32, long_term=None):
+        """
+        Fixed-capacity ring buffer of recent episodes.
+
+        Args:
+            max_context (int): Episodes included in get_recent_context().
+            capacity (int): Episodes kept in memory; the oldest is overwritten when full.
+            log_path (str): Optional append-only JSON-lines log of every episode (for long sessions).
+            flush_every (int): Episodes buffered before the log is flushed to disk.
+            long_term (LongTermMemory): Optional indexed store that also receives every
+                                        episode, for relevance recall beyond `capacity`.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.max_context = min(max_context, capacity)
+
+        self.slots = [None] * capacity
+        self.next_seq = 0  # Total episodes ever added; slot of episode n is n % capacity
+        self.start_time = time.monotonic()
+        self.wall_start = time.time()  # Wall clock at start_time, for the disk log
+
+        self.context = "No recent history."
+        self.context_seq = 0  # next_seq when `context` was rendered
+
+        self.log_file = open(log_path, "a", encoding="utf-8") if log_path else None
+        self.flush_every = flush_every
+        self.unflushed = 0
+        self.long_term = long_term
+
+    def __len__(self):
+        return min(self.next_seq, self.capacity)
+
+    def add_episode(self, action, result="", signature=None):
         """
-        Logs an event.
+        Logs an event. O(1): writes one ring slot, no formatting.
         Args:
             action (str): The high level action taken (e.g. "Walk Forward")
             result (str): The visual result (e.g. "Hit Wall")
+            signature (FrameSignature): Scene fingerprint, indexed by the long-term store.
         """
-        event = {
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
-            "action": action,
-            "result": result
-        }
-        self.history.append(event)
-        
-        # Keep size distinct
-        if len(self.history) > 20:
-             self.history.pop(0)
+        episode = Episode(self.next_seq, time.monotonic(), action, result)
+        self.slots[self.next_seq % self.capacity] = episode
+        self.next_seq += 1
+        if self.long_term is not None:
+            episode.entry = self.long_term.add(action, result, signature)
+
+        if self.log_file is not None:
+            record = episode.to_dict()
+            record["wall"] = self.wall_start + (episode.t - self.start_time)
+            self.log_file.write(json.dumps(record) + "\n")
+            self.unflushed += 1
+            if self.unflushed >= self.flush_every:
+                self.flush()
+        return episode
+
+    def set_result(self, episode, result):
+        """
+        Replaces an episode's result once it is known (e.g. the observed outcome of its
+        actions, which finish after the episode was logged). The disk log gets an
+        {"seq", "result", "update": true} record rather than a rewrite.
+        """
+        episode.result = result
+        episode.line = None
+        self.context_seq = -1  # Re-render on the next get_recent_context()
+        if self.long_term is not None and episode.entry is not None:
+            self.long_term.set_result(episode.entry, result)
+        if self.log_file is not None:
+            self.log_file.write(json.dumps({"seq": episode.seq, "result": result, "update": True}) + "\n")
+            self.unflushed += 1
+            if self.unflushed >= self.flush_every:
+                self.flush()
+
+    def recent(self, n=None):
+        """Returns up to `n` (default: all kept) episodes, oldest first."""
+        count = len(self) if n is None else min(n, len(self))
+        return [self.slots[seq % self.capacity] for seq in range(self.next_seq - count, self.next_seq)]
 
     def get_recent_context(self):
-        """Returns string formatted for LLM Prompt."""
-        recent = self.history[-self.max_context:]
-        if not recent:
-            return "No recent history."
-            
-        context_str = "Recent Actions:\n"
-        for item in recent:
-            context_str += f"- [{item['timestamp']}] Action: {item['action']} -> Result: {item['result']}\n"
-            
-        return context_str
+        """
+        Returns string formatted for LLM Prompt.
+        Cached: only re-rendered after new episodes, and each episode's line is formatted once.
+        """
+        if self.context_seq == self.next_seq:
+            return self.context
+
+        recent = self.recent(self.max_context)
+        if recent:
+            for episode in recent:
+                if episode.line is None:
+                    episode.line = (f"- [+{episode.t - self.start_time:.1f}s] "
+                                    f"Action: {episode.action} -> Result: {episode.result}")
+            self.context = "Recent Actions:\n" + "\n".join(e.line for e in recent) + "\n"
+        else:
+            self.context = "No recent history."
+        self.context_seq = self.next_seq
+        return self.context
+
+    def recall_context(self, text="", signature=None, k=3):
+        """
+        Relevant older episodes from the long-term store ("" without one), excluding
+        those already in get_recent_context().
+        """
+        if self.long_term is None:
+            return ""
+        recent = self.recent(self.max_context)
+        before = recent[0].t if recent else None
+        return self.long_term.recall_context(text, signature, k, before)
+
+    def clear(self):
+        self.slots = [None] * self.capacity
+        self.next_seq = 0
+        self.context = "No recent history."
+        self.context_seq = 0
+
+    def flush(self):
+        if self.log_file is not None:
+            self.log_file.flush()
+            self.unflushed = 0
+
+    def close(self):
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    @staticmethod
+    def read_log(path):
+        """Yields the episode dicts (and set_result() updates) of an on-disk log, oldest first."""
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
 
 if __name__ == "__main__":
     mem = EpisodicMemory()
     mem.add_episode("Walk Forward", "Smooth movement")
-    mem.add_episode("Jump", "Saw Lava")
+    episode = mem.add_episode("Jump", "Saw Lava")
+    mem.set_result(episode, "Saw Lava, stuck (walked but the view didn't change)")
     print(mem.get_recent_context())
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from src.utils.tracing import tracer
+
+class PrefixState:
+    """
+    A prefilled static prompt prefix. `data` is backend-specific (e.g. the MLX KV cache
+    and its token ids); VisionBrain only passes it back to the backend that made it.
+    """
+    __slots__ = ("key", "prefix", "data", "tokens", "prefill_seconds")
+
+    def __init__(self, prefix, data=None, tokens=0):
+        self.key = None
+        self.prefix = prefix
+        self.data = data
+        self.tokens = tokens
+        self.prefill_seconds = 0.0
+
+class PrefixCache:
+    """
+    Keeps the KV state of the static prompt prefix (system prompt + template headers)
+    so each thought only prefills the history text and image tokens.
+    Keyed on (backend/model, prefix text): changing either invalidates it.
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.state = None
+        self.unsupported_key = None
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.saved_seconds = 0.0
+
+    def get(self, backend, prefix):
+        """Returns a PrefixState for `prefix`, prefilling on a miss, or None if unsupported/disabled."""
+        if not self.enabled:
+            return None
+        key = (backend.cache_key(), prefix)
+        with self.lock:
+            if self.state is not None and self.state.key == key:
+                self.hits += 1
+                self.saved_seconds += self.state.prefill_seconds
+                return self.state
+            if self.unsupported_key == key:
+                return None
+
+            if self.state is not None:
+                self.invalidations += 1
+            self.misses += 1
+            self.state = None
+
+            start = time.monotonic()
+            with tracer.span("prefix_prefill", "brain"):
+                state = backend.prefill(prefix)
+            if state is None:
+                self.unsupported_key = key
+                return None
+            state.key = key
+            state.prefill_seconds = time.monotonic() - start
+            self.state = state
+            return state
+
+    def invalidate(self):
+        with self.lock:
+            if self.state is not None:
+                self.invalidations += 1
+            self.state = None
+            self.unsupported_key = None
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "prefix_tokens": self.state.tokens if self.state else 0,
+            "prefill_ms": self.state.prefill_seconds * 1000.0 if self.state else 0.0,
+            "saved_s": self.saved_seconds,
+        }
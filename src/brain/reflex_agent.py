@@ -4,38 +4,55 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from src.control.input_mgr import InputManager
+from src.control.motor_scheduler import MotorScheduler
+from src.control.reflexes import ReflexMonitor
+from src.vision.capture_plan import CapturePlan
+from src.vision.frame_ring import CaptureThread
+from src.vision.sources import QuartzSource
 
 class ReflexAgent:
-    def __init__(self):
+    def __init__(self, rate=60.0, capture_source=None, capture_fps=60):
         self.input = InputManager()
+        self.motor = MotorScheduler(self.input)
+        if capture_source is None:
+            capture_source = QuartzSource(title="Minecraft", plan=CapturePlan())
+        self.eyes = CaptureThread(capture_source, fps=capture_fps)
+        self.reflexes = ReflexMonitor(self.eyes, self.motor)
+        self.rate = rate
         self.is_running = False
 
+    def tick(self):
+        """One control step. Runs on the motor thread at `rate` Hz, on absolute deadlines."""
+        # Brain Layer: Decide functionality
+        # For now: Hold W, unless a hazard reaction (back off, stop, jump) is running
+        if not self.reflexes.active():
+            self.input.key_down('w')
+
     def start(self):
         self.is_running = True
         print("Reflex Agent Started. Walking forward in 3 seconds...")
         print("Click into Minecraft NOW.")
         time.sleep(3)
         
+        # Deadline-paced control loop: no drift from per-iteration sleep rounding
+        task = self.motor.every(1.0 / self.rate, self.tick)
+        self.eyes.start()
+        self.reflexes.start()
+        self.motor.start()
         try:
-            while self.is_running and self.input.is_active():
-                # Non-blocking control loop (60Hz target)
-                start_time = time.time()
-                
-                # Brain Layer: Decide functionality
-                # For now: Just hold W
-                self.input.key_down('w')
-                
-                # Maintain loop rate
-                # Sleep small amount to yield but not block for long
-                elapsed = time.time() - start_time
-                sleep_time = max(0, (1.0/60.0) - elapsed)
-                time.sleep(sleep_time)
-
+            while self.is_running and not self.input.stop_event.wait(0.1):
+                pass
         except KeyboardInterrupt:
             pass
         finally:
+            self.motor.cancel_event(task)
+            self.reflexes.stop()
+            self.eyes.stop()
+            self.motor.stop()
             print("Reflex Agent Stopped.")
             self.input.key_up('w') # Release key on exit
+            print(f"Reflex pacing: {self.motor.stats()}")
+            print(f"Reflexes: {self.reflexes.stats()}")
 
 if __name__ == "__main__":
     agent = ReflexAgent()
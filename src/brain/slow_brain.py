@@ -1,55 +1,221 @@
-import mlx.core as mx
-from mlx_vlm import load, generate
-from mlx_vlm.prompt_utils import apply_chat_template
-from mlx_vlm.utils import load_image
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from src.brain.backends import InferenceBackend, MLXBackend, make_backend
+from src.brain.prefix_cache import PrefixCache
+from src.utils.tracing import tracer
+from src.vision.convert import frame_to_pil
+
+SYSTEM_PROMPT = (
+    "You are an intelligent Minecraft Agent. "
+    "Your goal is to survive and thrive. "
+    "Analyze the image and the recent history. "
+    "Output a concise logic chain and a final ACTION."
+)
+
+def traced_stream(stream):
+    """Passes a text stream through, recording 'prefill' (to first token) and 'decode' spans."""
+    start = time.perf_counter()
+    first = None
+    pieces = 0
+    try:
+        for text in stream:
+            if first is None:
+                first = time.perf_counter()
+                tracer.record("prefill", start, first, "brain")
+            pieces += 1
+            yield text
+    finally:
+        if first is not None:
+            tracer.record("decode", first, time.perf_counter(), "brain", pieces=pieces)
+        stream.close()
 
 class VisionBrain:
-    def __init__(self, model_path="mlx-community/Llama-3.2-11B-Vision-Instruct-4bit"):
-        print(f"Loading Slow Brain: {model_path}...")
-        self.model, self.processor = load(model_path)
-        print("Slow Brain Loaded.")
+    def __init__(self, model_path="mlx-community/Llama-3.2-11B-Vision-Instruct-4bit", backend=None,
+                 system_prompt=SYSTEM_PROMPT, prefix_cache=True):
+        """
+        Args:
+            model_path (str): Model for the default MLX backend.
+            backend: InferenceBackend instance, or a name for make_backend ('mlx', 'stub').
+                     Defaults to MLX. mlx / mlx_vlm are only imported by MLXBackend, so the
+                     stub runs on machines without them.
+            system_prompt (str): Static instructions sent with every thought.
+            prefix_cache (bool): Prefill the static prompt prefix once and reuse its KV cache.
+        """
+        if backend is None or backend == "mlx":
+            backend = MLXBackend(model_path)
+        elif not isinstance(backend, InferenceBackend):
+            backend = make_backend(backend)
+        self.backend = backend
+        self.system_prompt = system_prompt
+        self.prefix_cache = PrefixCache(enabled=prefix_cache)
+
+    def warm_up(self, frame_size=(640, 360)):
+        """
+        Runs a one-token inference on a blank frame so kernel compilation and
+        allocator growth happen now instead of during the first real thought.
+        Returns:
+            float: Seconds spent warming up.
+        """
+        w, h = frame_size
+        start = time.monotonic()
+        image = frame_to_pil(np.zeros((h, w, 3), dtype=np.uint8))
+        self._generate(self._build_prompt("None."), image, max_tokens=1)  # Also prefills the prefix
+        return time.monotonic() - start
 
-    def see_and_think(self, image_path, history_context=""):
+    def see_and_think(self, image, history_context="", max_tokens=100):
         """
         Analyzes the image and history to produce a high-level goal.
         Args:
-            image_path (str): Path to the temporary screenshot.
+            image: BGR numpy frame straight from ScreenCapture (preferred, no disk I/O),
+                   a PIL image, or a file path (fallback).
             history_context (str): Text describing recent actions/results.
+            max_tokens (int): Generation limit.
         Returns:
             str: The generated thought/plan.
         """
+        with tracer.span("prompt_build", "brain"):
+            prompt = self._build_prompt(history_context)
         
-        system_prompt = (
-            "You are an intelligent Minecraft Agent. "
-            "Your goal is to survive and thrive. "
-            "Analyze the image and the recent history. "
-            "Output a concise logic chain and a final ACTION."
-        )
+        try:
+            with tracer.span("to_pil", "brain"):
+                image = self._prepare_image(image)
+        except Exception as e:
+             return f"Error loading image: {e}"
+
+        if tracer.enabled:
+            # Streamed so prefill (time to first token) and decode are traced separately
+            return "".join(traced_stream(self._stream(prompt, image, max_tokens)))
+        return self._generate(prompt, image, max_tokens=max_tokens)
+
+    def see_and_think_batch(self, images, history_contexts, max_tokens=100):
+        """
+        Batched see_and_think for several agents sharing this brain.
+        Returns:
+            list: One thought (or error string) per input, in order.
+        """
+        results = [None] * len(images)
+        prompts, prepared, slots = [], [], []
+        for i, (image, history) in enumerate(zip(images, history_contexts)):
+            try:
+                prepared.append(self._prepare_image(image))
+            except Exception as e:
+                results[i] = f"Error loading image: {e}"
+                continue
+            prompts.append(self._build_prompt(history))
+            slots.append(i)
+
+        if prompts:
+            with tracer.span("inference_batch", "brain", batch=len(prompts)):
+                outputs = self.backend.generate_batch(
+                    prompts, prepared, max_tokens=max_tokens, prefix_state=self._prefix_state()
+                )
+            for i, text in zip(slots, outputs):
+                results[i] = text
+        return results
+
+    def think_stream(self, image, history_context="", max_tokens=100):
+        """
+        Streaming variant of see_and_think: yields text pieces as tokens are decoded.
+        Closing the generator early (e.g. once the ACTION is complete) stops generation.
+        Args:
+            image: Same inputs as see_and_think.
+            history_context (str): Text describing recent actions/results.
+        Yields:
+            str: Newly decoded text.
+        """
+        with tracer.span("prompt_build", "brain"):
+            prompt = self._build_prompt(history_context)
         
+        try:
+            with tracer.span("to_pil", "brain"):
+                image = self._prepare_image(image)
+        except Exception as e:
+             yield f"Error loading image: {e}"
+             return
+
+        stream = self._stream(prompt, image, max_tokens)
+        yield from (traced_stream(stream) if tracer.enabled else stream)
+
+    def _stream(self, prompt, image, max_tokens):
+        """Backend stream with the prefix cache, falling back to a full prefill if reuse fails."""
+        state = self._prefix_state()
+        if state is not None:
+            emitted = False
+            try:
+                for text in self.backend.stream(prompt, image, max_tokens=max_tokens, prefix_state=state):
+                    emitted = True
+                    yield text
+                return
+            except Exception as e:
+                if emitted:
+                    raise
+                self._disable_prefix_cache(e)
+
+        yield from self.backend.stream(prompt, image, max_tokens=max_tokens)
+
+    def _prefix_state(self):
+        """Prefilled KV state for the static prefix (None on unsupported backends)."""
+        return self.prefix_cache.get(self.backend, self._prompt_prefix())
+
+    def _disable_prefix_cache(self, error):
+        print(f"Brain: Prefix cache reuse failed ({error}). Falling back to full prefill.")
+        self.prefix_cache.enabled = False
+        self.prefix_cache.invalidate()
+
+    def _generate(self, prompt, image, max_tokens):
+        state = self._prefix_state()
+        if state is not None:
+            try:
+                return self.backend.generate(prompt, image, max_tokens=max_tokens, prefix_state=state)
+            except Exception as e:
+                self._disable_prefix_cache(e)
+        return self.backend.generate(prompt, image, max_tokens=max_tokens)
+
+    def _prompt_prefix(self):
+        """
+        Static start of every prompt: system turn plus the user header. Identical across
+        thoughts, so its KV cache is computed once (see PrefixCache).
+        """
+        return (
+            f"<|begin_of_text|><|start_header_id|>system<|end_header_id|>\n\n{self.system_prompt}<|eot_id|>"
+            f"<|start_header_id|>user<|end_header_id|>\n\n"
+        )
+
+    def _build_prompt(self, history_context):
+        """Builds the Llama 3.2 Vision chat prompt for one thought."""
         user_content = f"History: {history_context}\nWhat should I do next?"
         
         # Manual Prompt Construction for Llama 3.2 Vision
-        # apply_chat_template seems to be failing to handle the list[dict] content structure correctly
-        # content = f"<|image|>\n{user_content}"
-        # prompt = f"<|begin_of_text|><|start_header_id|>user<|end_header_id|>\n\n{content}<|eot_id|><|start_header_id|>assistant<|end_header_id|>\n\n"
-        
-        # Simpler approach matching mlx-vlm examples for Llama 3.2:
-        prompt = f"<|begin_of_text|><|start_header_id|>user<|end_header_id|>\n\n<|image|>\n{user_content}<|eot_id|><|start_header_id|>assistant<|end_header_id|>\n\n"
+        # apply_chat_template seems to be failing to handle the list[dict] content structure correctly,
+        # so the template is written out: static prefix, then the per-thought image + history.
+        prompt = (
+            f"{self._prompt_prefix()}<|image|>\n{user_content}<|eot_id|>"
+            f"<|start_header_id|>assistant<|end_header_id|>\n\n"
+        )
         
-        # Explicitly load image to ensure valid data
-        try:
-             image = load_image(image_path)
-        except Exception as e:
-             return f"Error loading image: {e}"
+        return prompt
 
-        output = generate(self.model, self.processor, prompt, image, max_tokens=100, verbose=False)
-        return output
+    def _prepare_image(self, image):
+        """Turns any supported image input into the RGB PIL image the backend expects."""
+        if isinstance(image, Image.Image):
+            return image
+        if isinstance(image, (str, os.PathLike)):
+            # Explicitly load image to ensure valid data
+            return self.backend.load_image(str(image))
+        return frame_to_pil(image)
 
 if __name__ == "__main__":
-    # fast test
-    print("Testing VisionBrain initialization (requires actual model download first run)...")
+    import sys
+
+    # fast test: `python -m src.brain.slow_brain stub` runs without the model
+    backend = sys.argv[1] if len(sys.argv) > 1 else "mlx"
+    print(f"Testing VisionBrain initialization with '{backend}' backend (mlx downloads the model on first run)...")
     try:
-        brain = VisionBrain()
+        brain = VisionBrain(backend=backend)
         print("Success.")
     except Exception as e:
         print(f"Failed to load: {e}")
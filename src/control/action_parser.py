@@ -0,0 +1,451 @@
+import re
+
+# --- Tunables ---
+DEFAULT_MOVE_SECONDS = 2.0
+DEFAULT_CROUCH_SECONDS = 1.0
+DEFAULT_TURN_DEGREES = 45.0
+DEFAULT_LOOK_DEGREES = 30.0
+SECONDS_PER_BLOCK = 1.0 / 4.3     # Walking speed ~4.3 blocks/s
+
+FINAL_MARKER = "action:"
+
+class Action:
+    """
+    One typed motor intent parsed from a thought.
+    kind: move | turn | look | jump | stop | wait | attack | interact |
+          crouch | sprint | hotbar | inventory
+    """
+    __slots__ = ("kind", "direction", "degrees", "duration", "slot")
+
+    def __init__(self, kind, direction=None, degrees=None, duration=None, slot=None):
+        self.kind = kind
+        self.direction = direction
+        self.degrees = degrees
+        self.duration = duration
+        self.slot = slot
+
+    def _fields(self):
+        return (self.kind, self.direction, self.degrees, self.duration, self.slot)
+
+    def __eq__(self, other):
+        return isinstance(other, Action) and self._fields() == other._fields()
+
+    def __repr__(self):
+        args = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__[1:] if getattr(self, k) is not None)
+        return f"Action({self.kind!r}{', ' + args if args else ''})"
+
+# Verb word -> action kind. Words in none of these tables are filler and ignored.
+VERBS = {
+    "walk": "move", "move": "move", "go": "move", "approach": "move", "advance": "move", "head": "move",
+    "strafe": "move",
+    "retreat": "move", "flee": "move",
+    "turn": "turn", "rotate": "turn", "face": "turn", "spin": "turn",
+    "look": "look",
+    "jump": "jump", "hop": "jump",
+    "stop": "stop", "halt": "stop",
+    "wait": "wait", "pause": "wait", "stay": "wait", "idle": "wait",
+    "attack": "attack", "hit": "attack", "break": "attack", "mine": "attack", "punch": "attack",
+    "dig": "attack", "chop": "attack", "fight": "attack", "kill": "attack",
+    "place": "interact", "use": "interact", "eat": "interact", "interact": "interact", "build": "interact",
+    "left click": "attack", "right click": "interact",  # Single tokens, see TOKEN_RE
+    "crouch": "crouch", "sneak": "crouch",
+    "sprint": "sprint", "run": "sprint",
+    "inventory": "inventory",
+    "hotbar": "hotbar", "slot": "hotbar", "select": "hotbar", "switch": "hotbar", "equip": "hotbar",
+    "wield": "hotbar",
+}
+# "press"/"hold" take their meaning from what follows: a slot ("press 5", "hold the
+# sword") selects the hotbar, a movement key ("hold W for 2 seconds") is that action,
+# anything else ("hold left click") leaves them filler.
+KEY_VERBS = {"press", "presses", "pressing", "pressed", "hold", "holds", "holding", "held", "tap", "taps", "tapping"}
+# Key -> (kind, direction). Not 'a': after "hold" it is far more often the article.
+KEYS = {"w": ("move", "forward"), "s": ("move", "back"), "d": ("move", "right"),
+        "space": ("jump", None), "spacebar": ("jump", None), "shift": ("crouch", None)}
+ARTICLES = {"the", "a", "an", "my", "your", "down"}  # Skipped looking past a key verb ("hold down W")
+# Verbs whose movement isn't forward by default ("retreat from the lava")
+VERB_DIRECTIONS = {"retreat": "back", "flee": "back"}
+DIRECTIONS = {
+    "forward": "forward", "forwards": "forward", "ahead": "forward", "straight": "forward",
+    "back": "back", "backward": "back", "backwards": "back",
+    "left": "left", "right": "right", "up": "up", "down": "down", "around": "around",
+    "away": "back",  # "walk away from the edge", "run away", "turn away"
+}
+# Where the agent keeps its tools: "equip the sword" selects slot 1. Only binds to hotbar verbs.
+HOTBAR_ITEMS = {
+    "sword": 1, "pickaxe": 2, "pick": 2, "axe": 3, "shovel": 4, "spade": 4,
+    "food": 9, "bread": 9, "steak": 9, "apple": 9,
+}
+NEGATIONS = {"not", "don't", "dont", "never", "avoid", "can't", "cannot", "shouldn't", "won't"}
+NEGATION_REACH = 3  # A negation only applies to a verb within this many words
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+UNITS = {
+    "degree": "deg", "degrees": "deg", "deg": "deg", "°": "deg",
+    "second": "sec", "seconds": "sec", "sec": "sec", "secs": "sec", "s": "sec",
+    "block": "block", "blocks": "block",
+}
+
+def _inflections(verb):
+    forms = {verb, verb + "s", verb + "es", verb + "ing", verb + "ed"}
+    if verb.endswith("e"):
+        forms |= {verb[:-1] + "ing", verb + "d"}
+    if len(verb) >= 3 and verb[-1] not in "aeiouwy" and verb[-2] in "aeiou" and verb[-3] not in "aeiou":
+        forms |= {verb + verb[-1] + "ing", verb + verb[-1] + "ed"}  # run -> running
+    return forms
+
+# "walking", "turned", "running" resolve to their verb without a stemmer at parse time
+VERB_FORMS = {form: kind for verb, kind in VERBS.items() for form in _inflections(verb)}
+VERB_FORMS.update(VERBS)
+VERB_DIRECTION_FORMS = {form: d for verb, d in VERB_DIRECTIONS.items() for form in _inflections(verb)}
+
+# One compiled scanner; the automaton below consumes its matches left to right.
+# Idioms that look like directions ("right now") are matched first and dropped.
+# Mouse buttons are one token, so "left click" is an attack rather than a turn.
+TOKEN_RE = re.compile(r"(right (?:now|away)|all right)|((?:left|right)[ -]?click[a-z]*)|(\d+(?:\.\d+)?)"
+                      r"|([a-z']+|°)|([.!?;,\n])")
+
+# Phrase boundaries. A '.' between digits is a decimal point, not a boundary.
+PHRASE_END_RE = re.compile(r"[!?;,\n]|\.(?!\d)")
+# What may sit between the marker and the action itself: "**ACTION:**\n- Turn left"
+MARKER_LEAD_RE = re.compile(r"[\s*_#>`-]*")
+
+def tokenize(text):
+    """Yields (type, value) tokens: ('num', float), ('word', str) or ('sep', str)."""
+    for idiom, click, num, word, sep in TOKEN_RE.findall(text.lower()):
+        if idiom:
+            continue
+        if click:
+            yield "word", "left click" if click.startswith("left") else "right click"
+        elif num:
+            yield "num", float(num)
+        elif word:
+            yield "word", word
+        else:
+            yield "sep", sep
+
+class _Builder:
+    """Automaton state for a single phrase."""
+    def __init__(self, out):
+        self.out = out
+        self.current = None
+        self.negated = 0       # Words left in which a negation still applies
+        self.skipping = False  # Negated verb: drop its modifiers too
+        self.number = None     # Pending number awaiting a unit
+        self.purpose = False   # Just saw "to" after an action: "hold right click to eat"
+
+    def word(self):
+        """Any filler word: lets a pending negation expire."""
+        if self.negated:
+            self.negated -= 1
+        self.purpose = False
+
+    def to(self):
+        self.word()
+        self.purpose = self.current is not None and not self.skipping
+
+    def verb(self, kind, direction=None):
+        if self.purpose and self.current.kind == kind:
+            # "press W to move forward": the purpose restates the action, it isn't a second one
+            self.purpose = False
+            return
+        self.purpose = False
+        number = self.number if self.current is None else None  # "5 on the hotbar"
+        self.flush()
+        if self.negated:
+            self.skipping = True
+            self.negated = 0
+            return
+        self.skipping = False
+        self.current = Action(kind)
+        if kind == "move":
+            self.current.direction = direction or "forward"
+        elif kind == "hotbar" and number is not None and 1 <= number <= 9:
+            self.current.slot = int(number)
+
+    def item(self, slot):
+        """A tool/food word: picks its hotbar slot for a slotless hotbar verb, else filler."""
+        cur = self.current
+        if cur is not None and cur.kind == "hotbar" and cur.slot is None and not self.skipping:
+            cur.slot = slot
+        else:
+            self.word()
+
+    def direction(self, d):
+        if self.skipping:
+            return
+        if self.negated:
+            self.negated = 0
+            self.skipping = True
+            return
+        cur = self.current
+        if cur is None or cur.kind not in ("move", "turn", "look", "sprint"):
+            # Bare direction: "left" means turn left, "forward" means walk
+            self.flush()
+            kind = "look" if d in ("up", "down") else "turn" if d in ("left", "right", "around") else "move"
+            cur = self.current = Action(kind)
+        if cur.kind == "turn" and d in ("up", "down"):
+            cur.kind = "look"
+        elif cur.kind == "look" and d in ("left", "right", "around"):
+            cur.kind = "turn"
+        if cur.kind == "turn" and d == "back":
+            d = "around"
+        elif cur.kind == "sprint" and d == "back":
+            cur.kind = "move"  # Minecraft can't sprint backwards: "run away" just backs off
+        cur.direction = d
+
+    def num(self, value):
+        self.purpose = False
+        self.number = value
+        cur = self.current
+        if cur is None or self.skipping:
+            return
+        # Unitless numbers bind by action type
+        if cur.kind == "hotbar" and 1 <= value <= 9 and cur.slot is None:
+            cur.slot = int(value)
+            self.number = None
+
+    def unit(self, unit):
+        cur = self.current
+        if cur is None or self.number is None or self.skipping:
+            return
+        if unit == "deg" and cur.kind in ("turn", "look"):
+            cur.degrees = self.number
+        elif unit == "sec":
+            cur.duration = self.number
+        elif unit == "block" and cur.kind in ("move", "sprint"):
+            cur.duration = self.number * SECONDS_PER_BLOCK
+        self.number = None
+
+    def flush(self):
+        cur = self.current
+        if cur is not None and not self.skipping:
+            if self.number is not None:
+                # Trailing bare number: degrees for turns, seconds for timed actions
+                if cur.kind in ("turn", "look") and cur.degrees is None:
+                    cur.degrees = self.number
+                elif cur.kind in ("move", "sprint", "wait", "crouch") and cur.duration is None:
+                    cur.duration = self.number
+            # Drop intents with nothing to execute ("select the sword", "face the tree")
+            if cur.kind == "hotbar":
+                keep = cur.slot is not None
+            elif cur.kind in ("turn", "look"):
+                keep = cur.direction is not None or cur.degrees is not None
+            else:
+                keep = True
+            if keep:
+                self.out.append(cur)
+        self.current = None
+        self.number = None
+
+    def separator(self):
+        self.flush()
+        self.negated = 0
+        self.skipping = False
+
+def _key_target(tokens, i):
+    """
+    What the key verb at tokens[i] acts on: ('hotbar', None, i) for a slot number, 'slot',
+    'hotbar' or a hotbar item (parsed on as usual), (kind, direction, index of the key
+    token) for a key, else None.
+    """
+    for j in range(i + 1, min(i + 4, len(tokens))):
+        kind, value = tokens[j]
+        if kind == "num":
+            return ("hotbar", None, i) if 1 <= value <= 9 else None
+        if kind != "word":
+            return None
+        if value in ARTICLES:
+            continue
+        if value in ("slot", "hotbar") or value in HOTBAR_ITEMS or value in NUMBER_WORDS:
+            return "hotbar", None, i
+        return KEYS[value] + (j,) if value in KEYS else None
+    return None
+
+def _parse_segment(text, out):
+    b = _Builder(out)
+    tokens = list(tokenize(text))
+    skip_to = -1  # Tokens up to here were consumed by a key verb ("hold down W")
+    for i, (kind, value) in enumerate(tokens):
+        if i <= skip_to:
+            continue
+        if kind == "sep":
+            b.separator()
+        elif kind == "num":
+            b.num(value)
+        elif value in KEY_VERBS:
+            target = _key_target(tokens, i)
+            if target is None:
+                b.word()
+            else:
+                b.verb(target[0], target[1])
+                skip_to = target[2]
+        elif value == "to":
+            b.to()
+        elif value in VERB_FORMS:
+            b.verb(VERB_FORMS[value], VERB_DIRECTION_FORMS.get(value))
+        elif value in DIRECTIONS:
+            b.direction(DIRECTIONS[value])
+        elif value in UNITS:
+            b.unit(UNITS[value])
+        elif value in NUMBER_WORDS:
+            b.num(float(NUMBER_WORDS[value]))
+        elif value in NEGATIONS:
+            b.negated = NEGATION_REACH
+        elif value in HOTBAR_ITEMS:
+            b.item(HOTBAR_ITEMS[value])
+        else:
+            b.word()
+    b.flush()
+    return out
+
+def final_action_segment(text):
+    """
+    The text the model committed to: from the first "ACTION:" to the end of the
+    first non-empty line after it, every sentence of it ("ACTION: Jump! Then walk
+    forward."). Whitespace and markdown after the marker are skipped, so the action
+    may sit on its own line. Falls back to the whole text if the model didn't use
+    the marker.
+    """
+    lower = text.lower()
+    i = lower.find(FINAL_MARKER)
+    if i < 0:
+        return text
+    start = MARKER_LEAD_RE.match(text, i + len(FINAL_MARKER)).end()
+    end = text.find("\n", start)
+    return text[start:end + 1] if end >= 0 else text[start:]
+
+def parse_actions(text):
+    """
+    Parses a thought into a typed list of Actions in a single pass over the text.
+    Only the final ACTION line is used when present, so reasoning like
+    "I shouldn't walk into the lava" doesn't queue movement.
+    """
+    return _parse_segment(final_action_segment(text), [])
+
+def to_commands(actions):
+    """
+    Lowers typed Actions to the (cmd, value) tuples the act loop executes.
+    Turns stay in degrees, ("turn", (yaw, pitch)); InputManager converts them with its
+    calibrated pixels-per-degree.
+    """
+    cmds = []
+    move_keys = {"forward": "w", "back": "s", "left": "a", "right": "d"}
+    for a in actions:
+        k = a.kind
+        if k == "move":
+            key = move_keys.get(a.direction, "w")
+            cmds += [("key_down", key), ("wait", a.duration or DEFAULT_MOVE_SECONDS), ("key_up", key)]
+        elif k == "sprint":
+            key = move_keys.get(a.direction, "w")
+            cmds += [("key_down", "ctrl"), ("key_down", key),
+                     ("wait", a.duration or DEFAULT_MOVE_SECONDS),
+                     ("key_up", key), ("key_up", "ctrl")]
+        elif k == "turn":
+            degrees = a.degrees if a.degrees is not None else (180.0 if a.direction == "around" else DEFAULT_TURN_DEGREES)
+            sign = -1 if a.direction == "left" else 1
+            cmds.append(("turn", (sign * degrees, 0.0)))
+        elif k == "look":
+            degrees = a.degrees if a.degrees is not None else DEFAULT_LOOK_DEGREES
+            sign = -1 if a.direction == "up" else 1
+            cmds.append(("turn", (0.0, sign * degrees)))
+        elif k == "jump":
+            cmds.append(("press", "space"))
+        elif k == "stop":
+            cmds += [("key_up", key) for key in ("w", "a", "s", "d")]
+        elif k == "wait":
+            if a.duration:
+                cmds.append(("wait", a.duration))
+            else:
+                cmds.append(("key_up", "w"))  # Bare "wait" means hold still
+        elif k == "attack":
+            cmds.append(("attack", None))
+        elif k == "interact":
+            cmds.append(("interact", None))
+        elif k == "crouch":
+            cmds += [("key_down", "shift"), ("wait", a.duration or DEFAULT_CROUCH_SECONDS), ("key_up", "shift")]
+        elif k == "hotbar":
+            cmds.append(("hotbar", a.slot))
+        elif k == "inventory":
+            cmds.append(("inventory", None))
+    return cmds
+
+class IncrementalActionParser:
+    """
+    Parses a thought while it is still being generated.
+    Text before the "ACTION:" marker is held back (it's reasoning); after the marker,
+    feed() returns Actions for each phrase as soon as it completes, and `done` flips
+    when the ACTION line ends so generation can stop. A newline (or markdown)
+    right after the marker doesn't end it: the action may be on the next line.
+    If the model never writes the marker, finish() parses the whole text.
+    """
+    SEGMENT_END = "\n"
+
+    def __init__(self):
+        self.parts = []
+        self.pending = ""
+        self.in_final = False
+        self.in_action = False  # Past the whitespace/markdown that may follow the marker
+        self.done = False
+
+    @property
+    def text(self):
+        return "".join(self.parts) + self.pending
+
+    def feed(self, chunk):
+        """Adds newly generated text. Returns list of new Actions."""
+        if self.done:
+            return []
+        self.pending += chunk
+        actions = []
+
+        if not self.in_final:
+            i = self.pending.lower().find(FINAL_MARKER)
+            if i < 0:
+                # Keep a tail in case the marker is split across chunks
+                keep = len(FINAL_MARKER) - 1
+                if len(self.pending) > keep:
+                    self.parts.append(self.pending[:-keep])
+                    self.pending = self.pending[-keep:]
+                return actions
+            self.in_final = True
+            self.parts.append(self.pending[:i + len(FINAL_MARKER)])
+            self.pending = self.pending[i + len(FINAL_MARKER):]
+
+        if not self.in_action:
+            lead = MARKER_LEAD_RE.match(self.pending).end()
+            self.parts.append(self.pending[:lead])
+            self.pending = self.pending[lead:]
+            if not self.pending:
+                return actions  # Only the lead so far: wait for the action text
+            self.in_action = True
+
+        # Only consume up to the last phrase boundary; a word may still be half-generated
+        start = 0
+        for m in PHRASE_END_RE.finditer(self.pending):
+            if m.end() == len(self.pending) and m.start() > 0 and self.pending[m.start() - 1].isdigit():
+                break  # "1." may still become "1.5"
+            _parse_segment(self.pending[start:m.end()], actions)
+            start = m.end()
+            if m.group() == self.SEGMENT_END:
+                self.done = True
+                break
+
+        if start:
+            self.parts.append(self.pending[:start])
+            self.pending = self.pending[start:]
+        return actions
+
+    def finish(self):
+        """Flushes what's left at end of generation."""
+        if self.done:
+            return []
+        self.done = True
+        if self.in_final:
+            actions = _parse_segment(self.pending, [])
+            self.parts.append(self.pending)
+            self.pending = ""
+            return actions
+        # No marker at all: fall back to the whole thought
+        return parse_actions(self.text)
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from src.control.mouse_motion import DEFAULT_PIXELS_PER_DEGREE, MouseMotion
+
+class FakeInput:
+    """
+    InputManager stand-in for headless runs and benchmarks: same interface, but
+    events are only recorded as (monotonic time, kind, value). No pynput / display needed.
+    """
+    def __init__(self, smooth_mouse=True, mouse_rate=120.0, pixels_per_degree=DEFAULT_PIXELS_PER_DEGREE,
+                 max_events=100000):
+        self.stop_event = threading.Event()
+        self.events = []
+        self.max_events = max_events
+        self.held = set()
+        self.lock = threading.Lock()
+        self.motion = MouseMotion(self._move_mouse_raw, rate=mouse_rate, pixels_per_degree=pixels_per_degree)
+        if smooth_mouse:
+            self.motion.start()
+
+    def _record(self, kind, value=None):
+        with self.lock:
+            if len(self.events) < self.max_events:
+                self.events.append((time.monotonic(), kind, value))
+
+    def is_active(self):
+        return not self.stop_event.is_set()
+
+    def stop(self):
+        """Same effect as pressing ESC on the real InputManager."""
+        self.stop_event.set()
+        self.motion.cancel()
+
+    def key_down(self, key):
+        if not self.is_active(): return
+        self.held.add(key)
+        self._record("key_down", key)
+
+    def key_up(self, key):
+        self.held.discard(key)
+        self._record("key_up", key)
+
+    def press_key(self, key, duration=0.1):
+        self.key_down(key)
+        time.sleep(duration)
+        self.key_up(key)
+
+    def move_mouse(self, dx, dy, duration=None):
+        if not self.is_active(): return
+        self.motion.add(dx, dy, duration)
+
+    def turn(self, yaw, pitch=0.0, duration=None):
+        if not self.is_active(): return
+        self.motion.turn(yaw, pitch, duration)
+
+    def _move_mouse_raw(self, dx, dy):
+        self._record("mouse_move", (dx, dy))
+
+    def attack(self):
+        self._record("attack")
+
+    def interact(self):
+        self._record("interact")
+
+    def hotbar(self, slot_idx):
+        if 1 <= slot_idx <= 9:
+            self.press_key(str(slot_idx), duration=0.05)
+
+    def inventory(self):
+        self.press_key('e', duration=0.05)
+
+    def count(self, kind=None):
+        with self.lock:
+            return len(self.events) if kind is None else sum(1 for e in self.events if e[1] == kind)
@@ -3,12 +3,29 @@ from pynput.mouse import Button, Controller as MouseController
 import time
 import threading
 
+from src.control.mouse_motion import DEFAULT_PIXELS_PER_DEGREE, MouseMotion
+from src.utils.tracing import tracer
+
 class InputManager:
-    def __init__(self, kill_key=Key.esc):
+    def __init__(self, kill_key=Key.esc, smooth_mouse=True, mouse_rate=120.0, easing="ease_in_out",
+                 pixels_per_degree=DEFAULT_PIXELS_PER_DEGREE):
+        """
+        Args:
+            kill_key: Emergency stop key.
+            smooth_mouse (bool): Spread and coalesce mouse moves (MouseMotion) instead of
+                                 sending each one as a single jump.
+            mouse_rate (float): Mouse motion ticks per second.
+            easing (str): Mouse motion easing curve ('linear', 'ease_out', 'ease_in_out').
+            pixels_per_degree (float): Camera calibration used by turn().
+        """
         self.keyboard = KeyboardController()
         self.mouse = MouseController()
         self.stop_event = threading.Event()
         self.kill_key = kill_key
+        self.motion = MouseMotion(self._move_mouse_raw, rate=mouse_rate, easing=easing,
+                                  pixels_per_degree=pixels_per_degree)
+        if smooth_mouse:
+            self.motion.start()
         
         # Start the failsafe listener in a non-blocking way
         self.listener = Listener(on_press=self._on_press)
@@ -20,17 +37,26 @@ class InputManager:
         if key == self.kill_key:
             print(f"\n[FAILSAFE] {self.kill_key} pressed! Stopping all input...")
             self.stop_event.set()
+            self.motion.cancel()
             return False # Stop listener
 
+    def _resolve_key(self, key):
+        """Accepts 'w', Key.space, or special key names like 'space' / 'shift' / 'ctrl'."""
+        if isinstance(key, str) and len(key) > 1:
+            return getattr(Key, key)
+        return key
+
     def key_down(self, key):
         """Hold a key down."""
         if not self.is_active(): return
-        self.keyboard.press(key)
+        with tracer.span("key_down", "input", key=str(key)):
+            self.keyboard.press(self._resolve_key(key))
 
     def key_up(self, key):
         """Release a key."""
         # Always allow releasing keys even if stopped, to prevent stuck keys
-        self.keyboard.release(key)
+        with tracer.span("key_up", "input", key=str(key)):
+            self.keyboard.release(self._resolve_key(key))
 
     def is_active(self):
         """Check if we are allowed to proceed."""
@@ -56,13 +82,24 @@ class InputManager:
             
         self.key_up(char_or_key)
 
-    def move_mouse(self, dx, dy):
+    def move_mouse(self, dx, dy, duration=None):
         """
         Moves the mouse relative to current position.
-        Crucial for Minecraft 3D camera control.
+        Crucial for Minecraft 3D camera control. Smoothed and coalesced by MouseMotion;
+        `duration` overrides how long the move is spread over.
         """
         if not self.is_active(): return
-        self.mouse.move(dx, dy)
+        self.motion.add(dx, dy, duration)
+
+    def turn(self, yaw, pitch=0.0, duration=None):
+        """Turns the camera by degrees (positive yaw = right, positive pitch = down)."""
+        if not self.is_active(): return
+        self.motion.turn(yaw, pitch, duration)
+
+    def _move_mouse_raw(self, dx, dy):
+        if not self.is_active(): return
+        with tracer.span("mouse_move", "input", dx=dx, dy=dy):
+            self.mouse.move(dx, dy)
 
     def click(self, button=Button.left):
         if not self.is_active(): return
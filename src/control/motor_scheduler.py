@@ -0,0 +1,462 @@
+import heapq
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from src.utils.tracing import tracer
+
+PRESS_SECONDS = 0.1  # 'press' key taps, as InputManager.press_key
+TAP_SECONDS = 0.05  # hotbar / inventory taps
+
+class MotorEvent:
+    """One timed motor primitive. Periodic tasks (interval set) reschedule themselves."""
+    __slots__ = ("due", "seq", "plan", "cmd", "val", "interval", "cancelled", "tag", "queued_at")
+
+    def __init__(self, due, seq, plan, cmd, val, interval=None, tag=None):
+        self.due = due
+        self.seq = seq
+        self.plan = plan
+        self.cmd = cmd
+        self.val = val
+        self.interval = interval
+        self.cancelled = False
+        self.tag = tag  # Caller's id for tracing (e.g. the thought that queued it)
+        self.queued_at = time.monotonic()
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+class PlanInfo:
+    """
+    A submitted plan's version: the frame it was planned from (seq, monotonic capture
+    time), its scheduled span and how many of its events haven't run or been dropped.
+    """
+    __slots__ = ("plan", "frame", "frame_time", "start", "end", "chained", "remaining", "started", "dropped")
+
+    def __init__(self, plan, frame, frame_time, start, end, chained, remaining):
+        self.plan = plan
+        self.frame = frame
+        self.frame_time = frame_time
+        self.start = start
+        self.end = end
+        self.chained = chained  # Submitted with after_pending (counts towards plan_end)
+        self.remaining = remaining
+        self.started = False
+        self.dropped = None  # 'stale' or 'superseded' once dropped unexecuted
+
+def lower_commands(commands):
+    """
+    Turns a sequential (cmd, val) list (see action_parser.to_commands) into a timeline.
+    'wait' only advances the clock and taps become a key_down/key_up pair, so nothing
+    on the timeline blocks.
+    Returns:
+        (list of (offset_seconds, cmd, val), total_seconds)
+    """
+    timeline = []
+    t = 0.0
+    for cmd, val in commands:
+        if cmd == "wait":
+            t += val
+        elif cmd in ("press", "hotbar", "inventory"):
+            if cmd == "hotbar":
+                if not 1 <= val <= 9:
+                    continue
+                key, hold = str(val), TAP_SECONDS
+            elif cmd == "inventory":
+                key, hold = "e", TAP_SECONDS
+            else:
+                key, hold = val, PRESS_SECONDS
+            timeline.append((t, "key_down", key))
+            timeline.append((t + hold, "key_up", key))
+            t += hold
+        elif cmd in ("key_down", "key_up", "mouse_move", "turn", "attack", "interact"):
+            timeline.append((t, cmd, val))
+        else:
+            raise ValueError(f"Unknown motor command '{cmd}'")
+    return timeline, t
+
+class MotorScheduler:
+    """
+    Deadline-driven motor thread. Key holds, releases and mouse moves from any number
+    of plans sit in one heap ordered by monotonic due time, so overlapping plans run
+    concurrently and a 'wait' costs exactly its duration. Sleeps until just before the
+    next deadline, then spins the last `spin` seconds for precise timing.
+
+    Keys are reference-counted per plan: cancelling a plan releases whatever it holds,
+    and one plan's key_up doesn't release a key another plan still holds.
+
+    Plans can carry the frame they were planned from. A plan from a newer frame
+    supersedes older ones that haven't started yet (they're dropped), and with
+    `preempt_after` set, also cuts a running one whose frame is that much older
+    (releasing its keys). With `max_plan_age` set, a plan whose frame is older than
+    that when it comes due is dropped instead of acting on outdated perception.
+    """
+    def __init__(self, body, spin=0.002, late_threshold=0.005, verbose=False, max_plan_age=None,
+                 preempt_after=None):
+        """
+        Args:
+            body: InputManager (or anything with key_down/key_up/move_mouse/turn/attack/interact).
+            spin (float): Seconds before a deadline to stop sleeping and busy-wait.
+            late_threshold (float): Events later than this count as late in stats().
+            verbose (bool): Print each executed command.
+            max_plan_age (float): Drop plans whose source frame is older than this many
+                                  seconds when their first event comes due (None = never).
+            preempt_after (float): A plan whose frame is at least this many seconds newer
+                                   than a running plan's cancels it (None = never).
+        """
+        self.body = body
+        self.spin = spin
+        self.late_threshold = late_threshold
+        self.verbose = verbose
+        self.max_plan_age = max_plan_age
+        self.preempt_after = preempt_after
+
+        self.heap = []
+        self.cond = threading.Condition()
+        self.running = False
+        self.thread = None
+        self.next_seq = 0
+        self.next_plan = 1
+        self.pending = 0  # Scheduled, not yet run or cancelled, plan events (not periodic tasks)
+        self.plan_end = 0.0  # Due time of the last event submitted with after_pending
+        self.held = {}  # key -> {plan: depth}
+        self.plans = {}  # plan -> PlanInfo, until all its events have run or been dropped
+        self.inflight = None  # Event popped off the heap, spinning or running (cancel() must see it too)
+
+        self.lateness = deque(maxlen=2000)  # Seconds each event ran after its due time
+        self.executed = 0
+        self.cancelled = 0
+        self.late = 0
+        self.overruns = 0  # Periodic ticks skipped because a tick ran past the next deadline
+        self.errors = 0
+        self.submitted = 0
+        self.dropped_stale = 0
+        self.dropped_superseded = 0
+        self.preempted = 0  # Running plans cut by a plan from a newer frame
+        self.plan_ages = deque(maxlen=1000)  # Seconds from source frame to first event, for started plans
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="MotorScheduler", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        """Stops the thread, drops everything pending and releases all held keys."""
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        if self.thread:
+            self.thread.join(timeout)
+        self.cancel()
+        self._release_all()
+
+    def schedule(self, cmd, val=None, at=None, plan=0):
+        """Schedules one primitive at monotonic time `at` (default: now)."""
+        return self._push(time.monotonic() if at is None else at, plan, cmd, val)
+
+    def submit(self, commands, after_pending=True, tag=None, frame=None, frame_time=None):
+        """
+        Schedules a sequential command list as one plan.
+        Args:
+            commands (list): (cmd, val) tuples from action_parser.to_commands.
+            after_pending (bool): Start when the previously submitted plan ends (streamed
+                                  phrases of one thought), instead of now (concurrently).
+            tag: Id attached to the plan's trace spans (e.g. the thought id).
+            frame (int): Seq of the frame the plan was made from. Unstarted plans from
+                         older frames are dropped as superseded.
+            frame_time (float): That frame's monotonic capture time, for max_plan_age and
+                                preempt_after.
+        Returns:
+            int: Plan id, for cancel().
+        """
+        timeline, duration = lower_commands(commands)
+        if frame_time is not None and self.preempt_after is not None:
+            with self.cond:
+                running = [info.plan for info in self.plans.values()
+                           if info.started and info.frame_time is not None
+                           and frame_time - info.frame_time >= self.preempt_after]
+                self.preempted += len(running)
+            for old in running:
+                self.cancel(old)  # Releases its keys; its unstarted events go too
+        with self.cond:
+            plan = self.next_plan
+            self.next_plan += 1
+            self.submitted += 1
+            if frame is not None:
+                for info in list(self.plans.values()):
+                    if not info.started and info.frame is not None and info.frame < frame:
+                        self._drop_locked(info.plan)
+                        info.dropped = "superseded"
+                        self.dropped_superseded += 1
+            now = time.monotonic()
+            start = max(now, self.plan_end) if after_pending and self.pending else now
+            for offset, cmd, val in timeline:
+                self._push_locked(start + offset, plan, cmd, val, tag)
+            if timeline:
+                self.plans[plan] = PlanInfo(plan, frame, frame_time, start, start + duration,
+                                            after_pending, len(timeline))
+            if after_pending:
+                self.plan_end = max(self.plan_end, start + duration)
+        return plan
+
+    def every(self, interval, fn, start=None):
+        """
+        Calls fn() every `interval` seconds on absolute deadlines (no drift). Ticks that
+        would start late because the previous one overran are skipped and counted.
+        Returns the task's MotorEvent (pass to cancel_event to stop it).
+        """
+        first = time.monotonic() if start is None else start
+        with self.cond:
+            event = MotorEvent(first, self._seq(), None, "call", fn, interval)
+            heapq.heappush(self.heap, event)
+            self.cond.notify()
+        return event
+
+    def cancel_event(self, event):
+        with self.cond:
+            if not event.cancelled:
+                if event.interval is None:
+                    self._cancel_locked(event)
+                else:
+                    event.cancelled = True
+
+    def cancel(self, plan=None):
+        """Drops pending events of `plan` (default: every plan) and releases keys it holds."""
+        with self.cond:
+            for event in self.heap:
+                if event.cancelled or event.interval is not None:
+                    continue
+                if plan is None or event.plan == plan:
+                    self._cancel_locked(event)
+            event = self.inflight
+            if (event is not None and not event.cancelled and event.interval is None
+                    and (plan is None or event.plan == plan)):
+                self._cancel_locked(event)
+            release = [key for key, plans in self.held.items() if plan is None or plan in plans]
+        for key in release:
+            self._key_up(key, plan, drop=True)
+
+    def busy(self):
+        """True while any plan still has events pending."""
+        return self.pending > 0
+
+    def plan_info(self, plan):
+        """PlanInfo of a plan still pending, or None."""
+        with self.cond:
+            return self.plans.get(plan)
+
+    def stats(self):
+        lateness = np.array(self.lateness) * 1000.0 if self.lateness else np.zeros(1)
+        ages = np.array(self.plan_ages) * 1000.0 if self.plan_ages else np.zeros(1)
+        return {
+            "executed": self.executed,
+            "pending": self.pending,
+            "cancelled": self.cancelled,
+            "late": self.late,
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "plans": self.submitted,
+            "dropped_stale": self.dropped_stale,
+            "dropped_superseded": self.dropped_superseded,
+            "preempted": self.preempted,
+            "drop_rate": (self.dropped_stale + self.dropped_superseded) / self.submitted if self.submitted else 0.0,
+            "plan_age_ms_p50": float(np.percentile(ages, 50)),
+            "jitter_ms_p50": float(np.percentile(lateness, 50)),
+            "jitter_ms_p95": float(np.percentile(lateness, 95)),
+            "jitter_ms_max": float(lateness.max()),
+        }
+
+    def _seq(self):
+        self.next_seq += 1
+        return self.next_seq
+
+    def _push(self, due, plan, cmd, val):
+        with self.cond:
+            return self._push_locked(due, plan, cmd, val)
+
+    def _push_locked(self, due, plan, cmd, val, tag=None):
+        event = MotorEvent(due, self._seq(), plan, cmd, val, tag=tag)
+        heapq.heappush(self.heap, event)
+        self.pending += 1
+        self.cond.notify()
+        return event
+
+    def _cancel_locked(self, event):
+        event.cancelled = True
+        self.pending -= 1
+        self.cancelled += 1
+        self._event_done_locked(event)
+
+    def _event_done_locked(self, event):
+        """Bookkeeping once a plan event has run or been cancelled."""
+        info = self.plans.get(event.plan)
+        if info is not None:
+            info.remaining -= 1
+            if info.remaining <= 0:
+                del self.plans[event.plan]
+        if not self.pending:
+            self.plan_end = 0.0
+        elif info is not None and info.remaining <= 0 and info.chained and info.end >= self.plan_end:
+            # The last chained plan is gone early: later submissions needn't wait for its end
+            self.plan_end = max((i.end for i in self.plans.values() if i.chained), default=0.0)
+
+    def _drop_locked(self, plan):
+        """Cancels every pending event of a plan that hasn't started (so holds no keys)."""
+        for event in self.heap:
+            if event.plan == plan and not event.cancelled and event.interval is None:
+                self._cancel_locked(event)
+
+    def _admit(self, event):
+        """
+        Called as each plan event comes due: marks its plan started, or drops the whole
+        plan if its source frame is older than max_plan_age. False if dropped.
+        """
+        with self.cond:
+            info = self.plans.get(event.plan)
+            if info is None or info.started:
+                return True
+            age = time.monotonic() - info.frame_time if info.frame_time is not None else None
+            if self.max_plan_age is not None and age is not None and age > self.max_plan_age:
+                self._cancel_locked(event)  # Already popped off the heap
+                self._drop_locked(event.plan)
+                info.dropped = "stale"
+                self.dropped_stale += 1
+                return False
+            info.started = True
+            if age is not None:
+                self.plan_ages.append(age)
+            return True
+
+    def _next_due(self):
+        """Blocks until the earliest event is (almost) due and pops it. None once stopped."""
+        with self.cond:
+            while self.running:
+                while self.heap and self.heap[0].cancelled:
+                    heapq.heappop(self.heap)
+                if not self.heap:
+                    self.cond.wait()
+                    continue
+                remaining = self.heap[0].due - time.monotonic()
+                if remaining > self.spin:
+                    self.cond.wait(remaining - self.spin)
+                    continue
+                self.inflight = heapq.heappop(self.heap)
+                return self.inflight
+            return None
+
+    def _run(self):
+        while True:
+            event = self._next_due()
+            if event is None:
+                return
+            while time.monotonic() < event.due:
+                time.sleep(0)  # Spin the last stretch, yielding the GIL
+            if event.interval is None and not event.cancelled and not self._admit(event):
+                continue
+            with self.cond:
+                run = not event.cancelled  # Re-checked under the lock: cancel() marks the in-flight event too
+            if run:
+                if tracer.enabled and event.cmd != "call":
+                    with tracer.context(thought=event.tag), tracer.span(
+                            "motor", "act", cmd=event.cmd, plan=event.plan,
+                            late_ms=(time.monotonic() - event.due) * 1000.0,
+                            queued_ms=(time.monotonic() - event.queued_at) * 1000.0):
+                        self._execute(event)
+                else:
+                    self._execute(event)
+            with self.cond:
+                self.inflight = None
+                # Counted as pending until it has run, so busy() covers the last event too
+                if event.interval is None:
+                    if not event.cancelled:
+                        self.pending -= 1
+                        self._event_done_locked(event)
+                    elif not self.pending:
+                        self.plan_end = 0.0
+
+    def _execute(self, event):
+        late = time.monotonic() - event.due
+        self.lateness.append(late)
+        self.executed += 1
+        if late > self.late_threshold:
+            self.late += 1
+
+        try:
+            if event.cmd == "call":
+                event.val()
+            elif event.cmd == "key_down":
+                self._key_down(event.val, event.plan, event)
+            elif event.cmd == "key_up":
+                self._key_up(event.val, event.plan)
+            elif event.cmd == "mouse_move":
+                self.body.move_mouse(event.val[0], event.val[1])
+            elif event.cmd == "turn":
+                self.body.turn(event.val[0], event.val[1])
+            elif event.cmd == "attack":
+                self.body.attack()
+            elif event.cmd == "interact":
+                self.body.interact()
+            if self.verbose and event.cmd != "call":
+                print(f"Act: Executed {event.cmd} {event.val if event.val is not None else ''} ({late * 1000:.1f} ms late)")
+        except Exception as e:
+            self.errors += 1
+            print(f"Act Error: {e}")
+
+        if event.interval is not None and not event.cancelled:
+            now = time.monotonic()
+            due = event.due + event.interval
+            if now > due:
+                skipped = int((now - due) // event.interval) + 1
+                self.overruns += skipped
+                due += skipped * event.interval
+            with self.cond:
+                event.due = due
+                event.seq = self._seq()
+                heapq.heappush(self.heap, event)
+                self.cond.notify()
+
+    def _key_down(self, key, plan, event=None):
+        with self.cond:
+            if event is not None and event.cancelled:
+                return
+            plans = self.held.setdefault(key, {})
+            first = not plans
+            plans[plan] = plans.get(plan, 0) + 1
+        if first:
+            self.body.key_down(key)
+            if event is not None and event.cancelled:
+                # cancel() ran between the hold and the press (and may have released already)
+                self._key_up(key, plan, drop=True)
+
+    def _key_up(self, key, plan=None, drop=False):
+        """
+        Releases one of `plan`'s holds on `key` (all of them if `drop`, every plan's if
+        plan is None). The key physically goes up once no holds remain.
+        """
+        with self.cond:
+            plans = self.held.get(key)
+            if plans is None:
+                release = True  # Not tracked (e.g. held before the scheduler): just release
+            else:
+                if plan is None:
+                    plans.clear()
+                elif plan in plans:
+                    plans[plan] = 0 if drop else plans[plan] - 1
+                    if plans[plan] <= 0:
+                        del plans[plan]
+                release = not plans
+                if release:
+                    del self.held[key]
+        if release:
+            self.body.key_up(key)
+
+    def _release_all(self):
+        with self.cond:
+            keys = list(self.held)
+        for key in keys:
+            self._key_up(key)
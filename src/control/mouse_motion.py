@@ -0,0 +1,195 @@
+import math
+import threading
+import time
+
+DEFAULT_PIXELS_PER_DEGREE = 200.0 / 45.0  # Matches the old fixed 200 px turn for 45 degrees
+
+# Progress (0..1 of the stroke's time) -> fraction of its distance covered
+EASINGS = {
+    "linear": lambda p: p,
+    "ease_out": lambda p: 1.0 - (1.0 - p) * (1.0 - p),
+    "ease_in_out": lambda p: p * p * (3.0 - 2.0 * p),
+}
+
+class Stroke:
+    """One requested relative move, spread over `duration` seconds from `start`."""
+    __slots__ = ("start", "duration", "dx", "dy", "sent")
+
+    def __init__(self, start, duration, dx, dy):
+        self.start = start
+        self.duration = duration
+        self.dx = dx
+        self.dy = dy
+        self.sent = 0.0  # Eased fraction already emitted
+
+class MouseMotion:
+    """
+    Smooth relative mouse motion at a fixed tick rate.
+    Every pending stroke contributes its eased delta for the tick and the sum goes
+    out as ONE mouse move, so back-to-back requests coalesce and large turns are
+    spread over several frames instead of a single jump Minecraft may drop or
+    overshoot. Each tick is capped at `max_step` pixels per axis; the excess (and
+    sub-pixel remainders) carry over to the next ticks, so the total is exact.
+    """
+    def __init__(self, move_fn, rate=120.0, speed=2000.0, max_duration=0.3, max_step=40,
+                 easing="ease_in_out", pixels_per_degree=DEFAULT_PIXELS_PER_DEGREE):
+        """
+        Args:
+            move_fn (callable): move_fn(dx, dy) sends one raw relative move.
+            rate (float): Ticks per second while moving.
+            speed (float): Pixels per second a stroke covers (sets its duration).
+            max_duration (float): Longest a single stroke may take, however large.
+            max_step (int): Largest raw move per tick while running (pixels, per axis).
+            easing (str): 'linear', 'ease_out' or 'ease_in_out'.
+            pixels_per_degree (float): Camera calibration for turn().
+        """
+        if easing not in EASINGS:
+            raise ValueError(f"Unknown easing '{easing}'. Options: {sorted(EASINGS)}")
+        self.move_fn = move_fn
+        self.interval = 1.0 / rate
+        self.speed = speed
+        self.max_duration = max_duration
+        self.max_step = max_step
+        self.ease = EASINGS[easing]
+        self.pixels_per_degree = pixels_per_degree
+
+        self.strokes = []
+        self.carry_x = 0.0
+        self.carry_y = 0.0
+        self.cond = threading.Condition()
+        self.running = False
+        self.thread = None
+
+        self.requested = 0  # add() calls
+        self.events = 0  # Raw moves sent
+        self.largest_step = 0  # Largest single raw move sent (pixels, either axis)
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="MouseMotion", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, flush=True):
+        """Stops the motion thread; by default whatever is left of pending strokes is sent at once."""
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        if self.thread:
+            self.thread.join(1.0)
+        if flush:
+            self.flush()
+
+    def add(self, dx, dy, duration=None):
+        """
+        Queues a relative move. Runs immediately when the engine isn't started.
+        Args:
+            duration (float): Seconds to spread it over. Default: distance / speed,
+                              capped at max_duration; under one tick it's sent next tick.
+        """
+        if duration is None:
+            duration = min(math.hypot(dx, dy) / self.speed, self.max_duration)
+        with self.cond:
+            self.requested += 1
+            if not self.running:
+                self.strokes.append(Stroke(0.0, 0.0, dx, dy))
+                move = self._step(time.monotonic(), limit=False)
+            else:
+                self.strokes.append(Stroke(time.monotonic(), duration if duration >= self.interval else 0.0, dx, dy))
+                self.cond.notify()
+                return
+        if move:
+            self.move_fn(*move)
+
+    def turn(self, yaw, pitch=0.0, duration=None):
+        """Turns the camera by degrees (positive yaw = right, positive pitch = down)."""
+        self.add(yaw * self.pixels_per_degree, pitch * self.pixels_per_degree, duration)
+
+    def calibrate(self, pixels, degrees):
+        """Sets pixels_per_degree from a measured turn (e.g. 1200 px moved the view 180 degrees)."""
+        self.pixels_per_degree = pixels / degrees
+
+    def cancel(self):
+        """Drops pending strokes (e.g. on emergency stop)."""
+        with self.cond:
+            self.strokes = []
+            self.carry_x = self.carry_y = 0.0
+
+    def flush(self):
+        """Sends the remainder of every pending stroke now, as one move."""
+        with self.cond:
+            for stroke in self.strokes:
+                stroke.duration = 0.0
+            move = self._step(time.monotonic(), limit=False)
+        if move:
+            self.move_fn(*move)
+
+    def idle(self):
+        """True when nothing is left to send (no strokes, no carried pixels)."""
+        return not self.strokes and abs(self.carry_x) < 0.5 and abs(self.carry_y) < 0.5
+
+    def stats(self):
+        return {
+            "requested": self.requested,
+            "events": self.events,
+            "pending": len(self.strokes),
+            "largest_step_px": self.largest_step,
+        }
+
+    def _step(self, now, limit=True):
+        """
+        Sums every stroke's eased delta up to `now` into the carry and takes one move
+        out of it (capped at max_step unless `limit` is False).
+        Returns an integer (dx, dy) or None. Caller holds cond.
+        """
+        fx = fy = 0.0
+        remaining = []
+        for stroke in self.strokes:
+            p = 1.0 if stroke.duration <= 0 else min(1.0, (now - stroke.start) / stroke.duration)
+            done = 1.0 if p >= 1.0 else self.ease(p)
+            delta = done - stroke.sent
+            stroke.sent = done
+            fx += stroke.dx * delta
+            fy += stroke.dy * delta
+            if p < 1.0:
+                remaining.append(stroke)
+        self.strokes = remaining
+
+        self.carry_x += fx
+        self.carry_y += fy
+        ix, iy = int(round(self.carry_x)), int(round(self.carry_y))
+        if limit:
+            ix = max(-self.max_step, min(self.max_step, ix))
+            iy = max(-self.max_step, min(self.max_step, iy))
+        if not ix and not iy:
+            return None
+        self.carry_x -= ix
+        self.carry_y -= iy
+        self.events += 1
+        self.largest_step = max(self.largest_step, abs(ix), abs(iy))
+        return ix, iy
+
+    def _run(self):
+        next_tick = None
+        while True:
+            with self.cond:
+                while self.running and self.idle():
+                    next_tick = None
+                    self.cond.wait()
+                if not self.running:
+                    return
+            now = time.monotonic()
+            if next_tick is None:
+                next_tick = now
+            elif now < next_tick:
+                time.sleep(next_tick - now)
+
+            with self.cond:
+                move = self._step(time.monotonic())
+            if move:
+                self.move_fn(*move)
+
+            # Absolute deadlines; after a stall resume from now instead of bursting
+            next_tick = max(next_tick + self.interval, time.monotonic())
@@ -0,0 +1,161 @@
+import math
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from src.utils.tracing import tracer
+from src.vision.detectors import default_detectors
+
+# Reaction -> motor commands, run immediately after dropping whatever was queued
+REACTIONS = {
+    "stop": [("key_up", "w"), ("key_up", "a"), ("key_up", "s"), ("key_up", "d"), ("key_up", "ctrl")],
+    "back_off": [("key_up", "w"), ("key_up", "a"), ("key_up", "d"), ("key_up", "ctrl"),
+                 ("key_down", "s"), ("wait", 0.4), ("key_up", "s")],
+    "jump": [("press", "space")],
+}
+
+class DetectorStats:
+    __slots__ = ("runs", "skipped", "fired", "over_budget", "times")
+
+    def __init__(self):
+        self.runs = 0
+        self.skipped = 0
+        self.fired = 0
+        self.over_budget = 0
+        self.times = deque(maxlen=1000)  # ms
+
+class ReflexMonitor:
+    """
+    Fast hazard layer: runs cheap vectorized detectors (lava, fire, void, damage flash,
+    low health) on every captured frame and preempts the motor scheduler (cancel the
+    queued plan, run the reaction) without waiting for the slow brain.
+
+    Each detector has a time budget: one that overruns it is skipped for as many
+    frames as it overran by, so a slow check can't delay the others or fall behind
+    the capture rate.
+    """
+    def __init__(self, capture, motor, detectors=None, on_reflex=None, verbose=True):
+        """
+        Args:
+            capture (CaptureThread): Frame source (HUD crops used when it has a CapturePlan).
+            motor (MotorScheduler): Scheduler to preempt.
+            detectors (list): Detector instances. Defaults to default_detectors().
+            on_reflex (callable): on_reflex(detection), called after the reaction was queued.
+        """
+        self.capture = capture
+        self.motor = motor
+        self.detectors = detectors if detectors is not None else default_detectors()
+        self.on_reflex = on_reflex
+        self.verbose = verbose
+
+        self.stats_by_name = {d.name: DetectorStats() for d in self.detectors}
+        self.skip = {d.name: 0 for d in self.detectors}
+        self.last_fired = {d.name: -math.inf for d in self.detectors}
+        self.active_until = 0.0  # Reaction in progress until then
+        self.frames = 0
+        self.frame_times = deque(maxlen=1000)  # ms for all detectors on one frame
+        self.detections = deque(maxlen=100)
+
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="ReflexMonitor", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+
+    def active(self):
+        """True while a reaction is executing: callers shouldn't queue new movement."""
+        return time.monotonic() < self.active_until
+
+    def check(self, frame, regions=None, seq=None, now=None):
+        """
+        Runs every due detector on one frame and reacts to the first that fires.
+        Returns:
+            Detection or None.
+        """
+        now = time.monotonic() if now is None else now
+        fired = None
+        frame_start = time.perf_counter()
+        for detector in self.detectors:
+            name = detector.name
+            stats = self.stats_by_name[name]
+            if self.skip[name]:
+                self.skip[name] -= 1
+                stats.skipped += 1
+                continue
+            start = time.perf_counter()
+            detection = detector.detect(frame, regions)
+            ms = (time.perf_counter() - start) * 1000.0
+            stats.runs += 1
+            stats.times.append(ms)
+            if ms > detector.budget_ms:
+                stats.over_budget += 1
+                self.skip[name] = int(ms // detector.budget_ms)
+            if detection is None or fired is not None or now - self.last_fired[name] < detector.cooldown:
+                continue
+            detection.seq, detection.t = seq, now
+            fired = detection
+        self.frames += 1
+        self.frame_times.append((time.perf_counter() - frame_start) * 1000.0)
+        if fired is not None:
+            self._react(fired)
+        return fired
+
+    def stats(self):
+        def pct(values, q):
+            return float(np.percentile(values, q)) if values else 0.0
+
+        report = {
+            "frames": self.frames,
+            "frame_ms_p50": pct(self.frame_times, 50),
+            "frame_ms_p95": pct(self.frame_times, 95),
+            "reflexes": len(self.detections),
+        }
+        for name, s in self.stats_by_name.items():
+            report[name] = {
+                "fired": s.fired,
+                "p95_ms": pct(s.times, 95),
+                "over_budget": s.over_budget,
+                "skipped": s.skipped,
+            }
+        return report
+
+    def _react(self, detection):
+        self.stats_by_name[detection.name].fired += 1
+        self.last_fired[detection.name] = detection.t
+        self.detections.append(detection)
+        commands = REACTIONS[detection.reaction]
+        duration = sum(val for cmd, val in commands if cmd == "wait")
+        self.active_until = detection.t + duration + 0.1
+        with tracer.span("reflex", "act", detector=detection.name, reaction=detection.reaction):
+            self.motor.cancel()
+            self.motor.submit(commands, after_pending=False, tag=f"reflex:{detection.name}")
+        if self.verbose:
+            print(f"Reflex: {detection.name} (score {detection.score:.2f}) -> {detection.reaction}")
+        if self.on_reflex is not None:
+            self.on_reflex(detection)
+
+    def _run(self):
+        seq = 0
+        while not self.stop_event.is_set():
+            latest = self.capture.wait_for_frame(seq, timeout=0.1, copy=False)
+            if latest is None:
+                continue
+            seq, t, frame = latest
+            crops = self.capture.latest_regions(copy=False)
+            regions = crops[2] if crops is not None and crops[0] == seq else None
+            try:
+                self.check(frame, regions, seq)
+            except Exception as e:
+                print(f"Reflex: Detector error: {e}")
@@ -1,50 +1,205 @@
 import threading
 import time
-import queue
-import cv2
-import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
+from src.brain.brain_process import BrainProcess
+from src.brain.long_term_memory import LongTermMemory
+from src.brain.memory_stream import EpisodicMemory
 from src.brain.slow_brain import VisionBrain
-from src.control.input_mgr import InputManager
-from src.vision.capture import ScreenCapture
-from src.vision.window_mgr import get_minecraft_window
+from src.control.action_parser import FINAL_MARKER, IncrementalActionParser, final_action_segment, parse_actions, to_commands
+from src.control.motor_scheduler import MotorScheduler
+from src.control.reflexes import ReflexMonitor
+from src.control.think_pacer import ThinkPacer
+from src.utils.recording import RecordedInput, Recorder
+from src.utils.tracing import tracer
+from src.vision.capture_plan import CapturePlan
+from src.vision.frame_ring import CaptureThread
+from src.vision.motion import MotionMonitor
+from src.vision.scene_cache import SceneCache, frame_signature
+from src.vision.sources import QuartzSource
+
+# Action verdicts (MotionEstimator.outcome) after which a cached thought must not be replayed
+FAILED_OUTCOMES = ("stuck", "no effect", "blocked")
 
 class SpinalCord:
-    def __init__(self):
+    def __init__(self, capture_source=None, capture_fps=30, stream_thoughts=True,
+                 model_path="mlx-community/Llama-3.2-11B-Vision-Instruct-4bit", warm_up=True, backend=None,
+                 brain=None, trace_path=None, input_manager=None, think_interval=None, record_path=None,
+                 brain_process=False, reflexes=True, motion=True, pace_target="balanced",
+                 speculate=True, max_plan_age=5.0, preempt_after=1.0):
+        """
+        Args:
+            capture_source (CaptureSource): Frame backend. Defaults to Quartz capture of the
+                                            'Minecraft' window with native-resolution HUD crops
+                                            (CapturePlan); pass SyntheticSource/ReplaySource
+                                            to run headless.
+            capture_fps (int): Rate of the background capture thread.
+            stream_thoughts (bool): Dispatch actions while the brain is still generating.
+            model_path (str): VLM to load.
+            warm_up (bool): Run a dummy inference after loading so the first thought is fast.
+            backend: Inference backend for the brain: an InferenceBackend, 'mlx' (default)
+                     or 'stub' for CPU-only runs without the model.
+            brain: Already-loaded brain to use instead of loading one, e.g. a shared
+                   VisionBrain or InferenceServer.client() so N agents share one model.
+            trace_path (str): Record per-stage latency spans and write them here as
+                              Chrome-trace JSON on shutdown (open in chrome://tracing / Perfetto).
+            input_manager: Input sink. Defaults to a real InputManager (pynput); pass
+                           FakeInput to run headless.
+            think_interval (float): Fixed pause between thoughts, in seconds. None (default)
+                                    paces adaptively instead (ThinkPacer, see pace_target).
+            record_path (str): Record frames, thoughts and input calls to this session
+                               directory for offline replay (RecordingSource / Recording).
+            brain_process (bool): Run the brain in a worker process (BrainProcess) so its
+                                  Python-side work can't stall the act loop via the GIL.
+                                  `backend` must then be a name or a picklable backend.
+            reflexes (bool): Run hazard detectors (lava, fire, void, damage, low health) on every
+                             frame and let them preempt queued actions (ReflexMonitor).
+            motion (bool): Estimate camera motion on every frame (MotionMonitor) and write what
+                           each thought's actions did ("moved", "stuck", ...) into its episode.
+            pace_target (str): Adaptive pacing preset: 'latency', 'balanced' or 'power'
+                               (PACE_TARGETS). Ignored with a fixed think_interval.
+            speculate (bool): Start the next thought while the current plan still runs and
+                              queue its plan behind it, instead of cutting the running plan
+                              when the new thought arrives. Plans carry their source frame:
+                              one from a newer frame supersedes queued older ones.
+            max_plan_age (float): Drop a plan whose source frame is older than this many
+                                  seconds by the time it would start (None = never).
+            preempt_after (float): Speculating, a plan from a frame at least this many seconds
+                                   newer cuts the running plan instead of queueing behind it
+                                   (None = never).
+        """
         print("Initializing Spinal Cord (Integration Layer)...")
+        self.init_time = time.monotonic()
+        self.brain_process = brain_process
+        self.trace_path = trace_path
+        if trace_path:
+            tracer.enabled = True
+        self.thought_id = None
+        self.thought_frame_time = None
+        self.thought_frame_seq = None
+        self.thought_frame_stamp = None  # Capture time of the thought's frame (stays set, unlike thought_frame_time)
+        self.milestones = {}  # Startup timeline: name -> seconds since __init__
         
         # 1. The Body (Fast / Real-time)
-        self.input = InputManager()
+        if input_manager is None:
+            from src.control.input_mgr import InputManager  # pynput needs a display: only import when used
+            input_manager = InputManager()
+        if capture_source is None:
+            capture_source = QuartzSource(title="Minecraft", plan=CapturePlan())
+        self.recorder = None
+        if record_path:
+            self.recorder = Recorder(record_path, capture_source.frame_shape)
+            input_manager = RecordedInput(input_manager, self.recorder)
+        self.input = input_manager
+        # Runs queued plans on deadlines; drops plans planned from stale or superseded frames
+        self.motor = MotorScheduler(self.input, verbose=True, max_plan_age=max_plan_age,
+                                    preempt_after=preempt_after if speculate else None)
+        self._mark("input_ready")
         
-        # 2. The Eyes
-        self.eyes = ScreenCapture()
-        self.window_info = None
+        # 2. The Eyes (continuous capture into a ring buffer)
+        self.eyes = CaptureThread(capture_source, fps=capture_fps, recorder=self.recorder)
+
+        # 2b. Reflexes: per-frame hazard checks that don't wait for the brain
+        self.reflexes = ReflexMonitor(self.eyes, self.motor, on_reflex=self._on_reflex) if reflexes else None
+        self.reflex_events = deque()  # Fired reflexes not yet written to memory (think thread drains)
+
+        # 2c. Motion: did the last actions move us, turn us, or nothing at all?
+        self.motion = MotionMonitor(self.eyes) if motion else None
+        self.action_window = None  # [intent kinds, start, end, PlanInfos] of the current thought's queued actions
+        self.thought_episode = None  # Episode logged for the current thought
+        self.pending_outcomes = deque(maxlen=8)  # (episode, intent, start, end, plans) waiting for a verdict
+        self.motion_settle = 0.3  # Seconds of frames after the last command still credited to it
+        self.last_outcome = ""  # Latest verdict written by _judge_actions (part of the thought-cache key)
         
-        # 3. The Brain (Slow / Async)
-        # Verify model exists or handle loading
-        try:
-            self.brain = VisionBrain()
-        except Exception as e:
-            print(f"CRITICAL: Failed to load Brain: {e}")
-            self.brain = None
+        # 3. The Brain (Slow / Async): loads in the background while body and eyes come up.
+        # brain_ready is a Future resolving to the VisionBrain (or its load error).
+        self.brain = None
+        self.brain_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BrainLoader")
+        self.brain_ready = self.brain_loader.submit(self._load_brain, model_path, warm_up, backend, brain)
+            
+        # 4. Thought cache: reuse responses when the scene, last plan and memory haven't changed
+        self.thought_cache = SceneCache(capacity=64, max_reuse=8)
+
+        # 5. Memory: recent thoughts go in every prompt, older ones only when relevant
+        self.memory = EpisodicMemory(max_context=3, long_term=LongTermMemory(capacity=5000))
             
-        self.action_queue = queue.Queue()
         self.running = True
+        self.think_thread = None
         self.latest_plan = "Idle"
+        self.stream_thoughts = stream_thoughts
+        self.think_interval = think_interval
+        self.speculate = speculate
+        if think_interval is None:
+            self.pacer = ThinkPacer(pace_target, speculate=speculate)
+        else:
+            self.pacer = ThinkPacer.fixed(think_interval)
+        self.last_signature = None  # Scene of the last thought, for the pacer's change probe
+        self.pace_seq = -1
+        self.pace_change = 0.0
+        self.thoughts = 0
+
+    def _mark(self, name):
+        """Records a startup milestone (first occurrence only)."""
+        if name not in self.milestones:
+            self.milestones[name] = time.monotonic() - self.init_time
+
+    def _load_brain(self, model_path, warm_up, backend, brain=None):
+        if brain is not None:
+            # Shared brain: already loaded (and warmed) by its owner
+            self.brain = brain
+            self._mark("brain_loaded")
+            return brain
+        if self.brain_process:
+            brain = BrainProcess(self.eyes.source.frame_shape, model_path, backend=backend)
+        else:
+            brain = VisionBrain(model_path, backend=backend)
+        self._mark("brain_loaded")
+        if warm_up:
+            seconds = brain.warm_up(self.eyes.source.target_size)
+            print(f"Brain: Warm-up inference took {seconds:.2f}s")
+            self._mark("brain_warm")
+        self.brain = brain
+        return brain
+
+    def _wait_for_brain(self):
+        """Blocks the think loop until the brain is ready. Returns None if loading failed or we stopped."""
+        while self.running and self.input.is_active():
+            try:
+                return self.brain_ready.result(timeout=0.5)
+            except FutureTimeout:
+                continue
+            except Exception as e:
+                print(f"CRITICAL: Failed to load Brain: {e}")
+                return None
+        return None
+
+    def startup_report(self):
+        """Prints and returns the startup timeline (seconds since __init__)."""
+        report = dict(sorted(self.milestones.items(), key=lambda kv: kv[1]))
+        print("Startup: " + " | ".join(f"{k} {v:.2f}s" for k, v in report.items()))
+        return report
 
     def start(self):
-        """Starts the autonomous loop."""
-        if not self.brain:
-            print("Brain not loaded. Aborting.")
+        """Starts the autonomous loop. Does not wait for the brain to finish loading."""
+        if self.brain_ready.done() and self.brain_ready.exception():
+            print(f"Brain failed to load ({self.brain_ready.exception()}). Aborting.")
             return
 
         print("Spinal Cord Active.")
         print(" [!] PRESS ESC TO KILL BOT [!]")
         
+        # Start Seeing (Background Thread)
+        self.eyes.start()
+        if self.reflexes is not None:
+            self.reflexes.start()
+        if self.motion is not None:
+            self.motion.start()
+        
         # Start Thinking (Background Thread)
-        think_thread = threading.Thread(target=self.think_loop)
-        think_thread.daemon = True
-        think_thread.start()
+        self.think_thread = threading.Thread(target=self.think_loop)
+        self.think_thread.daemon = True
+        self.think_thread.start()
         
         # Run Acting (Main Thread - blocks until ESC)
         self.act_loop()
@@ -57,124 +212,328 @@ class SpinalCord:
         3. Parse Command -> Action Queue
         """
         print("Think Loop Started.")
+        if not self.brain:
+            print("Brain: Still loading, capture and input are already live...")
+        if self._wait_for_brain() is None:
+            return
         
         while self.running and self.input.is_active():
-            # Rate limit the brain to avoid spamming if inference is fast (unlikely)
-            time.sleep(1.0) 
-            
-            # 1. Update Window Info (in case it moved)
-            if not self.window_info:
-                self.window_info = get_minecraft_window("Minecraft")
+            # Pace the brain: think when the queue runs low or the scene changes, not on a fixed clock
+            if self.pacer.wait(self._pace_inputs, self._thinking) is None:
+                break
             
-            if not self.window_info:
-                print("Brain: Waiting for 'Minecraft' window...")
-                time.sleep(2)
+            # 1-2. See: newest frame from the capture thread, no grab latency here
+            latest = self.eyes.latest()
+            if latest is None:
+                print("Brain: Waiting for first frame (is the 'Minecraft' window open?)...")
+                self.eyes.wait_for_frame(0, timeout=2.0, copy=False)  # Wakes on the first frame
                 continue
-                
-            # 2. See
-            frame = self.eyes.capture_window_exclusive(self.window_info.get('window_id'))
-            if frame is None:
+            frame_seq, frame_time, frame = latest
+            self._mark("first_frame")
+
+            # Every span recorded while thinking (and every motor event it queues) carries these ids
+            self.thought_id = tracer.next_id("thought")
+            self.thought_frame_time = frame_time
+            self.thought_frame_seq = frame_seq
+            self.thought_frame_stamp = frame_time
+            self.action_window = None
+            self.thought_episode = None
+            self.pacer.thought_started()
+            with tracer.context(thought=self.thought_id, frame=frame_seq), tracer.span(
+                    "thought", "brain", frame_age_ms=(time.monotonic() - frame_time) * 1000.0):
+                thought = self.think_once(frame)
+            if not thought:
+                # Answered from the cache: not a thought, and nothing to do until something changes
+                self.pacer.thought_skipped(self._pace_inputs()[0])
                 continue
-                
-            # Save temp for VLM
-            temp_path = "vision_temp.png"
-            cv2.imwrite(temp_path, frame)
-            
-            # 3. Think
-            history = f"Last Plan: {self.latest_plan}"
-            print("\nBrain: Thinking...")
-            response = self.brain.see_and_think(temp_path, history)
-            
+            self.pacer.thought_finished()
+            self._await_outcome()
+            self.thoughts += 1
+
+    def _thinking(self):
+        return self.running and self.input.is_active()
+
+    def _pace_inputs(self):
+        """ThinkPacer probe: seconds of queued actions left, and scene change since the last thought."""
+        now = time.monotonic()
+        queue_s = max(0.0, self.motor.plan_end - now) if self.motor.busy() else 0.0
+        latest = self.eyes.latest(copy=False)
+        if latest is not None and self.last_signature is not None and latest[0] != self.pace_seq:
+            self.pace_seq = latest[0]
+            self.pace_change = frame_signature(latest[2]).change(self.last_signature)
+        return queue_s, self.pace_change
+
+    def think_once(self, frame):
+        """
+        One thought about `frame`: cached, streamed or blocking, then queued as actions.
+        Returns:
+            bool: True if the brain ran, False if the thought came from the cache.
+        """
+        # 3. Think (frame handed over in memory, no temp file round trip)
+        self._remember_reflexes()
+        self._judge_actions()
+        signature = frame_signature(frame)
+        self.last_signature = signature
+        self.pace_change = 0.0
+        if any(word in self.last_outcome for word in FAILED_OUTCOMES):
+            response = None  # The last actions failed: the brain has to hear about it
+        else:
+            response = self.thought_cache.lookup(signature, self._plan_key())
+        history = None
+        
+        if response is not None:
+            print(f"\nBrain: Scene unchanged, reusing thought (cache hit rate {self.thought_cache.hit_rate():.0%})")
+            if self.motor.busy():
+                # Current plan still executing and still valid: leave it alone
+                return False
+        elif self.stream_thoughts:
+            # 3+4. Think and queue actions as they are generated
+            print("\nBrain: Thinking (streaming)...")
+            history = self._build_history(signature)
+            start = time.monotonic()
+            response = self.think_streaming(frame, history)
+            self.pacer.observe_latency(time.monotonic() - start)
             print(f"Brain: Thought -> '{response}'")
             self.latest_plan = response
-            
-            # 4. Parse & Queue Actions
-            self.parse_thought_to_actions(response)
+            self._remember(response, signature)
+            self.thought_cache.store(signature, self._plan_key(), response)
+            self._record_thought(response, history)
+            return True
+        else:
+            print("\nBrain: Thinking...")
+            history = self._build_history(signature)
+            start = time.monotonic()
+            response = self.brain.see_and_think(frame, history)
+            self.pacer.observe_latency(time.monotonic() - start)
+            self.latest_plan = response
+            self._remember(response, signature)
+            self.thought_cache.store(signature, self._plan_key(), response)
+        
+        print(f"Brain: Thought -> '{response}'")
+        self.latest_plan = response
+        self._record_thought(response, history)
+        
+        # 4. Parse & Queue Actions
+        self.parse_thought_to_actions(response)
+        return history is not None
 
-    def parse_thought_to_actions(self, thought_text):
+    def _plan_key(self):
         """
-        Crude parser to convert VLM natural text into Motor Actions.
-        TODO: Improve this with structured JSON output from VLM later.
+        Thought-cache key: what the last plan did ("move:forward turn:left", not its
+        wording, which differs every thought even when the plan doesn't), plus a digest
+        of memory: episodes logged so far and the latest action verdict. Stored after the
+        thought is remembered, so replaying it matches until memory learns something new.
         """
-        text = thought_text.lower()
+        actions = parse_actions(self.latest_plan)
+        plan = " ".join(f"{a.kind}:{a.direction}" if a.direction else a.kind for a in actions) or "idle"
+        return f"{plan}|{self.memory.next_seq}|{self.last_outcome}"
+
+    def _build_history(self, signature):
+        """Prompt history: last plan, the last few thoughts, and older ones relevant to this scene."""
+        # The prompt should say what the last actions did so far (speculating, they've barely begun)
+        self._judge_actions(force=not self.speculate)
+        return (f"Last Plan: {self.latest_plan}\n"
+                f"{self.memory.get_recent_context()}"
+                f"{self.memory.recall_context(self.latest_plan, signature)}")
+
+    def _record_thought(self, thought, history=None):
+        """Session event for offline replay/eval; history is None for cached (reused) thoughts."""
+        if self.recorder is not None:
+            self.recorder.add_event("thought", thought=self.thought_id, frame=self.thought_frame_seq,
+                                    history=history, text=thought)
+
+    def _remember(self, thought, signature):
+        """Logs a thought as an episode: its ACTION sentence, and the reasoning that led to it."""
+        action = final_action_segment(thought).strip()
+        i = thought.lower().find(FINAL_MARKER)
+        reasoning = thought[:i].strip() if i >= 0 else ""
+        self.thought_episode = self.memory.add_episode(action, reasoning or "-", signature)
+
+    def think_streaming(self, frame, history):
+        """
+        Streams the thought and dispatches each action as soon as its phrase is complete,
+        stopping generation once the final ACTION sentence is done.
+        Returns:
+            str: The (possibly truncated) thought text.
+        """
+        parser = IncrementalActionParser()
+        cleared = False
+        start = time.monotonic()
+        
+        stream = self.brain.think_stream(frame, history)
+        try:
+            for chunk in stream:
+                with tracer.span("parse", "brain"):
+                    actions = parser.feed(chunk)
+                if actions:
+                    if not cleared:
+                        self._clear_actions()
+                        cleared = True
+                        print(f"Brain: First action after {time.monotonic() - start:.2f}s")
+                    self._queue_actions(actions)
+                if parser.done:
+                    break
+        finally:
+            stream.close()  # Stops generation if we broke out early
         
+        with tracer.span("parse", "brain"):
+            actions = parser.finish()
+        if not cleared:
+            self._clear_actions()
+        self._queue_actions(actions)
+        return parser.text
+
+    def parse_thought_to_actions(self, thought_text):
+        """
+        Converts VLM natural text into Motor Actions via the compiled action grammar.
+        """
         # Clear previous queue actions? 
         # Yes, new thought overrides old plans usually.
         # But be careful not to jerk too much. For now, clear.
-        with self.action_queue.mutex:
-            self.action_queue.queue.clear()
-            
-        # --- Simple Heuristics ---
-        
-        # Walk Forward
-        if "walk" in text or "forward" in text or "approach" in text:
-            # Queue: Hold W for 2 seconds
-            self.action_queue.put(("key_down", "w"))
-            self.action_queue.put(("wait", 2.0))
-            self.action_queue.put(("key_up", "w"))
-            
-        # Jump
-        if "jump" in text:
-            self.action_queue.put(("press", "space"))
-            
-        # Stop / Wait
-        if "stop" in text or "wait" in text:
-            self.action_queue.put(("key_up", "w")) # Safety ensure stop
-            
-        # Turn Left/Right (Crudely)
-        if "left" in text:
-             self.action_queue.put(("mouse_move", (-200, 0)))
-        if "right" in text:
-             self.action_queue.put(("mouse_move", (200, 0)))
-
-        # Interact / Attack
-        if "break" in text or "attack" in text or "hit" in text:
-            self.action_queue.put(("attack", None))
-        if "place" in text or "use" in text:
-            self.action_queue.put(("interact", None))
+        self._clear_actions()
+        with tracer.span("parse", "brain"):
+            actions = parse_actions(thought_text)
+        self._queue_actions(actions)
+
+    def _on_reflex(self, detection):
+        """ReflexMonitor callback (reflex thread): memory is written later by the think thread."""
+        self.reflex_events.append(detection)
+
+    def _remember_reflexes(self):
+        while self.reflex_events:
+            detection = self.reflex_events.popleft()
+            self.memory.add_episode(f"Reflex: {detection.reaction.replace('_', ' ')}", f"{detection.name} detected")
+
+    def _note_actions(self, actions, info):
+        """Widens the current thought's action window (for _judge_actions) by a plan just queued."""
+        intent = {"move" if a.kind in ("move", "sprint") else "turn" if a.kind in ("turn", "look") else a.kind
+                  for a in actions}
+        now = time.monotonic()
+        start, end = (info.start, info.end) if info is not None else (now, now)
+        # The frames showing an action's effect arrive a little after its last command ran
+        end += self.motion_settle
+        if self.action_window is None:
+            self.action_window = [intent, start, end, []]
+        else:
+            self.action_window[0] |= intent
+            self.action_window[2] = max(self.action_window[2], end)
+        if info is not None:
+            self.action_window[3].append(info)
+
+    def _await_outcome(self):
+        """After a thought: its episode waits for the motion verdict on the actions it queued."""
+        if self.motion is None or self.action_window is None or self.thought_episode is None:
+            return
+        self.pending_outcomes.append((self.thought_episode, *self.action_window))
+
+    def _judge_actions(self, force=False):
+        """
+        Writes what earlier thoughts' actions did (MotionEstimator.outcome) into their episodes'
+        results, once they've finished, or with `force` over whatever has run of them so far.
+        """
+        now = time.monotonic()
+        while self.pending_outcomes:
+            episode, intent, start, end, plans = self.pending_outcomes[0]
+            if not force and now < end:
+                return
+            self.pending_outcomes.popleft()
+            if plans and all(info.dropped for info in plans):
+                outcome = f"not done (plan {plans[-1].dropped})"
+            else:
+                outcome = self.motion.outcome(start, min(now, end), intent)
+            if outcome is None:
+                continue
+            self.last_outcome = outcome
+            result = outcome if episode.result in ("", "-") else f"{outcome}; {episode.result}"
+            self.memory.set_result(episode, result)
+            print(f"Brain: '{episode.action}' -> {outcome}")
+
+    def _clear_actions(self):
+        """Cancels the pending plan and releases any keys it was holding."""
+        if self.speculate:
+            return  # The scheduler drops queued plans this one supersedes, and cuts a running one from a much older frame
+        if self.reflexes is not None and self.reflexes.active():
+            return  # Don't cut a reflex reaction short
+        self._judge_actions(force=True)  # Judged over what ran before it was cut
+        self.motor.cancel()
+
+    def _queue_actions(self, actions):
+        """Lowers typed Actions to motor commands and schedules them after the pending ones."""
+        commands = to_commands(actions)
+        if commands and self.reflexes is not None and self.reflexes.active():
+            print("Brain: Dropping actions while a reflex reaction runs")
+            commands = []
+        if commands:
+            with tracer.span("queue", "act", commands=len(commands)):
+                plan = self.motor.submit(commands, tag=self.thought_id, frame=self.thought_frame_seq,
+                                         frame_time=self.thought_frame_stamp)
+            if self.motion is not None:
+                self._note_actions(actions, self.motor.plan_info(plan))
+            if tracer.enabled and self.thought_frame_time is not None:
+                # Perception -> first queued action of this thought (frame times are time.monotonic)
+                now = time.perf_counter()
+                tracer.record("frame_to_action", now - (time.monotonic() - self.thought_frame_time), now, "act")
+                self.thought_frame_time = None
+        if actions and "first_action" not in self.milestones:
+            self._mark("first_action")
+            self.startup_report()
+
+    def pipeline_stats(self):
+        """Plans dropped for stale/superseded perception, and how busy the brain was kept."""
+        motor = self.motor.stats()
+        return {
+            "plans": motor["plans"],
+            "dropped_stale": motor["dropped_stale"],
+            "dropped_superseded": motor["dropped_superseded"],
+            "preempted": motor["preempted"],
+            "drop_rate": motor["drop_rate"],
+            "plan_age_ms_p50": motor["plan_age_ms_p50"],
+            "brain_utilisation": self.pacer.duty(),
+        }
 
     def act_loop(self):
         """
         The Fast Loop:
-        Executes actions from the queue safely.
+        The motor scheduler executes queued actions on their deadlines; this thread
+        just keeps it running until ESC (or stop) and then cleans up.
         """
-        while self.running and self.input.is_active():
-            try:
-                # Non-blocking get
-                cmd_tuple = self.action_queue.get(timeout=0.1)
-                cmd, val = cmd_tuple
-                
-                print(f"Act: Executing {cmd} {val}")
-                
-                if cmd == "key_down":
-                    self.input.key_down(val)
-                elif cmd == "key_up":
-                    self.input.key_up(val)
-                elif cmd == "press":
-                    self.input.press_key(getattr(os, 'dummy', val), duration=0.1) # Handle string vs Key obj? InputMgr handles strings.
-                elif cmd == "wait":
-                    time.sleep(val) # Note: input_mgr.is_active() check is inside start of next loop, but sleep blocks ESC check in this thread. 
-                    # Better: sleep in chunks
-                    elapsed = 0
-                    while elapsed < val:
-                        if not self.input.is_active(): break
-                        time.sleep(0.1)
-                        elapsed += 0.1
-                elif cmd == "mouse_move":
-                    self.input.move_mouse(val[0], val[1])
-                elif cmd == "attack":
-                    self.input.attack()
-                elif cmd == "interact":
-                    self.input.interact()
-                    
-            except queue.Empty:
-                pass
-            except Exception as e:
-                print(f"Act Error: {e}")
+        self.motor.start()
+        while self.running and not self.input.stop_event.wait(0.1):
+            pass
                 
         # Cleanup
         print("Spinal Cord stopping...")
         self.running = False
+        if self.reflexes is not None:
+            self.reflexes.stop()
+        if self.motion is not None:
+            self.motion.stop()
+        self.motor.stop()
+        self.eyes.stop()
+        print(f"Motor: {self.motor.stats()}")
+        if self.reflexes is not None:
+            print(f"Reflexes: {self.reflexes.stats()}")
+        if self.motion is not None:
+            print(f"Motion: {self.motion.stats()}")
+        self.brain_loader.shutdown(wait=False)
+        print(f"Pacer: {self.pacer.stats()}")
+        print(f"Pipeline: {self.pipeline_stats()}")
+        print(f"Thought cache: {self.thought_cache.stats()}")
+        print(f"Long-term memory: {self.memory.long_term.stats()}")
+        self.memory.close()
+        if self.recorder is not None:
+            self.recorder.close()
+            print(f"Recording: {self.recorder.stats()} -> {self.recorder.path}")
+        prefix_cache = getattr(self.brain, "prefix_cache", None)
+        if prefix_cache is not None:
+            print(f"Prefix cache: {prefix_cache.stats()}")
+        if isinstance(self.brain, BrainProcess) and self.brain_process:
+            print(f"Brain process: {self.brain.stats()}")
+            self.brain.close()
+        if self.trace_path:
+            for name, stage in tracer.summary().items():
+                print(f"Trace: {name:<16} n={stage['count']:<5} p50 {stage['p50_ms']:8.2f} ms | p95 {stage['p95_ms']:8.2f} ms")
+            print(f"Trace: wrote {tracer.export_chrome(self.trace_path)} spans to {self.trace_path}")
 
 if __name__ == "__main__":
     # Test Stub
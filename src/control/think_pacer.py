@@ -0,0 +1,206 @@
+import time
+from collections import Counter, deque
+
+import numpy as np
+
+from src.utils.tracing import tracer
+
+# target -> (min_interval, max_interval, max_duty, change_threshold)
+PACE_TARGETS = {
+    "latency": (0.0, 1.0, 1.0, 0.15),  # Think again as soon as there's any reason to
+    "balanced": (0.1, 3.0, 0.8, 0.3),
+    "power": (0.5, 8.0, 0.4, 0.5),  # Brain busy at most 40% of the time
+}
+
+class ThinkPacer:
+    """
+    Decides when the slow loop thinks next, instead of sleeping a fixed interval:
+    - now, if the scene changed a lot since the last thought's frame
+    - now, if the action queue is empty (the body would otherwise stand idle)
+    - otherwise when the queued actions are about to run out, less the expected
+      inference latency (EMA of recent thoughts), so the next plan lands in time
+    clamped to [min_interval, max_interval] after the previous thought ended. A
+    max_duty below 1 also rests the brain in proportion to its latency (power target).
+
+    With `speculate`, the next thought starts as soon as the last one ends while
+    actions are still queued: its plan is versioned by frame, so the motor scheduler
+    drops whichever of the two turns out stale or superseded.
+
+    A thought answered from the cache isn't a thought: after thought_skipped() the
+    pacer only says think again on a real change (the scene, the queue running dry
+    since the skip) or after max_interval, and the skipped decision isn't counted.
+    """
+    def __init__(self, target="balanced", min_interval=None, max_interval=None, max_duty=None,
+                 change_threshold=None, latency_alpha=0.3, poll=0.02, speculate=False, skip_change=0.02):
+        """
+        Args:
+            target (str): Preset from PACE_TARGETS: 'latency', 'balanced' or 'power'.
+            min_interval (float): Least pause after a thought (overrides the preset).
+            max_interval (float): Longest pause after a thought, whatever the queue holds.
+            max_duty (float): Largest fraction of time the brain may spend thinking.
+            change_threshold (float): FrameSignature.change() that triggers a thought at once.
+            latency_alpha (float): EMA rate of the inference latency estimate.
+            poll (float): Seconds between re-evaluations while waiting.
+            speculate (bool): Don't wait for the queue to drain before thinking again.
+            skip_change (float): Scene change that ends the hold after a cache hit (the thought
+                                 cache's own tolerance: anything less would hit again).
+        """
+        if target not in PACE_TARGETS:
+            raise ValueError(f"Unknown pace target '{target}'. Options: {sorted(PACE_TARGETS)}")
+        preset = PACE_TARGETS[target]
+        self.target = target
+        self.min_interval = preset[0] if min_interval is None else min_interval
+        self.max_interval = max(self.min_interval, preset[1] if max_interval is None else max_interval)
+        self.max_duty = preset[2] if max_duty is None else max_duty
+        self.change_threshold = preset[3] if change_threshold is None else change_threshold
+        self.latency_alpha = latency_alpha
+        self.poll = poll
+        self.speculate = speculate
+        self.skip_change = skip_change
+
+        self.latency = None  # EMA of inference seconds
+        self.started_at = None  # Current thought
+        self.last_end = None  # Previous thought
+        self.first_start = None
+        self.busy_s = 0.0
+
+        self.skipped_at = None  # Last thought answered from the cache, until the next decision
+        self.skip_busy = False  # Actions were queued at that skip
+
+        self.reasons = Counter()
+        self.intervals = deque(maxlen=1000)  # Seconds from one thought's end to the next's start
+        self.waits = deque(maxlen=1000)  # Seconds spent in wait()
+        self.idle_waits = 0  # Waits that ended with the action queue already empty
+        self.skipped = 0  # Thoughts answered from the cache
+        self.decision = None  # (reason, wait_s, interval_s, idle) of the current thought, counted once it finishes
+
+    @classmethod
+    def fixed(cls, interval):
+        """The old behaviour: always pause exactly `interval` seconds between thoughts."""
+        pacer = cls(min_interval=interval, max_interval=interval, max_duty=1.0, change_threshold=float("inf"))
+        pacer.target = "fixed"
+        return pacer
+
+    def rest(self):
+        """Pause the duty cap requires after a thought of the expected latency."""
+        if self.latency is None or self.max_duty >= 1.0:
+            return 0.0
+        return self.latency * (1.0 / max(self.max_duty, 1e-3) - 1.0)
+
+    def decide(self, queue_s, change, now=None):
+        """
+        Args:
+            queue_s (float): Seconds of queued motor actions left (0 = idle).
+            change (float): Scene change since the last thought's frame (FrameSignature.change).
+        Returns:
+            tuple: (seconds to wait from now, reason). Fixed pacing always reports 'fixed'.
+        """
+        if self.last_end is None:
+            return 0.0, "first"
+        now = time.monotonic() if now is None else now
+        elapsed = now - self.last_end
+        if self.target == "fixed":
+            return max(0.0, self.min_interval - elapsed), "fixed"
+        if self.skipped_at is not None:
+            # Nothing the cache hit didn't already answer, unless something changed since
+            if change > self.skip_change:
+                return 0.0, "scene_change"
+            if self.skip_busy and queue_s <= 0.0:
+                return 0.0, "queue_empty"
+            return max(0.0, self.skipped_at + self.max_interval - now), "max_interval"
+        if change >= self.change_threshold:
+            want, reason = 0.0, "scene_change"
+        elif queue_s <= 0.0:
+            want, reason = 0.0, "queue_empty"
+        elif self.speculate:
+            want, reason = 0.0, "speculative"
+        else:
+            want, reason = queue_s - (self.latency or 0.0), "queue_draining"
+        at = elapsed + max(0.0, want)  # Since the last thought ended
+        if at >= self.max_interval:
+            at, reason = self.max_interval, "max_interval"
+        at = max(at, self.min_interval, self.rest())
+        return at - elapsed, reason
+
+    def wait(self, probe, active):
+        """
+        Blocks until decide() says to think.
+        Args:
+            probe (callable): probe() -> (queue_s, change), re-read every `poll` seconds.
+            active (callable): active() -> False aborts the wait.
+        Returns:
+            str: The reason to think now, or None if aborted.
+        """
+        start = time.monotonic()
+        perf_start = time.perf_counter()
+        while active():
+            queue_s, change = probe()
+            delay, reason = self.decide(queue_s, change)
+            if delay <= 0.0:
+                break
+            time.sleep(min(delay, self.poll))
+        else:
+            return None
+        now = time.monotonic()
+        self.skipped_at = None
+        interval = now - self.last_end if self.last_end is not None else None
+        self.decision = (reason, now - start, interval, queue_s <= 0.0)
+        tracer.record("pace", perf_start, time.perf_counter(), "brain", reason=reason)
+        return reason
+
+    def thought_started(self, now=None):
+        self.started_at = time.monotonic() if now is None else now
+        if self.first_start is None:
+            self.first_start = self.started_at
+
+    def thought_finished(self, now=None):
+        self.last_end = time.monotonic() if now is None else now
+        if self.started_at is not None:
+            self.busy_s += self.last_end - self.started_at
+            self.started_at = None
+        if self.decision is not None:
+            reason, wait_s, interval, idle = self.decision
+            self.decision = None
+            self.reasons[reason] += 1
+            self.waits.append(wait_s)
+            if interval is not None:
+                self.intervals.append(interval)
+            self.idle_waits += idle
+
+    def thought_skipped(self, queue_s, now=None):
+        """The thought was answered from the cache: not counted, and no new one until something changes."""
+        self.skipped_at = time.monotonic() if now is None else now
+        self.skip_busy = queue_s > 0.0
+        self.started_at = None
+        self.decision = None
+        self.skipped += 1
+
+    def observe_latency(self, seconds):
+        """Feeds one inference's duration (not cache hits) into the latency estimate."""
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += self.latency_alpha * (seconds - self.latency)
+
+    def duty(self):
+        """Fraction of the time from the first thought's start to the last one's end spent thinking."""
+        if self.first_start is None or self.last_end is None:
+            return 0.0
+        span = self.last_end - self.first_start
+        return self.busy_s / span if span > 0 else 0.0
+
+    def stats(self):
+        def pct(values, q):
+            return float(np.percentile(values, q)) if values else 0.0
+
+        return {
+            "target": self.target,
+            "decisions": dict(self.reasons),
+            "interval_s_p50": pct(self.intervals, 50),
+            "interval_s_p95": pct(self.intervals, 95),
+            "wait_s_p50": pct(self.waits, 50),
+            "idle_waits": self.idle_waits,
+            "skipped": self.skipped,
+            "latency_s": self.latency or 0.0,
+            "duty": self.duty(),
+        }
@@ -0,0 +1,40 @@
+import importlib
+import importlib.util
+import sys
+import threading
+
+class LazyModule:
+    """
+    Stand-in for a module that imports it on first attribute access. Thread-safe,
+    unlike importlib's LazyLoader before Python 3.12: there, a second thread touching
+    the module while the first is still executing it sees an empty module.
+    """
+    lock = threading.Lock()
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            with LazyModule.lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module '{self._name}'{' (loaded)' if self._module is not None else ''}>"
+
+def lazy_import(name):
+    """
+    Returns module `name` without executing it until an attribute is first used.
+    Keeps heavy dependencies (cv2, Quartz) off the startup path.
+    Returns None if the module isn't installed, so optional backends can check it.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if importlib.util.find_spec(name) is None:
+        return None
+    return LazyModule(name)
@@ -0,0 +1,291 @@
+import json
+import mmap
+import os
+import queue
+import threading
+import time
+import zlib
+
+import numpy as np
+
+FORMAT_VERSION = 1
+# One record per chunk in chunks.bin: where its bytes are in frames.bin and which frames it holds
+CHUNK_DTYPE = np.dtype([("offset", "<u8"), ("nbytes", "<u8"), ("first", "<u4"), ("count", "<u4")])
+# One record per frame in frames_index.bin: capture time (time.monotonic) and FrameRing sequence number
+FRAME_DTYPE = np.dtype([("t", "<f8"), ("seq", "<u8")])
+
+class Recorder:
+    """
+    Records a session to a directory so field failures can be replayed offline:
+
+        meta.json          frame shape, chunk size, compression, native window size
+        frames.bin         frame chunks, append-only (raw, or XOR-delta + zlib per chunk)
+        chunks.bin         CHUNK_DTYPE record per chunk
+        frames_index.bin   FRAME_DTYPE record per frame
+        events.jsonl       brain responses, input calls, ... with monotonic timestamps
+
+    add_frame() only copies the frame into the current chunk buffer; full chunks are
+    encoded and written by a background thread, so the capture thread never waits on
+    compression or disk.
+    """
+    def __init__(self, path, frame_shape, chunk_frames=32, compress=True, level=1):
+        """
+        Args:
+            path (str): Session directory (created; must not already hold a recording).
+            frame_shape (tuple): (h, w, 3) of every frame.
+            chunk_frames (int): Frames per chunk (unit of compression and of replay decoding).
+            compress (bool): XOR each frame against the previous one in its chunk and zlib the
+                             chunk. Off = raw frames, which replay can serve straight from the mmap.
+            level (int): zlib level (1 = fastest).
+        """
+        if os.path.exists(os.path.join(path, "meta.json")):
+            raise FileExistsError(f"{path} already holds a recording")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.frame_shape = tuple(frame_shape)
+        self.chunk_frames = chunk_frames
+        self.compress = compress
+        self.level = level
+
+        self.meta = {
+            "version": FORMAT_VERSION,
+            "frame_shape": list(self.frame_shape),
+            "dtype": "uint8",
+            "chunk_frames": chunk_frames,
+            "compression": "xor-zlib" if compress else "raw",
+            "wall_start": time.time(),
+            "monotonic_start": time.monotonic(),
+        }
+        self._write_meta()
+
+        self.frames_file = open(os.path.join(path, "frames.bin"), "wb")
+        self.chunks_file = open(os.path.join(path, "chunks.bin"), "wb")
+        self.index_file = open(os.path.join(path, "frames_index.bin"), "wb")
+        self.events_file = open(os.path.join(path, "events.jsonl"), "w", encoding="utf-8")
+        self.offset = 0
+        self.event_lock = threading.Lock()
+
+        # Double-buffered chunk staging: fill one while the writer encodes the other
+        self.free = queue.Queue()
+        for _ in range(2):
+            self.free.put(np.empty((chunk_frames,) + self.frame_shape, dtype=np.uint8))
+        self.buffer = self.free.get()
+        self.times = np.empty(chunk_frames, dtype=FRAME_DTYPE)
+        self.fill = 0
+        self.frames = 0
+
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="Recorder", daemon=True)
+        self.writer.start()
+        self.closed = False
+
+        self.raw_bytes = 0
+        self.written_bytes = 0
+        self.dropped = 0
+
+    def add_frame(self, frame, t=None, seq=None):
+        """Copies one frame into the current chunk. Drops it if the writer is two chunks behind."""
+        if self.closed:
+            return
+        if self.buffer is None:
+            try:
+                self.buffer = self.free.get_nowait()
+            except queue.Empty:
+                self.dropped += 1
+                return
+        np.copyto(self.buffer[self.fill], frame)
+        self.times[self.fill] = (time.monotonic() if t is None else t, self.frames if seq is None else seq)
+        self.fill += 1
+        self.frames += 1
+        if self.fill == self.chunk_frames:
+            self._hand_off()
+
+    def add_event(self, kind, t=None, **data):
+        """Appends an event (e.g. kind='thought', text=...; kind='input', call='key_down', args=[...])."""
+        if self.closed:
+            return
+        record = {"t": time.monotonic() if t is None else t, "kind": kind, **data}
+        line = json.dumps(record, default=str) + "\n"
+        with self.event_lock:
+            self.events_file.write(line)
+
+    def update_meta(self, **fields):
+        """Adds fields to meta.json, e.g. native_size=[w, h] once the capture thread knows it."""
+        self.meta.update(fields)
+        self._write_meta()
+
+    def _write_meta(self):
+        path = os.path.join(self.path, "meta.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+        os.replace(path + ".tmp", path)  # A crash mid-write never leaves a truncated meta.json
+
+    def close(self):
+        if self.closed:
+            return
+        if self.fill:
+            self._hand_off()
+        self.closed = True
+        self.pending.put(None)
+        self.writer.join()
+        for f in (self.frames_file, self.chunks_file, self.index_file, self.events_file):
+            f.close()
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "ratio": self.raw_bytes / self.written_bytes if self.written_bytes else 0.0,
+            "mb_written": self.written_bytes / 1e6,
+        }
+
+    def _hand_off(self):
+        self.pending.put((self.buffer, self.times[:self.fill].copy(), self.frames - self.fill))
+        self.buffer = None
+        self.fill = 0
+        try:
+            self.buffer = self.free.get_nowait()
+        except queue.Empty:
+            pass  # Writer busy with both buffers: add_frame retries (or drops)
+
+    def _write_loop(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            buffer, times, first = item
+            count = len(times)
+            frames = buffer[:count]
+            if self.compress:
+                # XOR against the previous frame: static pixels become zeros, which zlib squeezes
+                delta = frames.copy()
+                np.bitwise_xor(frames[1:], frames[:-1], out=delta[1:])
+                data = zlib.compress(delta, self.level)
+            else:
+                data = frames.tobytes()
+            self.free.put(buffer)
+
+            self.frames_file.write(data)
+            self.frames_file.flush()
+            np.array([(self.offset, len(data), first, count)], dtype=CHUNK_DTYPE).tofile(self.chunks_file)
+            self.chunks_file.flush()
+            times.tofile(self.index_file)
+            self.index_file.flush()
+            self.offset += len(data)
+            self.raw_bytes += frames.nbytes
+            self.written_bytes += len(data)
+
+class Recording:
+    """
+    Read side of a Recorder session. frames.bin is memory-mapped: raw sessions hand out
+    frames as views of the mapping (zero-copy); compressed sessions decode a whole chunk
+    once (zlib straight from the mapping, then one cumulative XOR) and hand out views of it.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.frame_shape = tuple(self.meta["frame_shape"])
+        self.compressed = self.meta["compression"] != "raw"
+
+        self.chunks = np.fromfile(os.path.join(path, "chunks.bin"), dtype=CHUNK_DTYPE)
+        index = np.fromfile(os.path.join(path, "frames_index.bin"), dtype=FRAME_DTYPE)
+        self.timestamps = index["t"]
+        self.seqs = index["seq"]
+        self.chunk_firsts = self.chunks["first"].astype(np.int64)
+
+        self.file = open(os.path.join(path, "frames.bin"), "rb")
+        size = os.fstat(self.file.fileno()).st_size
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.cached_chunk = -1
+        self.cached = None
+
+    def __len__(self):
+        return int(self.chunks["count"].sum()) if len(self.chunks) else 0
+
+    @property
+    def duration(self):
+        return float(self.timestamps[-1] - self.timestamps[0]) if len(self.timestamps) > 1 else 0.0
+
+    def frame(self, i):
+        """Frame i as a read-only view (valid until a frame from another chunk is requested, if compressed)."""
+        c = int(np.searchsorted(self.chunk_firsts, i, side="right")) - 1
+        if c < 0 or i >= len(self):
+            raise IndexError(f"Frame {i} out of range (0..{len(self) - 1})")
+        return self._chunk(c)[i - self.chunk_firsts[c]]
+
+    def index_at(self, elapsed):
+        """Index of the frame showing at `elapsed` seconds into the recording."""
+        target = self.timestamps[0] + elapsed
+        return max(0, int(np.searchsorted(self.timestamps, target, side="right")) - 1)
+
+    def index_of_seq(self, seq):
+        """Index of the recorded frame with ring sequence `seq` (or the last one before it, if dropped)."""
+        return max(0, int(np.searchsorted(self.seqs, seq, side="right")) - 1)
+
+    def iter_frames(self):
+        """Yields (timestamp, frame view) in order, decoding each chunk once."""
+        for c in range(len(self.chunks)):
+            chunk = self._chunk(c)
+            first = self.chunk_firsts[c]
+            for j in range(len(chunk)):
+                yield self.timestamps[first + j], chunk[j]
+
+    def events(self, kind=None):
+        """Yields recorded event dicts (optionally of one kind), oldest first."""
+        path = os.path.join(self.path, "events.jsonl")
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    event = json.loads(line)
+                    if kind is None or event["kind"] == kind:
+                        yield event
+
+    def close(self):
+        self.cached = None
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                pass  # Frame views handed out are still alive; the mapping goes when they do
+            self.map = None
+        self.file.close()
+
+    def _chunk(self, c):
+        if c == self.cached_chunk:
+            return self.cached
+        offset, nbytes, _, count = self.chunks[c]
+        shape = (int(count),) + self.frame_shape
+        if not self.compressed:
+            chunk = np.frombuffer(self.map, dtype=np.uint8, count=int(nbytes), offset=int(offset)).reshape(shape)
+        else:
+            data = zlib.decompress(memoryview(self.map)[int(offset):int(offset + nbytes)])
+            chunk = np.frombuffer(data, dtype=np.uint8).reshape(shape).copy()
+            np.bitwise_xor.accumulate(chunk, axis=0, out=chunk)
+            chunk.flags.writeable = False
+        self.cached_chunk, self.cached = c, chunk
+        return chunk
+
+class RecordedInput:
+    """
+    Wraps an InputManager (or FakeInput) and records every motor call as an 'input'
+    event before forwarding it. Everything else (is_active, stop_event, ...) passes through.
+    """
+    RECORDED = ("key_down", "key_up", "press_key", "move_mouse", "turn", "attack", "interact",
+                "hotbar", "inventory", "click")
+
+    def __init__(self, inner, recorder):
+        self.inner = inner
+        self.recorder = recorder
+
+    def __getattr__(self, name):
+        attr = getattr(self.inner, name)
+        if name not in self.RECORDED:
+            return attr
+
+        def recorded(*args, **kwargs):
+            self.recorder.add_event("input", call=name, args=list(args), **kwargs)
+            return attr(*args, **kwargs)
+        return recorded
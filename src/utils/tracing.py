@@ -0,0 +1,173 @@
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+class Span:
+    """One timed stage. Times are time.perf_counter() seconds."""
+    __slots__ = ("name", "cat", "start", "end", "tid", "args")
+
+    def __init__(self, name, cat, start, end, tid, args):
+        self.name = name
+        self.cat = cat
+        self.start = start
+        self.end = end
+        self.tid = tid
+        self.args = args
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+class _SpanContext:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.record(self.name, self.start, time.perf_counter(), self.cat, **self.args)
+        return False
+
+class _NullContext:
+    __slots__ = ()
+    args = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL = _NullContext()
+
+class Tracer:
+    """
+    Lightweight span recorder for the perception -> thought -> action pipeline.
+    Spans go into a bounded ring buffer (oldest dropped) and export as Chrome-trace
+    JSON (chrome://tracing or https://ui.perfetto.dev). Disabled tracers cost one
+    attribute check per span.
+
+    Per-thread context (e.g. the current frame and thought ids) is merged into the
+    args of every span recorded on that thread, so stages deep in the brain or the
+    capture code don't need the ids passed down to them.
+    """
+    def __init__(self, capacity=20000, enabled=False):
+        self.enabled = enabled
+        self.spans = deque(maxlen=capacity)
+        self.local = threading.local()
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.thread_names = {}
+
+    def span(self, name, cat="", **args):
+        """Context manager timing one stage: `with tracer.span("prefill", thought=7): ...`"""
+        if not self.enabled:
+            return _NULL
+        return _SpanContext(self, name, cat, args)
+
+    def record(self, name, start, end, cat="", **args):
+        """Records an already-timed span (perf_counter seconds)."""
+        if not self.enabled:
+            return
+        context = getattr(self.local, "context", None)
+        if context:
+            args = {**context, **args}
+        thread = threading.current_thread()
+        if thread.ident not in self.thread_names:
+            self.thread_names[thread.ident] = thread.name
+        self.spans.append(Span(name, cat, start, end, thread.ident, args))
+
+    def instant(self, name, cat="", **args):
+        """Records a zero-length marker (e.g. 'first_action')."""
+        now = time.perf_counter()
+        self.record(name, now, now, cat, **args)
+
+    def next_id(self, kind):
+        """Monotonic ids per kind ('thought', ...), starting at 1."""
+        with self.lock:
+            counter = self.counters.get(kind)
+            if counter is None:
+                counter = self.counters[kind] = itertools.count(1)
+            return next(counter)
+
+    def context(self, **args):
+        """Sets this thread's context args for the `with` block (restored afterwards)."""
+        if not self.enabled:
+            return _NULL
+        return _ThreadContext(self.local, args)
+
+    def clear(self):
+        self.spans.clear()
+
+    def summary(self):
+        """Per span name: count and p50/p95/max duration in ms."""
+        durations = {}
+        for span in list(self.spans):
+            durations.setdefault(span.name, []).append(span.duration)
+        report = {}
+        for name, values in durations.items():
+            ms = np.array(values) * 1000.0
+            report[name] = {
+                "count": len(values),
+                "p50_ms": float(np.percentile(ms, 50)),
+                "p95_ms": float(np.percentile(ms, 95)),
+                "max_ms": float(ms.max()),
+            }
+        return report
+
+    def export_chrome(self, path):
+        """Writes the buffered spans as Chrome-trace JSON. Returns the number of spans written."""
+        spans = list(self.spans)
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        for span in spans:
+            events.append({
+                "name": span.name,
+                "cat": span.cat or "agent",
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": (span.end - span.start) * 1e6,
+                "pid": pid,
+                "tid": span.tid,
+                "args": span.args,
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return len(spans)
+
+class _ThreadContext:
+    __slots__ = ("local", "args", "previous")
+
+    def __init__(self, local, args):
+        self.local = local
+        self.args = args
+
+    def __enter__(self):
+        self.previous = getattr(self.local, "context", None)
+        self.local.context = {**(self.previous or {}), **self.args}
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.local.context = self.previous
+        return False
+
+# Process-wide tracer used by capture, brain, spinal cord and input.
+# Off unless AGENT_TRACE=1 or something calls tracer.enabled = True (e.g. SpinalCord(trace_path=...)).
+tracer = Tracer(enabled=os.environ.get("AGENT_TRACE") == "1")
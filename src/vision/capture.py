@@ -1,78 +1,134 @@
 import mss
 import numpy as np
-import cv2
-import Quartz
 import ctypes
 
+from src.utils.lazy import lazy_import
+from src.utils.tracing import tracer
+
+cv2 = lazy_import("cv2")
+Quartz = lazy_import("Quartz")  # None when not on macOS: only mss / synthetic / replay capture available
+
 class ScreenCapture:
-    def __init__(self):
-        self.sct = mss.mss()
+    def __init__(self, reuse_buffers=False):
+        """
+        Args:
+            reuse_buffers (bool): Return a per-size preallocated output buffer instead of a new
+                                  array each grab. The frame is then only valid until the next
+                                  capture of the same size, so consumers must copy what they keep.
+        """
+        self._sct = None
+        self.reuse_buffers = reuse_buffers
+        self._buffers = {}  # shape -> preallocated uint8 array
+
+    @property
+    def sct(self):
+        # Opened lazily: mss handles are thread-bound and need a display
+        if self._sct is None:
+            self._sct = mss.mss()
+        return self._sct
+
+    def close(self):
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
+    def _buffer(self, shape):
+        buf = self._buffers.get(shape)
+        if buf is None:
+            buf = self._buffers[shape] = np.empty(shape, dtype=np.uint8)
+        return buf
+
+    def convert_bgra(self, bgra, target_size=(640, 360), out=None, plan=None, regions=None):
+        """
+        Converts a raw BGRA grab to BGR at target_size with no full-frame temporaries.
+        Args:
+            bgra (numpy.ndarray): (H, W, 4) view of the grab. Row padding (stride) is fine.
+            target_size (tuple): (width, height) or None to keep the source size.
+            out (numpy.ndarray): Optional (h, w, 3) destination, e.g. a FrameRing slot.
+            plan (CapturePlan): Also crop its HUD regions from the grab at native resolution...
+            regions (dict): ...into this name -> BGR array store (e.g. FrameRing.next_regions()).
+        Returns:
+            numpy.ndarray: The BGR frame (`out` if given).
+        """
+        with tracer.span("convert", "capture"):
+            frame = self._convert_bgra(bgra, target_size, out)
+            if plan is not None and regions is not None:
+                plan.crop(bgra, regions)
+            return frame
+
+    def _convert_bgra(self, bgra, target_size, out):
+        h, w = bgra.shape[:2]
+        src = bgra
+        if target_size and tuple(target_size) != (w, h):
+            w, h = target_size
+            # Resize all 4 channels straight off the strided source (one full-frame pass),
+            # then drop alpha on the small image. Slicing alpha first would force a full copy.
+            src = self._buffer((h, w, 4))
+            cv2.resize(bgra, (w, h), dst=src, interpolation=cv2.INTER_AREA)
 
-    def capture_region(self, region, target_size=(640, 360)):
+        if out is None:
+            out = self._buffer((h, w, 3)) if self.reuse_buffers else np.empty((h, w, 3), dtype=np.uint8)
+        elif out.shape != (h, w, 3) or out.dtype != np.uint8:
+            raise ValueError(f"Output buffer must be uint8 {(h, w, 3)}, got {out.dtype} {out.shape}")
+
+        cv2.cvtColor(src, cv2.COLOR_BGRA2BGR, dst=out)
+        return out
+
+    def capture_region(self, region, target_size=(640, 360), out=None, plan=None, regions=None):
         """
         Captures a specific region of the screen (efficiently).
         Args:
             region (dict): {'top': int, 'left': int, 'width': int, 'height': int}
             target_size (tuple): (width, height) to resize for the brain. Default 640x360.
+            out (numpy.ndarray): Optional preallocated destination.
+            plan, regions: Optional native-resolution HUD crops, see convert_bgra.
         Returns:
             numpy.ndarray: The captured image in BGR format.
         """
-        screenshot = self.sct.grab(region)
-        img = np.array(screenshot)
-        img_bgr = img[:, :, :3]
-        
-        if target_size:
-            img_bgr = cv2.resize(img_bgr, target_size, interpolation=cv2.INTER_AREA)
-        
-        return np.ascontiguousarray(img_bgr)
+        with tracer.span("grab", "capture", backend="mss"):
+            screenshot = self.sct.grab(region)
+        # View mss' BGRA bytes in place instead of np.array() copying them
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+        return self.convert_bgra(bgra, target_size, out, plan, regions)
 
-    def capture_window_exclusive(self, window_id, target_size=(640, 360)):
+    def capture_window_exclusive(self, window_id, target_size=(640, 360), out=None, plan=None, regions=None):
         """
         Captures a specific window ID, even if occluded.
         Uses macOS Quartz API (CGWindowListCreateImage).
         """
+        if Quartz is None:
+            raise RuntimeError("capture_window_exclusive requires macOS (pyobjc-framework-Quartz)")
+
         # CGWindowListOptionIncludingWindow = 8
         # kCGWindowImageBoundsIgnoreFraming = 1
-        # kCGWindowImageNominalResolution = 16 (optional, speeds up if 1.0 scale)
-        
-        image_ref = Quartz.CGWindowListCreateImage(
-            Quartz.CGRectNull,
-            8, # kCGWindowListOptionIncludingWindow
-            window_id,
-            1 | 16 # IgnoreFraming | NominalResolution
-        )
-        
-        if not image_ref:
-            return None
+        # kCGWindowImageNominalResolution = 16 (grab at point size: 1/4 of the pixels on Retina)
+        # With a plan the grab must be at the real pixel size: HUD crops are meant to be native,
+        # and Minecraft picks its GUI scale from the pixel size, which CapturePlan.rects mirrors.
+        options = 1 if plan is not None else 1 | 16
+
+        with tracer.span("grab", "capture", backend="quartz"):
+            image_ref = Quartz.CGWindowListCreateImage(
+                Quartz.CGRectNull,
+                8, # kCGWindowListOptionIncludingWindow
+                window_id,
+                options
+            )
             
-        width = Quartz.CGImageGetWidth(image_ref)
-        height = Quartz.CGImageGetHeight(image_ref)
-        bytes_per_row = Quartz.CGImageGetBytesPerRow(image_ref)
-        pixel_data = Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(image_ref))
-        
-        # Convert raw bytes to numpy array
-        # Handle Potential Stride/Padding
-        # Raw data might have padding bytes at the end of each row
-        raw_data = np.frombuffer(pixel_data, dtype=np.uint8)
-        
-        # Reshape to (Height, BytesPerRow) then crop to (Height, Width * 4)
-        # Note: bytes_per_row >= width * 4
-        if len(raw_data) == height * bytes_per_row:
-             img_padded = raw_data.reshape((height, bytes_per_row))
-             img_flat = img_padded[:, :width*4]
-             img = img_flat.reshape((height, width, 4))
-        else:
-             # Fallback or error if size doesn't match expected stride logic
-             # Trying direct reshape if matches perfectly (rare)
-             img = raw_data.reshape((height, width, 4))
+            if not image_ref:
+                return None
+                
+            width = Quartz.CGImageGetWidth(image_ref)
+            height = Quartz.CGImageGetHeight(image_ref)
+            bytes_per_row = Quartz.CGImageGetBytesPerRow(image_ref)
+            pixel_data = Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(image_ref))
         
-        # Drop Alpha channel (BGRA -> BGR)
-        img_bgr = img[:, :, :3]
-        
-        if target_size:
-            img_bgr = cv2.resize(img_bgr, target_size, interpolation=cv2.INTER_AREA)
-
-        return np.ascontiguousarray(img_bgr)
+        # Raw data might have padding bytes at the end of each row (bytes_per_row >= width * 4).
+        # Describe that layout with strides so nothing is copied before the resize.
+        bgra = np.ndarray(
+            (height, width, 4), dtype=np.uint8, buffer=pixel_data,
+            strides=(bytes_per_row, 4, 1)
+        )
+        return self.convert_bgra(bgra, target_size, out, plan, regions)
 
     def save_debug_screenshot(self, img, filename="debug_capture.png"):
         cv2.imwrite(filename, img)
@@ -0,0 +1,131 @@
+import numpy as np
+
+from src.utils.lazy import lazy_import
+
+cv2 = lazy_import("cv2")
+
+# Where a region's offset is measured from, as fractions of the window (x, y)
+ANCHORS = {
+    "top_left": (0.0, 0.0), "top_center": (0.5, 0.0), "top_right": (1.0, 0.0),
+    "center": (0.5, 0.5),
+    "bottom_left": (0.0, 1.0), "bottom_center": (0.5, 1.0), "bottom_right": (1.0, 1.0),
+}
+
+class HudRegion:
+    """
+    A native-resolution crop, in Minecraft GUI pixels relative to an anchor point.
+    GUI pixels are multiplied by the GUI scale, so one definition fits every window size.
+    """
+    __slots__ = ("name", "anchor", "x", "y", "w", "h")
+
+    def __init__(self, name, anchor, x, y, w, h):
+        if anchor not in ANCHORS:
+            raise ValueError(f"Unknown anchor '{anchor}'. Options: {sorted(ANCHORS)}")
+        self.name = name
+        self.anchor = anchor
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+# Vanilla HUD layout (GUI pixels): 182x22 hotbar at the bottom centre, hearts and
+# hunger in two 81x9 rows above it, crosshair in the middle of the screen.
+DEFAULT_HUD_REGIONS = (
+    HudRegion("hotbar", "bottom_center", -91, -22, 182, 22),
+    HudRegion("health", "bottom_center", -91, -39, 81, 9),
+    HudRegion("hunger", "bottom_center", 10, -39, 81, 9),
+    HudRegion("crosshair", "center", -16, -16, 32, 32),
+)
+
+def gui_scale(width, height, max_scale=0):
+    """Minecraft's GUI scale for a window: the largest that keeps 320x240 GUI pixels (0 = Auto)."""
+    scale = 1
+    while (scale != max_scale and scale < width and scale < height
+           and width // (scale + 1) >= 320 and height // (scale + 1) >= 240):
+        scale += 1
+    return scale
+
+class CapturePlan:
+    """
+    What to produce from each grab besides the downscaled scene: sharp crops of
+    HUD regions at the window's native resolution (the scene resize blurs them).
+    Crop rectangles are computed once per window size and cached.
+
+    Frames that were stored downscaled (recordings, replays) can still be cropped:
+    given the native window size, the rects are laid out for that window (its GUI
+    scale) and scaled down to the stored frame.
+    """
+    def __init__(self, regions=DEFAULT_HUD_REGIONS, gui_scale=0):
+        """
+        Args:
+            regions (tuple): HudRegion definitions.
+            gui_scale (int): The game's GUI scale setting (0 = Auto, the default).
+        """
+        self.regions = tuple(regions)
+        self.gui_scale = gui_scale
+        self.rect_cache = {}  # (w, h) or (w, h, native w, native h) -> {name: (x, y, w, h)}
+        self.native_size = None  # (w, h) of the last image cropped at native resolution
+
+    def names(self):
+        return [r.name for r in self.regions]
+
+    def rects(self, width, height):
+        """Pixel rectangles {name: (x, y, w, h)} for a window size, clipped to it."""
+        rects = self.rect_cache.get((width, height))
+        if rects is None:
+            scale = gui_scale(width, height, self.gui_scale)
+            rects = {}
+            for r in self.regions:
+                ax, ay = ANCHORS[r.anchor]
+                x0 = int(ax * width) + r.x * scale
+                y0 = int(ay * height) + r.y * scale
+                x1 = min(width, x0 + r.w * scale)
+                y1 = min(height, y0 + r.h * scale)
+                x0, y0 = max(0, x0), max(0, y0)
+                rects[r.name] = (x0, y0, max(0, x1 - x0), max(0, y1 - y0))
+            self.rect_cache[(width, height)] = rects
+        return rects
+
+    def scaled_rects(self, width, height, native_size):
+        """rects() of a `native_size` (w, h) window, scaled to a width x height copy of it."""
+        key = (width, height) + tuple(native_size)
+        rects = self.rect_cache.get(key)
+        if rects is None:
+            nw, nh = native_size
+            sx, sy = width / nw, height / nh
+            rects = {}
+            for name, (x, y, rw, rh) in self.rects(nw, nh).items():
+                x0, y0 = min(width, int(round(x * sx))), min(height, int(round(y * sy)))
+                rects[name] = (x0, y0, min(width - x0, int(round(rw * sx))), min(height - y0, int(round(rh * sy))))
+            self.rect_cache[key] = rects
+        return rects
+
+    def crop(self, image, store, native_size=None):
+        """
+        Copies every region out of a full-resolution BGRA or BGR image into `store`
+        (name -> BGR array), reusing the arrays already there when the size matches.
+        Args:
+            native_size (tuple): (w, h) of the window `image` was downscaled from, if it
+                                 was (a recording): rects follow that window's GUI scale.
+        Returns:
+            dict: `store`.
+        """
+        h, w = image.shape[:2]
+        bgra = image.shape[2] == 4
+        if native_size is not None and tuple(native_size) != (w, h):
+            rects = self.scaled_rects(w, h, native_size)
+        else:
+            rects = self.rects(w, h)
+            self.native_size = (w, h)
+        for name, (x, y, rw, rh) in rects.items():
+            buf = store.get(name)
+            if buf is None or buf.shape != (rh, rw, 3):
+                buf = store[name] = np.empty((rh, rw, 3), dtype=np.uint8)
+            if not rw or not rh:
+                continue
+            src = image[y:y + rh, x:x + rw]
+            if bgra:
+                cv2.cvtColor(src, cv2.COLOR_BGRA2BGR, dst=buf)
+            else:
+                np.copyto(buf, src)
+        return store
@@ -0,0 +1,27 @@
+import numpy as np
+from PIL import Image
+
+from src.utils.lazy import lazy_import
+
+cv2 = lazy_import("cv2")
+
+def frame_to_pil(frame):
+    """
+    Converts a captured BGR frame to the RGB PIL image the VLM expects, in memory.
+    Args:
+        frame: numpy.ndarray (H, W, 3) BGR or (H, W, 4) BGRA, or any buffer
+               exposing the array interface (e.g. a ScreenCapture ring slot).
+    Returns:
+        PIL.Image.Image: RGB image.
+    """
+    arr = np.asarray(frame)
+    if arr.dtype != np.uint8 or arr.ndim != 3 or arr.shape[2] not in (3, 4):
+        raise ValueError(f"Expected uint8 BGR/BGRA frame, got {arr.dtype} {arr.shape}")
+
+    # Single pass: channel swap + alpha drop into a fresh contiguous buffer
+    code = cv2.COLOR_BGRA2RGB if arr.shape[2] == 4 else cv2.COLOR_BGR2RGB
+    rgb = cv2.cvtColor(arr, code)
+
+    # frombuffer shares memory with `rgb` instead of copying it again
+    h, w = rgb.shape[:2]
+    return Image.frombuffer("RGB", (w, h), rgb, "raw", "RGB", 0, 1)
@@ -0,0 +1,170 @@
+import numpy as np
+
+class Detection:
+    """One detector firing on one frame."""
+    __slots__ = ("name", "reaction", "score", "seq", "t")
+
+    def __init__(self, name, reaction, score, seq=None, t=None):
+        self.name = name
+        self.reaction = reaction
+        self.score = score
+        self.seq = seq
+        self.t = t
+
+    def __repr__(self):
+        return f"Detection({self.name!r}, {self.reaction!r}, score={self.score:.2f}, seq={self.seq})"
+
+class Detector:
+    """
+    Cheap per-frame hazard check. detect() gets the BGR scene frame (a ring view: don't
+    keep it) and the HUD crops, and returns a score; >= threshold fires `reaction`.
+    Subclasses stay vectorized on a strided subsample so each runs in well under budget_ms.
+    """
+    name = "detector"
+    reaction = "stop"
+    threshold = 1.0
+    budget_ms = 1.0
+    cooldown = 0.5  # Seconds before the same detector may fire again
+
+    def score(self, frame, regions):
+        raise NotImplementedError
+
+    def detect(self, frame, regions):
+        score = self.score(frame, regions)
+        return Detection(self.name, self.reaction, score) if score >= self.threshold else None
+
+def _band(frame, top, bottom, left, right, step):
+    """Strided view (no copy) of a fractional band of the frame."""
+    h, w = frame.shape[:2]
+    return frame[int(top * h):int(bottom * h):step, int(left * w):int(right * w):step]
+
+def _channels(pixels):
+    """B, G, R as int16 arrays so differences can go negative."""
+    return pixels[..., 0].astype(np.int16), pixels[..., 1].astype(np.int16), pixels[..., 2].astype(np.int16)
+
+class ColorMaskDetector(Detector):
+    """Fraction of pixels inside a BGR box in a band of the frame (lava, fire)."""
+    band = (0.5, 1.0, 0.2, 0.8)  # top, bottom, left, right (fractions)
+    low = (0, 0, 0)
+    high = (255, 255, 255)
+    fraction = 0.05  # Share of the band that scores 1.0
+    step = 4
+
+    def score(self, frame, regions):
+        pixels = _band(frame, *self.band, self.step)
+        mask = np.ones(pixels.shape[:2], dtype=bool)
+        for c in range(3):
+            channel = pixels[..., c]
+            mask &= (channel >= self.low[c]) & (channel <= self.high[c])
+        return float(mask.mean()) / self.fraction if mask.size else 0.0
+
+class LavaDetector(ColorMaskDetector):
+    """Saturated orange in the lower-centre of the view (lava ahead or underfoot)."""
+    name = "lava"
+    reaction = "back_off"
+    band = (0.45, 1.0, 0.2, 0.8)
+    low = (0, 60, 190)
+    high = (80, 170, 255)
+    fraction = 0.04
+
+class FireDetector(ColorMaskDetector):
+    """Bright yellow-orange flames around the crosshair."""
+    name = "fire"
+    reaction = "back_off"
+    band = (0.3, 0.9, 0.3, 0.7)
+    low = (0, 170, 220)
+    high = (130, 240, 255)
+    fraction = 0.06
+
+class VoidDetector(Detector):
+    """
+    Cliff / void ahead from the lower frame's luminance profile: the ground ahead
+    normally fills the bottom of the view, so a large dark area there while the rest
+    of the view is lit, or a sharp bright-to-dark step going up the frame (an edge
+    with nothing beyond), means a drop. A uniformly dark view (a cave, night) isn't one.
+    """
+    name = "void"
+    reaction = "back_off"
+    band = (0.55, 1.0, 0.3, 0.7)
+    scene_band = (0.0, 0.55, 0.0, 1.0)  # Reference: the view above the ground band
+    step = 4
+    dark_level = 24
+    lit_level = 60  # The dark area only counts when the view above is at least this bright
+    dark_fraction = 0.5  # Score 1.0 when half the band is near-black
+    edge_drop = 90  # ...or when luminance falls this much between neighbouring row groups
+
+    def score(self, frame, regions):
+        b, g, r = _channels(_band(frame, *self.band, self.step))
+        luma = (b + 2 * g + r) >> 2
+        sb, sg, sr = _channels(_band(frame, *self.scene_band, self.step * 2))
+        scene = float(((sb + 2 * sg + sr) >> 2).mean()) if sb.size else 0.0
+        dark = (luma < self.dark_level).mean() / self.dark_fraction if scene >= self.lit_level else 0.0
+        profile = luma.mean(axis=1)  # Top to bottom
+        if len(profile) >= 4:
+            groups = profile[:len(profile) // 4 * 4].reshape(-1, 4).mean(axis=1)
+            drop = (groups[1:] - groups[:-1]).max(initial=0.0) / self.edge_drop  # Brighter below than above
+        else:
+            drop = 0.0
+        return float(max(dark, drop))
+
+class DamageFlashDetector(Detector):
+    """
+    The red hurt tint: redness (R minus the mean of G and B, relative to brightness so
+    a darker scene doesn't read as redder) over the whole frame jumping above its
+    running baseline. Only the onset of a short spike scores: a
+    redness rise that outlasts a hurt flash (a sunset, the Nether, red blocks filling
+    the view) becomes the new baseline instead of firing again and again.
+    """
+    name = "damage"
+    reaction = "jump"
+    step = 8
+    jump = 0.3  # Score 1.0 when redness rises this much (x brightness) above the baseline
+    alpha = 0.05  # Baseline EMA rate (on frames below the threshold)
+    max_flash = 20  # Frames above the threshold a hurt flash lasts at most
+
+    def __init__(self):
+        self.baseline = None
+        self.high = 0  # Consecutive frames above the threshold
+
+    def score(self, frame, regions):
+        b, g, r = _channels(frame[::self.step, ::self.step])
+        brightness = max(float((r + g + b).mean()) / 3.0, 16.0)
+        redness = float((r - ((g + b) >> 1)).mean()) / brightness
+        if self.baseline is None:
+            self.baseline = redness
+        score = (redness - self.baseline) / self.jump
+        if score < self.threshold:
+            self.high = 0
+            self.baseline += self.alpha * (redness - self.baseline)
+            return score
+        self.high += 1
+        if self.high > self.max_flash:  # Not a flash: the scene itself got redder
+            self.baseline = redness
+            self.high = 0
+        return score if self.high == 1 else 0.0
+
+class LowHealthDetector(Detector):
+    """
+    Hearts left, from the native-resolution 'health' HUD crop (see CapturePlan):
+    share of the bar's columns holding red heart pixels. Needs a capture plan; no
+    visible red at all (HUD hidden, or a screen without it) never fires.
+    """
+    name = "low_health"
+    reaction = "stop"
+    cooldown = 5.0
+    budget_ms = 0.5
+    low = 0.3  # Fires at or below 30% of the bar's columns (about a third of full health)
+
+    def score(self, frame, regions):
+        bar = regions.get("health") if regions else None
+        if bar is None or not bar.size:
+            return 0.0
+        b, g, r = _channels(bar)
+        red = (r > 150) & (g < 80) & (b < 80)
+        filled = red.any(axis=0).mean()
+        if not filled:
+            return 0.0
+        return float(self.low / filled)
+
+def default_detectors():
+    return [LavaDetector(), FireDetector(), VoidDetector(), DamageFlashDetector(), LowHealthDetector()]
@@ -0,0 +1,197 @@
+import threading
+import time
+
+import numpy as np
+
+from src.utils.tracing import tracer
+
+class FrameRing:
+    """
+    Fixed-size ring of preallocated frames. One writer (the capture thread) fills
+    the next slot in place and publishes it; any number of readers take the newest.
+    """
+    def __init__(self, shape, slots=4, dtype=np.uint8):
+        if slots < 2:
+            raise ValueError("FrameRing needs at least 2 slots (one being written, one readable)")
+        self.slots = slots
+        self.buffer = np.zeros((slots,) + tuple(shape), dtype=dtype)
+        self.seqs = [0] * slots
+        self.timestamps = [0.0] * slots
+        self.regions = [{} for _ in range(slots)]  # Per slot: HUD crops (name -> BGR array) of that frame
+        self.head = -1  # Index of the newest published slot
+        self.seq = 0    # Total frames published
+        self.cond = threading.Condition()
+
+    def next_slot(self):
+        """Writer only: the buffer that the next publish() will expose."""
+        return self.buffer[(self.head + 1) % self.slots]
+
+    def next_regions(self):
+        """Writer only: the crop store published together with next_slot()."""
+        return self.regions[(self.head + 1) % self.slots]
+
+    def publish(self, timestamp=None):
+        """Writer only: marks next_slot() as the newest frame."""
+        with self.cond:
+            self.head = (self.head + 1) % self.slots
+            self.seq += 1
+            self.seqs[self.head] = self.seq
+            self.timestamps[self.head] = time.monotonic() if timestamp is None else timestamp
+            self.cond.notify_all()
+
+    def latest(self, copy=True):
+        """
+        Returns the newest frame without waiting.
+        Args:
+            copy (bool): If False, returns a view into the ring. The view stays valid
+                         for roughly (slots - 1) capture periods before being overwritten.
+        Returns:
+            tuple: (seq, monotonic timestamp, frame) or None if nothing captured yet.
+        """
+        with self.cond:
+            if self.head < 0:
+                return None
+            frame = self.buffer[self.head]
+            return self.seqs[self.head], self.timestamps[self.head], (frame.copy() if copy else frame)
+
+    def latest_regions(self, names=None, copy=True):
+        """
+        HUD crops of the newest frame (same seq as latest()).
+        Args:
+            names (iterable): Regions wanted, e.g. ("health",). None = all.
+            copy (bool): Same meaning as in latest().
+        Returns:
+            tuple: (seq, monotonic timestamp, {name: crop}) or None if nothing captured yet.
+        """
+        with self.cond:
+            if self.head < 0:
+                return None
+            store = self.regions[self.head]
+            wanted = store.keys() if names is None else [n for n in names if n in store]
+            crops = {n: (store[n].copy() if copy else store[n]) for n in wanted}
+            return self.seqs[self.head], self.timestamps[self.head], crops
+
+    def wait_newer(self, after_seq, timeout=None, copy=True):
+        """Blocks until a frame newer than `after_seq` is published (or timeout). Same return as latest()."""
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.seq > after_seq, timeout):
+                return None
+        return self.latest(copy=copy)
+
+class CaptureThread:
+    """
+    Runs a CaptureSource on a dedicated thread at a fixed FPS, filling a FrameRing.
+    Consumers call latest() (and latest_regions() when the source has a CapturePlan)
+    and never pay grab latency themselves.
+    """
+    def __init__(self, source, fps=30, slots=4, recorder=None):
+        """
+        Args:
+            source (CaptureSource): Frame backend.
+            fps (int): Capture rate (0 = as fast as the source allows).
+            slots (int): Ring size.
+            recorder (Recorder): Optional session recorder that gets a copy of every frame.
+        """
+        self.source = source
+        self.recorder = recorder
+        self.fps = fps
+        self.ring = FrameRing(source.frame_shape, slots=slots)
+
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        # Stats
+        self.frames_captured = 0
+        self.grab_failures = 0
+        self.overruns = 0
+        self.grab_time_total = 0.0
+        self.started_at = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="CaptureThread", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+
+    def latest(self, copy=True):
+        return self.ring.latest(copy=copy)
+
+    def latest_regions(self, names=None, copy=True):
+        return self.ring.latest_regions(names, copy=copy)
+
+    def wait_for_frame(self, after_seq=0, timeout=None, copy=True):
+        return self.ring.wait_newer(after_seq, timeout=timeout, copy=copy)
+
+    def stats(self):
+        elapsed = (time.monotonic() - self.started_at) if self.started_at else 0.0
+        return {
+            "frames": self.frames_captured,
+            "failures": self.grab_failures,
+            "overruns": self.overruns,
+            "fps": self.frames_captured / elapsed if elapsed > 0 else 0.0,
+            "avg_grab_ms": 1000.0 * self.grab_time_total / max(1, self.frames_captured),
+        }
+
+    def _run(self):
+        try:
+            self.source.open()
+        except Exception as e:
+            print(f"Capture: Failed to open source {type(self.source).__name__}: {e}")
+            return
+
+        period = 1.0 / self.fps if self.fps else 0.0
+        plan = getattr(self.source, "plan", None)
+        with_regions = plan is not None
+        recorded_native = None  # Window size last written to the recording's meta
+        self.started_at = time.monotonic()
+        next_tick = self.started_at
+        reported_error = False
+
+        try:
+            while not self.stop_event.is_set():
+                t0 = time.monotonic()
+                try:
+                    # Single writer: the frame being grabbed gets the next sequence number
+                    frame_id = self.ring.seq + 1
+                    with tracer.context(frame=frame_id), tracer.span("capture", "capture"):
+                        if with_regions:
+                            ok = self.source.grab(self.ring.next_slot(), self.ring.next_regions())
+                        else:
+                            ok = self.source.grab(self.ring.next_slot())
+                except Exception as e:
+                    ok = False
+                    if not reported_error:
+                        print(f"Capture Error: {e}")
+                        reported_error = True
+
+                if ok:
+                    self.ring.publish(t0)
+                    if self.recorder is not None:
+                        self.recorder.add_frame(self.ring.buffer[self.ring.head], t0, self.ring.seq)
+                        if with_regions and plan.native_size not in (None, recorded_native):
+                            # Replays need it to put HUD crops where this window's GUI scale had them
+                            recorded_native = plan.native_size
+                            self.recorder.update_meta(native_size=list(recorded_native))
+                    self.frames_captured += 1
+                    self.grab_time_total += time.monotonic() - t0
+                else:
+                    self.grab_failures += 1
+
+                # Pace against absolute deadlines so the rate doesn't drift
+                next_tick += period
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    self.stop_event.wait(delay)
+                else:
+                    if period:
+                        self.overruns += 1
+                    next_tick = time.monotonic()
+        finally:
+            self.source.close()
@@ -0,0 +1,234 @@
+import bisect
+import threading
+import time
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.utils.lazy import lazy_import
+
+cv2 = lazy_import("cv2")
+
+class MotionSample:
+    """Camera motion between two consecutive frames, in thumbnail pixels / grey levels."""
+    __slots__ = ("seq", "t", "dx", "dy", "residual")
+
+    def __init__(self, seq, t, dx, dy, residual):
+        self.seq = seq
+        self.t = t
+        self.dx = dx  # + = view panned right (content moved left)
+        self.dy = dy  # + = view tilted down (content moved up)
+        self.residual = residual  # Mean abs difference left after aligning the shift
+
+    def __repr__(self):
+        return f"MotionSample(seq={self.seq}, dx={self.dx:+.2f}, dy={self.dy:+.2f}, residual={self.residual:.2f})"
+
+def _shift(prev, cur, k, axis):
+    """
+    Offset along `axis` (within +-k) that best aligns `prev` to `cur`, by mean absolute
+    difference over every candidate at once, refined to sub-pixel with a parabola fit.
+    """
+    n = cur.shape[axis]
+    core = cur[k:n - k] if axis == 0 else cur[:, k:n - k]
+    windows = sliding_window_view(prev, n - 2 * k, axis=axis)  # (.., 2k+1, ..) candidates
+    if axis == 0:
+        sad = np.abs(windows - core.T[None]).mean(axis=(1, 2))
+    else:
+        sad = np.abs(windows - core[:, None]).mean(axis=(0, 2))
+    j = int(sad.argmin())
+    offset = float(j - k)
+    if 0 < j < 2 * k:
+        curve = sad[j - 1] - 2 * sad[j] + sad[j + 1]
+        if curve > 0:
+            offset += 0.5 * (sad[j - 1] - sad[j + 1]) / curve
+    return offset
+
+def _aligned(prev, dx, dy, k):
+    """`prev` shifted by a sub-pixel (dx, dy), bilinear, cropped to the k-pixel inner core."""
+    h, w = prev.shape
+    ix, iy = int(np.floor(dx)), int(np.floor(dy))
+    fx, fy = dx - ix, dy - iy
+    if ix == k:  # A shift of exactly +k: its right neighbour is out of range
+        ix, fx = k - 1, 1.0
+    if iy == k:
+        iy, fy = k - 1, 1.0
+
+    def part(oy, ox):
+        return prev[k + iy + oy:h - k + iy + oy, k + ix + ox:w - k + ix + ox]
+    return ((1 - fy) * ((1 - fx) * part(0, 0) + fx * part(0, 1))
+            + fy * ((1 - fx) * part(1, 0) + fx * part(1, 1)))
+
+class MotionEstimator:
+    """
+    Global frame-to-frame motion from area-averaged grayscale thumbnails: the horizontal
+    and vertical shift that best aligns the previous thumbnail with the current one
+    (a pan: turning or looking), and the difference left after that alignment (the view
+    changing in place: walking, a block breaking, a mob moving).
+
+    Summed over the time an action ran, outcome() tells whether it did anything, e.g.
+    walking into a wall leaves the view still, so the brain hears "stuck" instead of
+    deciding to walk forward again.
+    """
+    def __init__(self, size=(80, 45), max_shift=6, history=900, still_level=1.0, turn_min=0.05):
+        """
+        Args:
+            size (tuple): Thumbnail (w, h). Area averaging also washes out pixel noise.
+            max_shift (int): Largest per-frame shift searched, in thumbnail pixels.
+            history (int): Samples kept for outcome() (30 s at 30 fps).
+            still_level (float): Mean residual (grey levels) below which the view is still.
+            turn_min (float): Net pan, in view widths, that counts as having turned.
+        """
+        self.size = size
+        self.max_shift = max_shift
+        self.still_level = still_level
+        self.turn_min = turn_min
+
+        self.samples = deque(maxlen=history)
+        self.times = deque(maxlen=history)  # Sample timestamps, for bisecting windows
+        self.lock = threading.Lock()
+        self.prev = None
+        self.small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self.gray = np.empty((size[1], size[0]), dtype=np.uint8)
+
+    def update(self, frame, seq=None, t=None):
+        """
+        Adds a BGR frame (may be a ring view: it isn't kept).
+        Returns:
+            MotionSample relative to the previous frame, or None for the first one.
+        """
+        t = time.monotonic() if t is None else t
+        cv2.resize(frame, self.size, dst=self.small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self.small, cv2.COLOR_BGR2GRAY, dst=self.gray)
+        cur = self.gray.astype(np.int16)
+        prev, self.prev = self.prev, cur
+        if prev is None:
+            return None
+
+        k = self.max_shift
+        dx = _shift(prev, cur, k, axis=1)
+        dy = _shift(prev, cur, k, axis=0)
+        residual = float(np.abs(_aligned(prev, dx, dy, k) - cur[k:-k, k:-k]).mean())
+
+        sample = MotionSample(seq, t, dx, dy, residual)
+        with self.lock:
+            self.samples.append(sample)
+            self.times.append(t)
+        return sample
+
+    def window(self, t0, t1=None):
+        """Samples with t0 <= t <= t1 (default: up to now), oldest first."""
+        with self.lock:
+            times = list(self.times)
+            start = bisect.bisect_left(times, t0)
+            end = len(times) if t1 is None else bisect.bisect_right(times, t1)
+            return list(self.samples)[start:end]
+
+    def summary(self, t0, t1=None):
+        """Net pan (view widths / heights) and mean residual over a time window."""
+        samples = self.window(t0, t1)
+        if not samples:
+            return {"frames": 0, "pan_x": 0.0, "pan_y": 0.0, "change": 0.0}
+        return {
+            "frames": len(samples),
+            "pan_x": sum(s.dx for s in samples) / self.size[0],
+            "pan_y": sum(s.dy for s in samples) / self.size[1],
+            "change": sum(s.residual for s in samples) / len(samples),
+        }
+
+    def outcome(self, t0, t1=None, intent=()):
+        """
+        What the view did while an action ran, phrased for the episode log.
+        Args:
+            t0, t1 (float): Monotonic window the action ran in (t1 None = up to now).
+            intent (iterable): What was attempted: 'move' and/or 'turn' (anything else
+                               just describes the view).
+        Returns:
+            str: e.g. "moved", "turned left", "stuck (walked but the view didn't change)",
+                 or None if no frames were seen in the window.
+        """
+        summary = self.summary(t0, t1)
+        if not summary["frames"]:
+            return None
+        pan_x, pan_y = summary["pan_x"], summary["pan_y"]
+        turned = abs(pan_x) >= self.turn_min or abs(pan_y) >= self.turn_min
+        changed = summary["change"] >= self.still_level
+
+        parts = []
+        if "turn" in intent:
+            if turned:
+                parts.append(self._pan_phrase(pan_x, pan_y))
+            else:
+                parts.append("turn had no effect")
+        if "move" in intent:
+            if changed:
+                parts.append("moved")
+            elif not turned:
+                parts.append("stuck (walked but the view didn't change)")
+            else:
+                parts.append("only the view turned (blocked?)")
+        if not parts:
+            if turned:
+                parts.append(f"view {self._pan_phrase(pan_x, pan_y)}")
+            parts.append("view changed" if changed else "no change")
+        return ", ".join(parts)
+
+    @staticmethod
+    def _pan_phrase(pan_x, pan_y):
+        if abs(pan_x) >= abs(pan_y):
+            return f"turned {'right' if pan_x > 0 else 'left'}"
+        return f"looked {'down' if pan_y > 0 else 'up'}"
+
+class MotionMonitor:
+    """Runs a MotionEstimator on every frame of a CaptureThread, in its own thread."""
+    def __init__(self, capture, estimator=None):
+        """
+        Args:
+            capture (CaptureThread): Frame source.
+            estimator (MotionEstimator): Defaults to MotionEstimator().
+        """
+        self.capture = capture
+        self.estimator = estimator if estimator is not None else MotionEstimator()
+        self.frames = 0
+        self.frame_times = deque(maxlen=1000)  # ms per update()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="MotionMonitor", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+
+    def outcome(self, t0, t1=None, intent=()):
+        return self.estimator.outcome(t0, t1, intent)
+
+    def stats(self):
+        times = self.frame_times
+        return {
+            "frames": self.frames,
+            "update_ms_p50": float(np.percentile(times, 50)) if times else 0.0,
+            "update_ms_p95": float(np.percentile(times, 95)) if times else 0.0,
+        }
+
+    def _run(self):
+        seq = 0
+        while not self.stop_event.is_set():
+            latest = self.capture.wait_for_frame(seq, timeout=0.1, copy=False)
+            if latest is None:
+                continue
+            seq, t, frame = latest
+            start = time.perf_counter()
+            try:
+                self.estimator.update(frame, seq, t)
+            except Exception as e:
+                print(f"Motion: Estimator error: {e}")
+            self.frames += 1
+            self.frame_times.append((time.perf_counter() - start) * 1000.0)
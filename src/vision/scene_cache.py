@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from src.utils.lazy import lazy_import
+
+cv2 = lazy_import("cv2")
+
+class FrameSignature:
+    """
+    Cheap perceptual fingerprint of a frame: a 64-bit difference hash plus a tiny
+    grayscale thumbnail for a finer change score. Costs one INTER_AREA resize.
+    """
+    __slots__ = ("dhash", "thumb")
+
+    def __init__(self, dhash, thumb):
+        self.dhash = dhash
+        self.thumb = thumb
+
+    def hamming(self, other):
+        return (self.dhash ^ other.dhash).bit_count()
+
+    def change(self, other, cell_tolerance=10.0):
+        """
+        Fraction of thumbnail cells whose brightness moved by more than `cell_tolerance`
+        gray levels. 0 means identical; sensor/compression noise stays near 0 while a
+        moving object registers as the share of the view it covers.
+        """
+        return float(np.count_nonzero(np.abs(self.thumb - other.thumb) > cell_tolerance)) / self.thumb.size
+
+def frame_signature(frame, thumb_size=(32, 18)):
+    """
+    Computes a FrameSignature for a BGR frame.
+    Args:
+        frame (numpy.ndarray): BGR image of any size.
+        thumb_size (tuple): (width, height) of the comparison thumbnail.
+    """
+    # Shrink first, then gray: never touch the full frame more than once
+    small = cv2.resize(frame, thumb_size, interpolation=cv2.INTER_AREA)
+    thumb = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype(np.float32)
+
+    # dHash: 9x8 gradient signs -> 64 bits. The margin keeps flat areas (sky) from flipping on noise
+    grid = cv2.resize(thumb, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = np.packbits((grid[:, 1:] - grid[:, :-1]) > 2.0)
+    return FrameSignature(int.from_bytes(bits.tobytes(), "big"), thumb)
+
+class SceneCache:
+    """
+    Bounded LRU cache of brain responses keyed on (frame similarity, context key).
+    A lookup hits when the key matches exactly and the frame is within both the
+    hash and thumbnail thresholds of a stored entry. With `max_reuse`, an entry
+    that has served that many hits in a row is expired, so the caller thinks afresh.
+    """
+    def __init__(self, capacity=64, max_hamming=4, max_change=0.02, max_reuse=None):
+        self.capacity = capacity
+        self.max_hamming = max_hamming
+        self.max_change = max_change
+        self.max_reuse = max_reuse
+
+        self.entries = OrderedDict()  # id -> (key, signature, value)
+        self.reuses = {}  # id -> hits served since it was stored
+        self.next_id = 0
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def lookup(self, signature, key=""):
+        """Returns the cached value for a near-identical scene under the same key, or None."""
+        with self.lock:
+            best_id, best_change = None, None
+            for entry_id, (entry_key, sig, _) in self.entries.items():
+                if entry_key != key or signature.hamming(sig) > self.max_hamming:
+                    continue
+                change = signature.change(sig)
+                if change <= self.max_change and (best_change is None or change < best_change):
+                    best_id, best_change = entry_id, change
+
+            if best_id is not None and self.max_reuse is not None and self.reuses[best_id] >= self.max_reuse:
+                del self.entries[best_id]
+                del self.reuses[best_id]
+                self.expired += 1
+                best_id = None
+
+            if best_id is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.reuses[best_id] += 1
+            self.entries.move_to_end(best_id)
+            return self.entries[best_id][2]
+
+    def store(self, signature, key, value):
+        with self.lock:
+            self.entries[self.next_id] = (key, signature, value)
+            self.reuses[self.next_id] = 0
+            self.next_id += 1
+            while len(self.entries) > self.capacity:
+                entry_id, _ = self.entries.popitem(last=False)
+                del self.reuses[entry_id]
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.reuses.clear()
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "size": len(self.entries),
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
@@ -0,0 +1,291 @@
+import glob
+import os
+import time
+
+import numpy as np
+
+from src.utils.lazy import lazy_import
+from src.utils.recording import Recording
+from src.vision.capture import ScreenCapture
+from src.vision.window_tracker import WindowTracker
+
+cv2 = lazy_import("cv2")
+
+class CaptureSource:
+    """
+    Interface for anything that can produce BGR frames for the pipeline.
+    Backends write straight into a caller-owned buffer so the capture thread
+    can fill preallocated ring slots. With a CapturePlan they also fill sharp HUD
+    crops from the same grab (at the source's native resolution).
+    """
+    def __init__(self, target_size=(640, 360), plan=None):
+        self.target_size = target_size
+        self.plan = plan
+        self.native_size = None  # (w, h) of the window stored frames were downscaled from, for crops
+
+    @property
+    def frame_shape(self):
+        w, h = self.target_size
+        return (h, w, 3)
+
+    def open(self):
+        """Acquire OS resources. Called from the thread that will call grab()."""
+        pass
+
+    def grab(self, out, regions=None):
+        """
+        Captures one frame into `out`.
+        Args:
+            out (numpy.ndarray): Preallocated uint8 buffer of shape `frame_shape`.
+            regions (dict): With a plan, name -> BGR crop store to fill from the same grab.
+        Returns:
+            bool: True if `out` now holds a new frame.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def _store(self, frame, out, regions=None):
+        """Copies (resizing only if needed) a BGR frame into `out`, cropping the plan's regions first."""
+        if self.plan is not None and regions is not None:
+            self.plan.crop(frame, regions, self.native_size)
+        if frame.shape[:2] == out.shape[:2]:
+            np.copyto(out, frame[:, :, :3])
+        else:
+            cv2.resize(frame[:, :, :3], self.target_size, dst=out, interpolation=cv2.INTER_AREA)
+        return True
+
+class MssSource(CaptureSource):
+    """
+    Screen region capture via mss (Linux / Windows / macOS).
+    With a WindowTracker the region follows the window when it moves.
+    """
+    def __init__(self, region=None, target_size=(640, 360), monitor=1, tracker=None, plan=None):
+        super().__init__(target_size, plan)
+        self.region = region
+        self.monitor = monitor
+        self.tracker = tracker
+        self.cap = None
+
+    def open(self):
+        # mss handles are bound to the thread that created them
+        self.cap = ScreenCapture()
+        if self.region is None:
+            self.region = self.cap.sct.monitors[self.monitor]
+
+    def grab(self, out, regions=None):
+        region = self.region
+        if self.tracker:
+            region = self.tracker.get()
+            if not region:
+                return False
+        self.cap.capture_region(region, target_size=self.target_size, out=out, plan=self.plan, regions=regions)
+        return True
+
+    def close(self):
+        if self.cap:
+            self.cap.close()
+            self.cap = None
+
+class QuartzSource(CaptureSource):
+    """Occlusion-proof window capture via macOS Quartz. Window resolved through a WindowTracker."""
+    def __init__(self, window_id=None, title="Minecraft", target_size=(640, 360), tracker=None, plan=None):
+        super().__init__(target_size, plan)
+        self.window_id = window_id
+        self.title = title
+        self.tracker = tracker
+        self.cap = None
+
+    def open(self):
+        self.cap = ScreenCapture()
+        if self.window_id is None and self.tracker is None:
+            self.tracker = WindowTracker(self.title)
+
+    def grab(self, out, regions=None):
+        window_id = self.window_id
+        if window_id is None:
+            info = self.tracker.get()
+            if not info:
+                return False
+            window_id = info['window_id']
+
+        frame = self.cap.capture_window_exclusive(window_id, target_size=self.target_size, out=out,
+                                                  plan=self.plan, regions=regions)
+        if frame is None:
+            # Window closed, minimised or id went stale: revalidate on the next grab
+            if self.tracker:
+                self.tracker.invalidate()
+            return False
+        return True
+
+    def close(self):
+        if self.cap:
+            self.cap.close()
+            self.cap = None
+
+class SyntheticSource(CaptureSource):
+    """
+    Deterministic generated scene (sky, ground, drifting block) for headless runs and benchmarks.
+    """
+    def __init__(self, target_size=(640, 360), speed=4, noise=0, seed=0, plan=None):
+        super().__init__(target_size, plan)
+        self.speed = speed
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self.index = 0
+
+        h, w, _ = self.frame_shape
+        self.base = np.empty((h, w, 3), dtype=np.uint8)
+        self.base[: h // 2] = [235, 206, 135]  # Sky (BGR)
+        self.base[h // 2:] = [34, 139, 34]     # Ground (BGR)
+        self.block = (w // 8, h // 4)
+
+    def grab(self, out, regions=None):
+        h, w, _ = out.shape
+        np.copyto(out, self.base)
+
+        bw, bh = self.block
+        x = (self.index * self.speed) % max(1, w - bw)
+        y = h // 2 - bh // 2
+        out[y:y + bh, x:x + bw] = (128, 128, 128)  # Stone wall
+
+        if self.noise:
+            noise = self.rng.integers(0, self.noise, size=out.shape, dtype=np.uint8)
+            cv2.add(out, noise, dst=out)
+
+        self.index += 1
+        if self.plan is not None and regions is not None:
+            self.plan.crop(out, regions)
+        return True
+
+class ReplaySource(CaptureSource):
+    """
+    Replays a video file, an image-sequence pattern ("run/%05d.png"), or a directory of images.
+    If the footage was downscaled from the game window, pass the window's `native_size`
+    (w, h) so a plan's HUD crops land where that window's GUI scale put the HUD.
+    """
+    IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, path, target_size=(640, 360), loop=True, plan=None, native_size=None):
+        super().__init__(target_size, plan)
+        self.native_size = native_size
+        self.path = path
+        self.loop = loop
+        self.video = None
+        self.files = None
+        self.index = 0
+
+    def open(self):
+        if os.path.isdir(self.path):
+            self.files = sorted(
+                f for f in glob.glob(os.path.join(self.path, "*"))
+                if f.lower().endswith(self.IMAGE_EXTS)
+            )
+            if not self.files:
+                raise FileNotFoundError(f"No images found in {self.path}")
+        else:
+            self.video = cv2.VideoCapture(self.path)
+            if not self.video.isOpened():
+                raise FileNotFoundError(f"Cannot open replay source {self.path}")
+
+    def grab(self, out, regions=None):
+        frame = self._next_frame()
+        if frame is None:
+            return False
+        return self._store(frame, out, regions)
+
+    def _next_frame(self):
+        if self.files is not None:
+            if self.index >= len(self.files):
+                if not self.loop:
+                    return None
+                self.index = 0
+            frame = cv2.imread(self.files[self.index], cv2.IMREAD_COLOR)
+            self.index += 1
+            return frame
+
+        ok, frame = self.video.read()
+        if not ok and self.loop:
+            self.video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.video.read()
+        return frame if ok else None
+
+    def close(self):
+        if self.video is not None:
+            self.video.release()
+            self.video = None
+
+class RecordingSource(CaptureSource):
+    """
+    Replays a Recorder session (see src/utils/recording.py).
+    speed=1.0 follows the recorded timestamps (2.0 = twice as fast); speed=0 serves
+    every frame in order, as fast as grab() is called, for offline sweeps.
+    A plan's HUD crops follow the recorded window size (meta 'native_size'), not the
+    stored frames' size.
+    """
+    def __init__(self, path, target_size=None, speed=1.0, loop=False, plan=None):
+        self.path = path
+        self.recording = Recording(path)
+        h, w, _ = self.recording.frame_shape
+        super().__init__(target_size or (w, h), plan)
+        native = self.recording.meta.get("native_size")
+        self.native_size = tuple(native) if native else None
+        self.speed = speed
+        self.loop = loop
+        self.index = 0
+        self.started = None
+
+    def open(self):
+        if self.recording is None:
+            self.recording = Recording(self.path)
+        self.index = 0
+        self.started = time.monotonic()
+
+    def grab(self, out, regions=None):
+        frame = self.next_frame()
+        if frame is None:
+            return False
+        return self._store(frame, out, regions)
+
+    def next_frame(self):
+        """The frame due now as a read-only view (no copy), or None once the recording ended."""
+        n = len(self.recording)
+        if not n:
+            return None
+        if self.speed:
+            elapsed = (time.monotonic() - self.started) * self.speed
+            if self.loop and self.recording.duration:
+                elapsed %= self.recording.duration
+            elif elapsed > self.recording.duration and self.index >= n:
+                return None
+            i = self.recording.index_at(elapsed)
+            self.index = i + 1
+        else:
+            if self.index >= n:
+                if not self.loop:
+                    return None
+                self.index = 0
+            i = self.index
+            self.index += 1
+        return self.recording.frame(i)
+
+    def close(self):
+        if self.recording is not None:
+            self.recording.close()
+            self.recording = None
+
+def make_source(kind, **kwargs):
+    """
+    Builds a capture backend by name: 'mss', 'quartz', 'synthetic', 'replay' or 'recording'.
+    """
+    backends = {
+        "mss": MssSource,
+        "quartz": QuartzSource,
+        "synthetic": SyntheticSource,
+        "replay": ReplaySource,
+        "recording": RecordingSource,
+    }
+    if kind not in backends:
+        raise ValueError(f"Unknown capture source '{kind}'. Options: {sorted(backends)}")
+    return backends[kind](**kwargs)
@@ -12,67 +12,92 @@ def get_screen_scale():
         return screen.backingScaleFactor()
     return 1.0
 
-def get_minecraft_window(target_title="Minecraft", ignore_titles=None):
+def _window_info(window, scale_factor):
+    """Converts a Quartz window dict into our capture dict (pixels, not points)."""
+    bounds = window.get('kCGWindowBounds')
+    if not bounds:
+        return None
+    # Apply Retina scaling
+    # Quartz returns 'points', mss expects 'pixels'
+    return {
+        'top': int(bounds['Y'] * scale_factor),
+        'left': int(bounds['X'] * scale_factor),
+        'width': int(bounds['Width'] * scale_factor),
+        'height': int(bounds['Height'] * scale_factor),
+        'pid': int(window.get('kCGWindowOwnerPID')),
+        'window_id': int(window.get('kCGWindowNumber')),
+        'scale': scale_factor
+    }
+
+def get_minecraft_window(target_title="Minecraft", ignore_titles=None, verbose=False, scale_factor=None):
     """
     Finds a window with the given title (partial match) using Quartz.
+    This is a full scan of every on-screen window; prefer WindowTracker for repeated lookups.
     Args:
         target_title (str): The window title to search for. Default "Minecraft".
         ignore_titles (list): List of strings to exclude (case-insensitive).
+        verbose (bool): Print the search and, on failure, every window seen.
+        scale_factor (float): Backing scale; queried from the main screen if None.
     Returns:
-        dict: {'x': int, 'y': int, 'width': int, 'height': int, 'pid': int} or None
+        dict: {'top', 'left', 'width', 'height', 'pid', 'window_id', 'scale'} or None
     """
-    if ignore_titles is None:
-        ignore_titles = []
+    target = target_title.lower()
+    ignored = [i.lower() for i in (ignore_titles or [])]
 
     # Get scaling factor (Retina Display handling)
-    scale_factor = get_screen_scale()
+    if scale_factor is None:
+        scale_factor = get_screen_scale()
     
     # Get all on-screen windows
     options = Quartz.kCGWindowListOptionOnScreenOnly
     window_list = Quartz.CGWindowListCopyWindowInfo(options, Quartz.kCGNullWindowID)
 
-    print(f"Debug: Searching for window containing '{target_title}'...")
+    if verbose:
+        print(f"Debug: Searching for window containing '{target_title}'...")
 
     for window in window_list:
-        title = window.get('kCGWindowName', '')
-        owner = window.get('kCGWindowOwnerName', '')
-        pid = window.get('kCGWindowOwnerPID')
-        window_id = window.get('kCGWindowNumber')
-        
-        full_title = str(title).lower()
-        full_owner = str(owner).lower()
-        target = target_title.lower()
+        full_title = str(window.get('kCGWindowName', '')).lower()
+        full_owner = str(window.get('kCGWindowOwnerName', '')).lower()
+
+        # Check if target is in title or owner (case-insensitive for better UX)
+        if target not in full_title and target not in full_owner:
+            continue
 
         # Skip if matches ignore list
-        if any(ignored.lower() in full_title for ignored in ignore_titles) or \
-           any(ignored.lower() in full_owner for ignored in ignore_titles):
+        if any(i in full_title or i in full_owner for i in ignored):
             continue
 
-        # Check if target is in title or owner (case-insensitive for better UX)
-        if target in full_title or target in full_owner:
-            bounds = window.get('kCGWindowBounds')
-            if bounds:
-                # Apply Retina scaling
-                # Quartz returns 'points', mss expects 'pixels'
-                return {
-                    'top': int(bounds['Y'] * scale_factor),
-                    'left': int(bounds['X'] * scale_factor),
-                    'width': int(bounds['Width'] * scale_factor),
-                    'height': int(bounds['Height'] * scale_factor),
-                    'pid': int(pid),
-                    'window_id': int(window_id)
-                }
+        info = _window_info(window, scale_factor)
+        if info:
+            return info
     
     # If not found during loop, print what we saw to debug
-    print("Debug: List of windows found:")
-    for window in window_list:
-        title = window.get('kCGWindowName', '')
-        owner = window.get('kCGWindowOwnerName', '')
-        if title:
-            print(f" - Title: '{title}', Owner: '{owner}'")
+    if verbose:
+        print("Debug: List of windows found:")
+        for window in window_list:
+            title = window.get('kCGWindowName', '')
+            owner = window.get('kCGWindowOwnerName', '')
+            if title:
+                print(f" - Title: '{title}', Owner: '{owner}'")
     
     return None
 
+def get_window_by_id(window_id, scale_factor=None):
+    """
+    Cheap revalidation: asks Quartz about a single window instead of listing all of them.
+    Returns:
+        dict: Same format as get_minecraft_window, or None if the window is gone.
+    """
+    if scale_factor is None:
+        scale_factor = get_screen_scale()
+    window_list = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionIncludingWindow, window_id
+    )
+    for window in window_list or []:
+        if int(window.get('kCGWindowNumber', -1)) == window_id:
+            return _window_info(window, scale_factor)
+    return None
+
 def activate_window(pid):
     """
     Brings the application with the given PID to the foreground.
@@ -84,7 +109,7 @@ def activate_window(pid):
     return False
 
 if __name__ == "__main__":
-    win = get_minecraft_window()
+    win = get_minecraft_window(verbose=True)
     if win:
         print(f"Found Minecraft window: {win}")
     else:
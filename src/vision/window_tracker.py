@@ -0,0 +1,144 @@
+import sys
+import threading
+import time
+
+class WindowProvider:
+    """
+    Platform hook for WindowTracker.
+    find() is the expensive full scan; lookup() revalidates one known window.
+    Both return {'top', 'left', 'width', 'height', 'pid', 'window_id', 'scale'} or None.
+    """
+    def find(self, title, ignore_titles=None):
+        raise NotImplementedError
+
+    def lookup(self, window_id):
+        raise NotImplementedError
+
+class QuartzWindowProvider(WindowProvider):
+    """macOS provider backed by CGWindowListCopyWindowInfo."""
+    def __init__(self):
+        # Imported here so the tracker itself works on any platform
+        from src.vision import window_mgr
+        self.window_mgr = window_mgr
+        self.scale = window_mgr.get_screen_scale()
+
+    def find(self, title, ignore_titles=None):
+        return self.window_mgr.get_minecraft_window(title, ignore_titles, scale_factor=self.scale)
+
+    def lookup(self, window_id):
+        return self.window_mgr.get_window_by_id(window_id, scale_factor=self.scale)
+
+class FakeWindowProvider(WindowProvider):
+    """
+    In-memory window list for tests and headless runs. Counts calls so tests can
+    assert how often the expensive path ran.
+    """
+    def __init__(self, windows=None):
+        self.windows = {}  # window_id -> info (plus 'title')
+        self.find_calls = 0
+        self.lookup_calls = 0
+        for w in windows or []:
+            self.add(**w)
+
+    def add(self, title, window_id, top=0, left=0, width=854, height=480, pid=0, scale=1.0):
+        self.windows[window_id] = {
+            'title': title, 'top': top, 'left': left, 'width': width, 'height': height,
+            'pid': pid, 'window_id': window_id, 'scale': scale
+        }
+
+    def move(self, window_id, top, left):
+        self.windows[window_id].update(top=top, left=left)
+
+    def close(self, window_id):
+        self.windows.pop(window_id, None)
+
+    def find(self, title, ignore_titles=None):
+        self.find_calls += 1
+        target = title.lower()
+        ignored = [i.lower() for i in (ignore_titles or [])]
+        for info in self.windows.values():
+            name = info['title'].lower()
+            if target in name and not any(i in name for i in ignored):
+                return self._public(info)
+        return None
+
+    def lookup(self, window_id):
+        self.lookup_calls += 1
+        info = self.windows.get(window_id)
+        return self._public(info) if info else None
+
+    def _public(self, info):
+        return {k: v for k, v in info.items() if k != 'title'}
+
+def default_provider():
+    """Best provider for this platform, or None if window lookup isn't supported here."""
+    if sys.platform == "darwin":
+        return QuartzWindowProvider()
+    return None
+
+class WindowTracker:
+    """
+    Caches the resolved game window (id, bounds, scale).
+    - Within `ttl` seconds, get() returns the cached info with no OS calls.
+    - After the TTL, or after invalidate() (e.g. a failed capture), the known id is
+      revalidated with a cheap single-window lookup, which also picks up moves/resizes.
+    - Only when the window is gone does it fall back to a full rescan, at most once
+      per `rescan_interval` so a missing window doesn't hammer the window server.
+    """
+    def __init__(self, title="Minecraft", ignore_titles=None, provider=None, ttl=1.0, rescan_interval=2.0):
+        self.title = title
+        self.ignore_titles = ignore_titles or []
+        self.provider = provider or default_provider()
+        if self.provider is None:
+            raise RuntimeError(f"No window provider for platform '{sys.platform}'")
+        self.ttl = ttl
+        self.rescan_interval = rescan_interval
+
+        self.info = None
+        self.checked_at = 0.0
+        self.last_rescan = None
+        self.lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.revalidations = 0
+        self.rescans = 0
+
+    def get(self):
+        """Returns the current window info dict, or None if the window can't be found."""
+        with self.lock:
+            now = time.monotonic()
+            if self.info is not None:
+                if now - self.checked_at < self.ttl:
+                    self.hits += 1
+                    return self.info
+
+                self.revalidations += 1
+                info = self.provider.lookup(self.info['window_id'])
+                if info is not None:
+                    self.info, self.checked_at = info, now
+                    return info
+                self.info = None  # Window is gone
+
+            if self.last_rescan is not None and now - self.last_rescan < self.rescan_interval:
+                return None
+
+            self.rescans += 1
+            self.last_rescan = now
+            self.info = self.provider.find(self.title, self.ignore_titles)
+            self.checked_at = now
+            return self.info
+
+    def invalidate(self):
+        """Forces revalidation on the next get(), e.g. after a capture failed."""
+        with self.lock:
+            self.checked_at = 0.0
+
+    def forget(self):
+        """Drops the cached window entirely so the next get() rescans immediately."""
+        with self.lock:
+            self.info = None
+            self.last_rescan = None
+
+    def stats(self):
+        return {"hits": self.hits, "revalidations": self.revalidations, "rescans": self.rescans}